@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the batched InspectSHM decoder (SHMFormatPlan) for 10, 100, 1000 and 10000 configured values,
+compared with decoding every value with its own struct call.
+"""
+
+import os
+import random
+import struct
+import time
+
+from src.SHMFormat import SHMFormatPlan
+
+ROWS = [10, 100, 1000, 10000]
+SHM_SIZE = 2 ** 16 * 2
+TYPES = ["u16b", "u16l", "i16b", "u32b", "u32lr", "i32br", "f32b", "f32lr", "f64b", "f64lr", "u8", "b"]
+REPEAT = 50
+
+
+def cfg_lines(rows: int) -> list[str]:
+    rng = random.Random(rows)
+    lines = []
+    for i in range(rows):
+        data_type = rng.choice(TYPES)
+        addr = rng.randrange(0, SHM_SIZE - 8, 2)
+        if data_type == "b":
+            lines.append(f"{addr}:{rng.randrange(8)},b,bool_X_{i}")
+        else:
+            lines.append(f"{addr},{data_type},value_{i}")
+    return lines
+
+
+def per_value_decoder(plan: SHMFormatPlan, shm_name: str):
+    # one struct call per value (reference), with the same word swap and bit extraction as the batched decoder
+    unpackers = []
+    for field in plan.fields[shm_name]:
+        if field.kind == "bool":
+            unpackers.append((struct.Struct('B'), field.offset, False, field.bit))
+        else:
+            unpackers.append((struct.Struct(field.byte_order() + field.code), field.offset, field.reverse, None))
+
+    def decode(data: bytes) -> list:
+        values = []
+        for s, offset, reverse, bit in unpackers:
+            if reverse:
+                raw = data[offset:offset + s.size]
+                value = s.unpack(b"".join(raw[i:i + 2] for i in range(s.size - 2, -1, -2)))[0]
+            else:
+                value = s.unpack_from(data, offset)[0]
+            if bit is not None:
+                value = bool((value >> bit) & 0x1)
+            values.append(value)
+        return values
+
+    return decode
+
+
+def same_values(a: list, b: list) -> bool:
+    # random data contains NaN floats, which are never equal
+    return all(x == y or (x != x and y != y) for x, y in zip(a, b)) and len(a) == len(b)
+
+
+def bench(func) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT
+
+
+def main() -> None:
+    snapshot = os.urandom(SHM_SIZE)
+    shm_name = "modbus_AO"
+
+    print(f"{'rows':>6} {'compile':>10} {'batched':>10} {'per row':>10} {'per value':>10}")
+    for rows in ROWS:
+        lines = cfg_lines(rows)
+
+        start = time.perf_counter()
+        plan = SHMFormatPlan({shm_name: lines})
+        compile_time = time.perf_counter() - start
+
+        begin, end = plan.spans[shm_name]
+        data = snapshot[begin:end]
+        batched = bench(lambda: plan.decode({shm_name: data}))
+
+        reference = per_value_decoder(plan, shm_name)
+        if not same_values(plan.decode({shm_name: data})[shm_name], reference(snapshot)):
+            raise RuntimeError(f"batched and per value decoder differ for {rows} rows")
+        per_value = bench(lambda: reference(snapshot))
+
+        print(f"{rows:>6} {compile_time * 1e3:>8.2f}ms {batched * 1e3:>8.3f}ms {batched / rows * 1e6:>8.2f}us "
+              f"{per_value * 1e3:>8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
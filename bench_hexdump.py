@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+"""
+Benchmark of the in-process hexdump (SHMMap + HexdumpFormat) against the former subprocess pipeline
+'dump-shm | hexdump -C -v' for different shared memory sizes.
+"""
+
+import os
+import shutil
+import subprocess
+import time
+
+from src.HexdumpFormat import hexdump
+from src.SHMMap import SHMMap
+
+SIZES = [64 * 1024, 128 * 1024, 1024 * 1024]
+REPEAT = 20
+SHM_NAME = f"shm_modbus_gui_bench_{os.getpid()}"
+
+
+def bench(func) -> float:
+    func()  # warm up
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    return (time.perf_counter() - start) / REPEAT
+
+
+def subprocess_command(size: int) -> list[str] | None:
+    if not shutil.which("hexdump"):
+        return None
+    if shutil.which("dump-shm"):
+        return ["bash", "-c", f"dump-shm --bytes {size} --offset 0 {SHM_NAME} | hexdump -C -v"]
+    return ["bash", "-c", f"head -c {size} /dev/shm/{SHM_NAME} | hexdump -C -v"]
+
+
+def main() -> None:
+    print(f"{'size':>10} {'native':>12} {'subprocess':>12} {'speedup':>9}")
+    for size in SIZES:
+        with open(f"/dev/shm/{SHM_NAME}", "wb") as f:
+            f.write(os.urandom(size))
+
+        try:
+            with SHMMap(SHM_NAME) as shm:
+                native = bench(lambda: hexdump(shm.read(0, size)))
+
+            cmd = subprocess_command(size)
+            if cmd:
+                ref = subprocess.run(cmd, capture_output=True).stdout.decode()
+                with SHMMap(SHM_NAME) as shm:
+                    assert ref == hexdump(shm.read(0, size)), "output differs from hexdump -C -v"
+                external = bench(lambda: subprocess.run(cmd, capture_output=True))
+                print(f"{size:>10} {native * 1e3:>10.2f}ms {external * 1e3:>10.2f}ms {external / native:>8.1f}x")
+            else:
+                print(f"{size:>10} {native * 1e3:>10.2f}ms {'n/a':>12} {'n/a':>9}  (hexdump not installed)")
+        finally:
+            os.unlink(f"/dev/shm/{SHM_NAME}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+BYTES_PER_LINE = 16
+LINE_HEX_WIDTH = 3 * BYTES_PER_LINE
+
+# 256 entry lookup table: printable ascii characters are kept, everything else is replaced by '.'
+ASCII_TABLE = bytes(b if 0x20 <= b < 0x7f else ord('.') for b in range(256))
+
+
+def num_rows(size: int) -> int:
+    return (size + BYTES_PER_LINE - 1) // BYTES_PER_LINE
+
+
+def hexdump_rows(data: bytes | bytearray | memoryview, first_row: int = 0, rows: int | None = None) -> list[str]:
+    """
+    @brief format the given rows of data like 'hexdump -C -v' (without the trailing offset line)
+
+    The conversion is done for the whole requested range at once (bytes.hex / bytes.translate) and the lines are
+    sliced out of the converted strings afterwards. No per byte python code is executed.
+    """
+    total_rows = num_rows(len(data))
+    if rows is None:
+        rows = total_rows - first_row
+    last_row = min(first_row + rows, total_rows)
+    if first_row >= last_row:
+        return []
+
+    start = first_row * BYTES_PER_LINE
+    chunk = bytes(data[start:last_row * BYTES_PER_LINE])
+
+    hex_str = chunk.hex(' ') + ' '
+    ascii_str = chunk.translate(ASCII_TABLE).decode('ascii')
+
+    full_rows = len(chunk) // BYTES_PER_LINE
+    lines = [
+        f"{start + i * BYTES_PER_LINE:08x}  {hex_str[h:h + 24]} {hex_str[h + 24:h + 48]} |{ascii_str[a:a + 16]}|"
+        for i, h, a in zip(range(full_rows),
+                           range(0, full_rows * LINE_HEX_WIDTH, LINE_HEX_WIDTH),
+                           range(0, full_rows * BYTES_PER_LINE, BYTES_PER_LINE))
+    ]
+
+    rest = len(chunk) - full_rows * BYTES_PER_LINE
+    if rest:
+        h = full_rows * LINE_HEX_WIDTH
+        a = full_rows * BYTES_PER_LINE
+        hex_part = f"{hex_str[h:h + min(rest, 8) * 3]} {hex_str[h + 24:h + rest * 3]}"
+        lines.append(f"{start + a:08x}  {hex_part:<49} |{ascii_str[a:]}|")
+
+    return lines
+
+
+def hexdump(data: bytes | bytearray | memoryview) -> str:
+    """
+    @brief format data like 'hexdump -C -v'
+    """
+    if len(data) == 0:
+        return ""
+
+    lines = hexdump_rows(data)
+    lines.append(f"{len(data):08x}")
+    return "\n".join(lines) + "\n"
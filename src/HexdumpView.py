@@ -0,0 +1,236 @@
+from PySide6 import QtWidgets
+from PySide6.QtCore import Qt
+from PySide6.QtGui import QFontDatabase, QFontMetrics, QGuiApplication, QKeySequence, QPainter, QPalette, QRegion, \
+    QColor
+
+from .HexdumpFormat import hexdump, hexdump_rows, num_rows, BYTES_PER_LINE
+from .SHMDiff import ChangeTracker, ranges_to_rows
+
+LINE_CHARS = 78
+HEX_COLUMN = 10
+ASCII_COLUMN = 61
+CHANGE_COLOR = "#ffa500"
+
+
+class HexdumpView(QtWidgets.QAbstractScrollArea):
+    """
+    @brief read only hexdump widget backed by a raw snapshot buffer
+
+    Only the rows that are visible in the viewport are formatted and painted, so the cost of a refresh depends on the
+    window height and not on the size of the shared memory. Scroll position and selection are kept if the data is
+    replaced.
+    """
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super(HexdumpView, self).__init__(parent)
+
+        self.data = b""
+        self.offset = 0
+        self.message: str | None = None
+
+        # change highlighting (diff mode)
+        self.changes: ChangeTracker | None = None
+
+        # selected rows (anchor is where the selection was started)
+        self.sel_anchor: int | None = None
+        self.sel_cursor: int | None = None
+
+        self.setFont(QFontDatabase.systemFont(QFontDatabase.FixedFont))
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.verticalScrollBar().setSingleStep(1)
+
+    def total_rows(self) -> int:
+        if self.message is not None:
+            return 1
+        # hexdump prints the end offset as additional last line
+        return num_rows(len(self.data)) + 1 if len(self.data) else 0
+
+    def row_text(self, first_row: int, rows: int) -> list[str]:
+        if self.message is not None:
+            return [self.message][first_row:first_row + rows]
+
+        lines = hexdump_rows(self.data, first_row, rows)
+        if first_row < self.total_rows() <= first_row + rows:
+            lines.append(f"{len(self.data):08x}")
+        return lines
+
+    def text(self) -> str:
+        if self.message is not None:
+            return self.message
+        return hexdump(self.data)
+
+    def set_data(self, data: bytes, offset: int = 0) -> None:
+        """
+        @brief replace the displayed data
+        @param offset position of data in the shared memory; if it differs from the previous data, the change
+                      highlighting starts over instead of comparing two different windows of the shared memory
+        """
+        full_update = self.message is not None or len(data) != len(self.data) or offset != self.offset
+        if offset != self.offset and self.changes is not None:
+            self.changes.reset()
+        self.data = data
+        self.offset = offset
+        self.message = None
+
+        if self.changes is None:
+            self.__update_scrollbars()
+            self.viewport().update()
+            return
+
+        dirty = self.changes.update(data)
+        if full_update or dirty is None:
+            self.__update_scrollbars()
+            self.viewport().update()
+            return
+
+        # repaint only the visible rows that contain changed or fading bytes
+        first_row = self.verticalScrollBar().value()
+        last_row = first_row + self.visible_rows()
+        line_height = self.line_height()
+        width = self.viewport().width()
+        region = QRegion()
+        for first, last in ranges_to_rows(dirty, BYTES_PER_LINE):
+            first = max(first, first_row)
+            last = min(last, last_row)
+            if first <= last:
+                region += QRegion(0, (first - first_row) * line_height, width, (last - first + 1) * line_height)
+        if not region.isEmpty():
+            self.viewport().update(region)
+
+    def set_highlight_changes(self, enable: bool, fade_ticks: int = 10) -> None:
+        self.changes = ChangeTracker(fade_ticks) if enable else None
+        self.viewport().update()
+
+    def set_message(self, message: str) -> None:
+        self.message = message
+        self.__update_scrollbars()
+        self.viewport().update()
+
+    def line_height(self) -> int:
+        return QFontMetrics(self.font()).height()
+
+    def visible_rows(self) -> int:
+        return max(self.viewport().height() // self.line_height(), 1)
+
+    def row_at(self, y: float) -> int:
+        row = self.verticalScrollBar().value() + int(y) // self.line_height()
+        return max(min(row, self.total_rows() - 1), 0)
+
+    def selected_rows(self) -> tuple[int, int] | None:
+        if self.sel_anchor is None or self.sel_cursor is None:
+            return None
+        first = min(self.sel_anchor, self.sel_cursor)
+        last = min(max(self.sel_anchor, self.sel_cursor), self.total_rows() - 1)
+        if first > last:
+            return None
+        return first, last
+
+    def __update_scrollbars(self) -> None:
+        vbar = self.verticalScrollBar()
+        vbar.setRange(0, max(self.total_rows() - self.visible_rows(), 0))
+        vbar.setPageStep(self.visible_rows())
+
+        metrics = QFontMetrics(self.font())
+        hbar = self.horizontalScrollBar()
+        hbar.setRange(0, max(metrics.horizontalAdvance('0') * LINE_CHARS - self.viewport().width(), 0))
+        hbar.setPageStep(self.viewport().width())
+        hbar.setSingleStep(metrics.horizontalAdvance('0'))
+
+    def resizeEvent(self, event) -> None:
+        super(HexdumpView, self).resizeEvent(event)
+        self.__update_scrollbars()
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self.viewport())
+        painter.setFont(self.font())
+        palette = self.palette()
+        painter.fillRect(self.viewport().rect(), palette.color(QPalette.Base))
+
+        line_height = self.line_height()
+        ascent = QFontMetrics(self.font()).ascent()
+        x = -self.horizontalScrollBar().value() + 2
+        first_row = self.verticalScrollBar().value()
+
+        # only repaint rows inside the exposed region
+        exposed = event.rect()
+        row_from = first_row + max(exposed.top() // line_height, 0)
+        row_to = first_row + exposed.bottom() // line_height + 1
+        selection = self.selected_rows()
+        char_width = QFontMetrics(self.font()).horizontalAdvance('0')
+        ages = self.changes.ages if self.changes and self.message is None else None
+
+        for row, line in enumerate(self.row_text(row_from, row_to - row_from), start=row_from):
+            y = (row - first_row) * line_height
+            if selection and selection[0] <= row <= selection[1]:
+                painter.fillRect(0, y, self.viewport().width(), line_height, palette.color(QPalette.Highlight))
+                painter.setPen(palette.color(QPalette.HighlightedText))
+            else:
+                painter.setPen(palette.color(QPalette.Text))
+
+            if ages:
+                self.__paint_changes(painter, ages, row, x, y, char_width, line_height)
+
+            painter.drawText(x, y + ascent, line)
+
+        painter.end()
+
+    def __paint_changes(self, painter: QPainter, ages: bytearray, row: int, x: int, y: int, char_width: int,
+                        line_height: int) -> None:
+        start = row * BYTES_PER_LINE
+        row_ages = ages[start:start + BYTES_PER_LINE]
+        if not any(row_ages):
+            return
+
+        color = QColor(CHANGE_COLOR)
+        for i, age in enumerate(row_ages):
+            if age == 0:
+                continue
+            color.setAlphaF(age / self.changes.fade_ticks)
+            hex_col = HEX_COLUMN + i * 3 + (1 if i >= 8 else 0)
+            painter.fillRect(x + hex_col * char_width, y, 2 * char_width, line_height, color)
+            painter.fillRect(x + (ASCII_COLUMN + i) * char_width, y, char_width, line_height, color)
+
+    def mousePressEvent(self, event) -> None:
+        if event.button() != Qt.LeftButton or self.total_rows() == 0:
+            return super(HexdumpView, self).mousePressEvent(event)
+
+        row = self.row_at(event.position().y())
+        if not (event.modifiers() & Qt.ShiftModifier) or self.sel_anchor is None:
+            self.sel_anchor = row
+        self.sel_cursor = row
+        self.viewport().update()
+
+    def mouseMoveEvent(self, event) -> None:
+        if not (event.buttons() & Qt.LeftButton) or self.sel_anchor is None:
+            return super(HexdumpView, self).mouseMoveEvent(event)
+
+        y = event.position().y()
+        vbar = self.verticalScrollBar()
+        if y < 0:
+            vbar.setValue(vbar.value() - 1)
+        elif y > self.viewport().height():
+            vbar.setValue(vbar.value() + 1)
+        self.sel_cursor = self.row_at(y)
+        self.viewport().update()
+
+    def keyPressEvent(self, event) -> None:
+        if event.matches(QKeySequence.Copy):
+            self.copy()
+        elif event.matches(QKeySequence.SelectAll):
+            self.sel_anchor = 0
+            self.sel_cursor = self.total_rows() - 1
+            self.viewport().update()
+        elif event.key() == Qt.Key_Home:
+            self.verticalScrollBar().setValue(0)
+        elif event.key() == Qt.Key_End:
+            self.verticalScrollBar().setValue(self.verticalScrollBar().maximum())
+        else:
+            super(HexdumpView, self).keyPressEvent(event)
+
+    def copy(self) -> None:
+        selection = self.selected_rows()
+        if selection is None:
+            return
+        first, last = selection
+        lines = self.row_text(first, last - first + 1)
+        QGuiApplication.clipboard().setText("\n".join(lines) + "\n")
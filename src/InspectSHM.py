@@ -1,36 +1,32 @@
 import csv
 import datetime
-import enum
 import hashlib
 import json
-import os
-import tempfile
 
 from PySide6 import QtWidgets, QtCore
-from PySide6.QtCore import QMutex, Qt, QProcess, QTimer
-from PySide6.QtGui import QFontDatabase
-from PySide6.QtWidgets import QTableWidgetItem, QPushButton, QMessageBox, QFileDialog
+from PySide6.QtCore import QMutex, QModelIndex, QSortFilterProxyModel, QTimer
+from PySide6.QtWidgets import QMessageBox, QFileDialog, QInputDialog
 
 from .py_ui import Ui_InspectSHM
 from .InspectSHM_AddInt import InspectSHM_AddInt
 from .InspectSHM_AddFloat import InspectSHM_AddFloat
 from .InspectSHM_AddBool import InspectSHM_AddBool
 from .InspectSHM_AddString import InspectSHM_AddString
+from .SHMWorker import SHMWorker
+from .SHMFormat import SHMFormatPlan
+from .SHMFormatStream import SHMFormatStream
+from .SHMMap import SHMMap
+from .SampleRing import SampleRing
+from .SHMPlot import SHMPlot
+from .SHMSampler import SHMSampler
+from .SHMTrigger import TriggerRule, TriggerEngine, TRIGGER_KINDS
+from .InspectSHMModel import InspectSHMModel
 
 
 class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
     closed = QtCore.Signal(str)
 
-    class TableCols(enum.IntEnum):
-        NAME = 0
-        REGISTER = 1
-        ADDR = 2
-        TYPE = 3
-        SIZE = 4
-        ENDIAN = 5
-        VALUE = 6
-        TIME = 7
-        BUTTON = 8
+    TableCols = InspectSHMModel.TableCols
 
     def __init__(self, name_prefix: str, num_DO: int, num_DI: int, num_AO: int, num_AI: int,
                  semaphore: str | None = None) -> None:
@@ -48,20 +44,60 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
         self.add_window = None
 
         self.exec_mutex = QMutex()
-        self.fixed_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+
+        # table model of the values; the proxy sorts only when requested by the user
+        self.model = InspectSHMModel(self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setDynamicSortFilter(False)
+        self.proxy.setSourceModel(self.model)
+        self.data_view.setModel(self.proxy)
+        self.data_view.clicked.connect(self.on_view_clicked)
 
         # auto refresh timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.execute)
 
-        self.shm_format_cfg = {
-            "DO": {},
-            "DI": {},
-            "AO": {},
-            "AI": {},
-        }
+        # values are read and decoded on a worker thread, the results are applied in the GUI thread
+        self.worker = SHMWorker(self)
+        self.worker.result.connect(self.on_values_read)
+        self.worker.error.connect(self.on_read_failed)
+
+        # compiled extraction plan (compiled on demand after config changes) and mapped shared memories
+        self.plan: SHMFormatPlan | None = None
+        self.plan_cfg_lines: dict[str, list[str]] = {}
+        self.shm: dict[str, SHMMap] = {}
+
+        # optional persistent shm-format process (started once per configuration)
+        self.stream = SHMFormatStream(self)
+        self.stream.values.connect(self.on_values_read)
+        self.stream.error.connect(self.on_read_failed)
+        self.actionStream.toggled.connect(self.on_action_stream_toggled)
+
+        # recording of all samples to a ring buffer
+        self.ring: SampleRing | None = None
+        self.ring_fields: list[tuple[str, int]] = []
+        self.recording = False
+        self.actionRecord.toggled.connect(self.on_action_record_toggled)
+        self.actionExportRecordCSV.triggered.connect(lambda: self.export_recording(False))
+        self.actionExportRecordBinary.triggered.connect(lambda: self.export_recording(True))
+        self.actionPlot.triggered.connect(self.plot_selected)
+        self.plot_windows: list[SHMPlot] = []
+
+        # trigger rules (single shot capture of the samples around the first firing rule)
+        self.trigger_rules: list[dict] = []
+        self.trigger_engine: TriggerEngine | None = None
+        self.capture_pre = 1000
+        self.capture_post = 1000
+        self.capture_ring: SampleRing | None = None
+        self.capture_fields: list[tuple[str, int]] = []
+        self.actionAddTrigger.triggered.connect(self.add_trigger)
+        self.actionClearTriggers.triggered.connect(self.clear_triggers)
+        self.actionCaptureLength.triggered.connect(self.set_capture_length)
+        self.actionArm.toggled.connect(self.on_action_arm_toggled)
+        self.actionExportCapture.triggered.connect(self.export_capture)
+        self.actionPlotCapture.triggered.connect(self.plot_capture)
 
-        self.shm_format_widgets = {
+        self.shm_format_cfg = {
             "DO": {},
             "DI": {},
             "AO": {},
@@ -85,47 +121,18 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
 
         self.auto_refresh.stateChanged.connect(self.on_checkbox_autorefresh_clicked)
 
+        # high rate sampling on a separate thread (the refresh interval only controls the table updates)
+        self.sampler: SHMSampler | None = None
+        self.sampler_missed = 0
+        self.checkbox_sampler.stateChanged.connect(self.on_checkbox_sampler_changed)
+        self.spinbox_sample_rate.valueChanged.connect(self.on_sample_rate_changed)
+
         self.actionLoad_config.triggered.connect(self.load_config)
         self.actionSave_config.triggered.connect(self.save_config)
         self.actionExport_values.triggered.connect(self.save_values)
 
     def add_row(self, name: str, register: str, reg_addr: str, type_str: str, size: str, identifier: str):
-        self.data_table.setSortingEnabled(False)
-
-        current_row = self.data_table.rowCount()
-        self.data_table.setRowCount(current_row + 1)
-
-        self.data_table.setItem(current_row, int(self.TableCols.NAME), QTableWidgetItem(name))
-        self.data_table.setItem(current_row, int(self.TableCols.REGISTER), QTableWidgetItem(register))
-        addr_widget = QTableWidgetItem(reg_addr)
-        addr_widget.setFont(self.fixed_font)
-        addr_widget.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.data_table.setItem(current_row, int(self.TableCols.ADDR), addr_widget)
-        self.data_table.setItem(current_row, int(self.TableCols.TYPE), QTableWidgetItem(type_str))
-        size_widget = QTableWidgetItem(size)
-        size_widget.setFont(self.fixed_font)
-        size_widget.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.data_table.setItem(current_row, int(self.TableCols.SIZE), size_widget)
-        endian_widget = QTableWidgetItem("####")
-        self.data_table.setItem(current_row, int(self.TableCols.ENDIAN), endian_widget)
-        value_widget = QTableWidgetItem("#####")
-        value_widget.setFont(self.fixed_font)
-        value_widget.setTextAlignment(Qt.AlignRight | Qt.AlignVCenter)
-        self.data_table.setItem(current_row, int(self.TableCols.VALUE), value_widget)
-        time_widget = QTableWidgetItem("#####")
-        self.data_table.setItem(current_row, int(self.TableCols.TIME), time_widget)
-
-        value_widget.register = register
-        value_widget.identifier = identifier
-
-        delete_button = QPushButton()
-        delete_button.setText("del")
-        delete_button.clicked.connect(lambda: self.delete_row(value_widget))
-        self.data_table.setCellWidget(current_row, int(self.TableCols.BUTTON), delete_button)
-
-        self.data_table.setSortingEnabled(True)
-
-        return value_widget, endian_widget, time_widget
+        self.model.add_row(name, register, reg_addr, type_str, size, identifier)
 
     def __add_cfg(self, cfg: tuple[str, dict, str, str, str, str]):
         self.exec_mutex.lock()
@@ -139,18 +146,14 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
         identifier = cfg_line.split(',', maxsplit=2)[-1]
 
         # add table entry
-        value_widget, endian_widget, time_widget = self.add_row(name, register, reg_addr, type_str, size, identifier)
+        self.add_row(name, register, reg_addr, type_str, size, identifier)
 
         data["cfg_line"] = cfg_line
         data["reg_addr"] = reg_addr
         data["size"] = size
         data["type_str"] = type_str
         self.shm_format_cfg[f"{register}"][identifier] = data
-        self.shm_format_widgets[f"{register}"][identifier] = {
-            "value_widget": value_widget,
-            "endian_widget": endian_widget,
-            "time_widget": time_widget,
-        }
+        self.invalidate_plan()
         self.exec_mutex.unlock()
 
     def __setup_add_buttons(self):
@@ -210,142 +213,553 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
         else:
             self.timer.stop()
 
+    def on_action_stream_toggled(self, checked: bool):
+        if not checked:
+            self.stream.stop()
+
+    def on_checkbox_sampler_changed(self, state: int):
+        if state != 0:
+            self.start_sampler()
+        else:
+            self.stop_sampler()
+
+    def start_sampler(self) -> bool:
+        if not self.compile_plan():
+            self.checkbox_sampler.setChecked(False)
+            return False
+        if len(self.plan.fields) == 0:
+            return False
+
+        # wait for a running read, the worker uses the same shared memory mappings
+        if self.worker.busy():
+            return False
+
+        try:
+            self.open_shm(self.plan)
+        except Exception as e:
+            self.checkbox_sampler.setChecked(False)
+            self.on_read_failed(f"{e}")
+            return False
+
+        self.sampler = SHMSampler(self.plan, self.shm, self.spinbox_sample_rate.value())
+        self.sampler.failed.connect(self.on_sampler_failed)
+        self.sampler_missed = 0
+        self.sampler.start(QtCore.QThread.TimeCriticalPriority)
+        return True
+
+    def on_sample_rate_changed(self, _value: int):
+        if self.sampler:
+            self.stop_sampler()
+            self.start_sampler()
+
+    def stop_sampler(self):
+        if self.sampler:
+            self.sampler.stop()
+            self.sampler = None
+
+    def on_sampler_failed(self, message: str):
+        self.checkbox_sampler.setChecked(False)
+        self.on_read_failed(message)
+
+    def show_samples(self):
+        samples = self.sampler.take()
+        if len(samples) == 0:
+            return
+
+        # latest value, minimum and maximum of the refresh interval
+        timestamp, _, latest = samples[-1]
+        mins = dict(samples[0][2])
+        maxs = dict(samples[0][2])
+        for _, _, values in samples[1:]:
+            for shm_name, shm_values in values.items():
+                mins[shm_name] = list(map(min, mins[shm_name], shm_values))
+                maxs[shm_name] = list(map(max, maxs[shm_name], shm_values))
+        max_late = max(late for _, late, _ in samples)
+
+        data = self.sampler.plan.to_shm_format_dict(latest, timestamp)
+        for shm_name, shm_data in data["shm_data"].items():
+            for element, min_value, max_value in zip(shm_data["data"], mins[shm_name], maxs[shm_name]):
+                element["min"] = min_value
+                element["max"] = max_value
+
+        self.exec_mutex.lock()
+        try:
+            self.process_samples([(sample_time, values) for sample_time, _, values in samples])
+            self.apply_shm_format_data(data)
+        except Exception as e:
+            QMessageBox.warning(self, f"failed to apply", f"failed to apply values:\n{type(e).__name__}\n{e}")
+        self.exec_mutex.unlock()
+
+        missed = self.sampler.missed - self.sampler_missed
+        self.sampler_missed += missed
+        self.statusbar.showMessage(f"sampler: {len(samples)} samples, max jitter {max_late * 1e3:.3f} ms, "
+                                   f"{missed} missed; {self.lock_time_message(self.sampler.plan)}")
+
     def execute(self):
+        if self.checkbox_sampler.isChecked():
+            if self.sampler is None and not self.start_sampler():
+                return
+            self.show_samples()
+            return
+
+        # skip this tick if the previous read has not finished yet
+        if self.worker.busy() or self.stream.busy():
+            return
+
+        if not self.compile_plan():
+            return
+
+        if len(self.plan.fields) == 0:
+            return
+
+        if self.actionStream.isChecked():
+            if not self.stream.running():
+                try:
+                    self.stream.start(self.plan, self.plan_cfg_lines, self.semaphore)
+                except RuntimeError as e:
+                    self.on_read_failed(f"{e}")
+                    return
+            self.stream.tick()
+        else:
+            self.worker.submit(self.read_values, self.plan)
+
+    def compile_plan(self) -> bool:
+        if self.plan is not None:
+            return True
+
         self.exec_mutex.lock()
-        self.data_table.setSortingEnabled(False)
-
-        do_cfg_lines = [x["cfg_line"] for x in self.shm_format_cfg["DO"].values()]
-        di_cfg_lines = [x["cfg_line"] for x in self.shm_format_cfg["DI"].values()]
-        ao_cfg_lines = [x["cfg_line"] for x in self.shm_format_cfg["AO"].values()]
-        ai_cfg_lines = [x["cfg_line"] for x in self.shm_format_cfg["AI"].values()]
-
-        cfg_files = {}
-
-        if len(do_cfg_lines) > 0:
-            with tempfile.NamedTemporaryFile(delete=False, mode='w', prefix="shm-modbus-gui", suffix="DO") as f:
-                for line in do_cfg_lines:
-                    print(line, file=f)
-                cfg_files[f"{self.name_prefix}DO"] = f
-
-        if len(di_cfg_lines) > 0:
-            with tempfile.NamedTemporaryFile(delete=False, mode='w', prefix="shm-modbus-gui", suffix="DI") as f:
-                for line in di_cfg_lines:
-                    print(line, file=f)
-                cfg_files[f"{self.name_prefix}DI"] = f
-
-        if len(ao_cfg_lines) > 0:
-            with tempfile.NamedTemporaryFile(delete=False, mode='w', prefix="shm-modbus-gui", suffix="AO") as f:
-                for line in ao_cfg_lines:
-                    print(line, file=f)
-                cfg_files[f"{self.name_prefix}AO"] = f
-
-        if len(ai_cfg_lines) > 0:
-            with tempfile.NamedTemporaryFile(delete=False, mode='w', prefix="shm-modbus-gui", suffix="AI") as f:
-                for line in ai_cfg_lines:
-                    print(line, file=f)
-                cfg_files[f"{self.name_prefix}AI"] = f
-
-        if len(cfg_files) > 0:
-            cmd_args = []
-            if self.semaphore:
-                cmd_args.append("--semaphore")
-                cmd_args.append(self.semaphore)
-
-            for shm_name, tmp_file in cfg_files.items():
-                cmd_args.append(shm_name)
-                cmd_args.append(tmp_file.name)
-
-            process = QProcess()
-            process.start("shm-format", cmd_args)
-
-            if process.waitForFinished(min(self.slider_interval.value() * 0.8, 1000)):
-                if process.exitCode() != 0:
-                    self.timer.stop()
-                    stderr = bytes(process.readAllStandardError()).decode("utf-8")
-                    QMessageBox.warning(self, "shm-format failed", stderr)
-                else:
-                    try:
-                        self.apply_shm_format_json(bytes(process.readAllStandardOutput()).decode("utf-8"))
-                    except Exception as e:
-                        QMessageBox.warning(self, f"failed to parse", f"failed to parse shm-format data:\n{type(e).__name__}\n{e}")
+        cfg_lines = {}
+        for register in ("DO", "DI", "AO", "AI"):
+            cfg_lines[f"{self.name_prefix}{register}"] = [x["cfg_line"] for x in
+                                                          self.shm_format_cfg[register].values()]
+        self.exec_mutex.unlock()
+
+        try:
+            self.plan = SHMFormatPlan(cfg_lines)
+        except Exception as e:
+            self.timer.stop()
+            QMessageBox.warning(self, "Invalid config", f"failed to compile config:\n{type(e).__name__}\n{e}")
+            return False
+        self.plan_cfg_lines = cfg_lines
+
+        # the stream process has to be restarted with the new layout
+        self.stream.stop()
+        return True
+
+    def invalidate_plan(self):
+        self.plan = None
+        self.trigger_engine = None
+
+        # the sampler is restarted with the new plan on the next refresh
+        self.stop_sampler()
+
+        # a recording has a fixed set of columns
+        if self.recording:
+            self.actionRecord.setChecked(False)
+            self.statusbar.showMessage("recording stopped: configuration changed", 5000)
+
+    def read_values(self, plan: SHMFormatPlan) -> dict:
+        # executed on the worker thread
+        self.open_shm(plan)
+        values = plan.decode(plan.read(self.shm))
+        return plan.to_shm_format_dict(values)
+
+    def open_shm(self, plan: SHMFormatPlan):
+        # map the shared memories once and keep them for the lifetime of the window
+        for shm_name in plan.fields.keys():
+            if shm_name not in self.shm:
+                shm = SHMMap(shm_name, self.semaphore)
+                try:
+                    plan.check_size(shm_name, shm.size)
+                except RuntimeError:
+                    shm.close()
+                    raise
+                self.shm[shm_name] = shm
             else:
-                process.kill()
+                plan.check_size(shm_name, self.shm[shm_name].size)
 
-            for tmp_file in cfg_files.values():
-                os.unlink(tmp_file.name)
+    def on_read_failed(self, message: str):
+        self.timer.stop()
+        QMessageBox.warning(self, "Failed to read shared memory", message)
 
-        self.data_table.setSortingEnabled(True)
+    def on_values_read(self, data: dict):
+        self.exec_mutex.lock()
+        try:
+            values = {shm_name: [element["data"] for element in shm_data["data"]] for shm_name, shm_data in
+                      data["shm_data"].items()}
+            self.process_samples([(data["time"], values)])
+            self.apply_shm_format_data(data)
+        except Exception as e:
+            QMessageBox.warning(self, f"failed to apply", f"failed to apply values:\n{type(e).__name__}\n{e}")
         self.exec_mutex.unlock()
 
-    def apply_shm_format_json(self, json_data: str):
-        data = json.loads(json_data)
+        if self.plan is not None and self.plan.lock_stats.count > 0:
+            self.statusbar.showMessage(self.lock_time_message(self.plan))
+
+    @staticmethod
+    def lock_time_message(plan: SHMFormatPlan) -> str:
+        count, mean, maximum = plan.lock_stats.take()
+        return f"semaphore held {mean * 1e6:.1f} us (max {maximum * 1e6:.1f} us, {count} reads)"
+
+    def on_action_record_toggled(self, checked: bool):
+        if not checked:
+            self.recording = False
+            return
+
+        if not self.compile_plan():
+            self.actionRecord.setChecked(False)
+            return
+
+        depth, ok = QInputDialog.getInt(self, "Record values", "Number of samples:",
+                                        self.ring.depth if self.ring else 1000000, 1, 2 ** 31 - 1)
+        if not ok:
+            self.actionRecord.setChecked(False)
+            return
+
+        columns, self.ring_fields = self.value_columns(self.plan)
+
+        if self.ring:
+            self.close_plots()
+            self.ring.close()
+            self.ring = None
+        try:
+            self.ring = SampleRing(columns, depth)
+        except Exception as e:
+            self.actionRecord.setChecked(False)
+            QMessageBox.warning(self, "Record values", f"failed to create ring buffer:\n{e}")
+            return
+        self.recording = True
 
+    def process_samples(self, samples: list[tuple[float, dict[str, list]]]):
+        # recording
+        if self.recording:
+            for timestamp, values in samples:
+                self.ring.append(timestamp, [values[shm_name][index] for shm_name, index in self.ring_fields])
+
+        # triggers
+        if len(self.trigger_rules) == 0:
+            return
+        if self.trigger_engine is None and not self.compile_triggers():
+            return
+        for timestamp, values in samples:
+            if self.trigger_engine.process(timestamp, values):
+                self.on_capture_complete()
+
+    def value_columns(self, plan: SHMFormatPlan) -> tuple[list[tuple[str, str]], list[tuple[str, int]]]:
+        """
+        @brief ring buffer columns for all recordable (non string) values
+        @return column names and types, (shared memory name, field index) of each column
+        """
+        columns = []
+        fields = []
+        for shm_name, shm_fields in plan.fields.items():
+            register = shm_name[len(self.name_prefix):]
+            for index, field in enumerate(shm_fields):
+                if field.kind == "string":
+                    continue
+                if field.kind == "bool":
+                    code = 'B'
+                elif field.kind == "float":
+                    code = 'd'
+                else:
+                    code = 'Q' if field.type_name.startswith("uint") else 'q'
+                columns.append((f"{self.shm_format_cfg[register][field.name]['name']} ({register})", code))
+                fields.append((shm_name, index))
+        return columns, fields
+
+    def selected_fields(self) -> list[tuple[str, int]]:
+        """
+        @brief (shared memory name, field index) of the selected rows
+        """
+        selection = self.data_view.selectionModel().selectedIndexes()
+        rows = sorted({self.proxy.mapToSource(index).row() for index in selection})
+        selected = []
+        for row in rows:
+            register, identifier = self.model.key(row)
+            shm_name = f"{self.name_prefix}{register}"
+            for index, field in enumerate(self.plan.fields.get(shm_name, [])):
+                if field.name == identifier:
+                    selected.append((shm_name, index))
+        return selected
+
+    def plot_selected(self):
+        if not self.compile_plan():
+            return
+        selected = self.selected_fields()
+        if len(selected) == 0:
+            QMessageBox.information(self, "Plot values", "Select the rows to plot.")
+            return
+
+        # the plot shows the recorded samples
+        if not self.recording:
+            self.actionRecord.setChecked(True)
+            if not self.recording:
+                return
+
+        ring_columns = {field: column for column, field in enumerate(self.ring_fields)}
+        columns = [ring_columns[field] for field in selected if field in ring_columns]
+
+        if len(columns) == 0:
+            QMessageBox.information(self, "Plot values", "The selected values can not be plotted.")
+            return
+
+        plot_window = SHMPlot(self.ring, columns, f"plot {self.name_prefix}*")
+        plot_window.closed.connect(self.plot_windows.remove)
+        self.plot_windows.append(plot_window)
+        plot_window.show()
+
+    def add_trigger(self):
+        if not self.compile_plan():
+            return
+        selected = self.selected_fields()
+        if len(selected) != 1:
+            QMessageBox.information(self, "Add trigger", "Select exactly one value.")
+            return
+        shm_name, index = selected[0]
+        field = self.plan.fields[shm_name][index]
+        if field.kind == "string":
+            QMessageBox.information(self, "Add trigger", "Triggers on strings are not supported.")
+            return
+
+        descriptions = list(TRIGGER_KINDS.values())
+        description, ok = QInputDialog.getItem(self, "Add trigger", "Condition:", descriptions, 0, False)
+        if not ok:
+            return
+        kind = list(TRIGGER_KINDS.keys())[descriptions.index(description)]
+
+        param = 0.0
+        if kind in ("above", "below", "change", "stuck"):
+            label = {"above": "Threshold:", "below": "Threshold:", "change": "Percent:", "stuck": "Seconds:"}[kind]
+            param, ok = QInputDialog.getDouble(self, "Add trigger", label, 0.0, -1e300, 1e300, 6)
+            if not ok:
+                return
+
+        register = shm_name[len(self.name_prefix):]
+        self.trigger_rules.append({
+            "kind": kind,
+            "register": register,
+            "identifier": field.name,
+            "param": param,
+        })
+        self.trigger_engine = None
+        self.statusbar.showMessage(f"{len(self.trigger_rules)} trigger(s) defined", 5000)
+
+    def clear_triggers(self):
+        self.trigger_rules = []
+        self.trigger_engine = None
+        self.actionArm.setChecked(False)
+
+    def set_capture_length(self):
+        pre, ok = QInputDialog.getInt(self, "Capture length", "Samples before trigger:", self.capture_pre, 0,
+                                      10000000)
+        if not ok:
+            return
+        post, ok = QInputDialog.getInt(self, "Capture length", "Samples after trigger (including the trigger):",
+                                       self.capture_post, 1, 10000000)
+        if not ok:
+            return
+        self.capture_pre = pre
+        self.capture_post = post
+        self.trigger_engine = None
+
+    def compile_triggers(self) -> bool:
+        if not self.compile_plan():
+            return False
+
+        rules = []
+        for rule in self.trigger_rules:
+            shm_name = f"{self.name_prefix}{rule['register']}"
+            for index, field in enumerate(self.plan.fields.get(shm_name, [])):
+                if field.name == rule["identifier"]:
+                    label = self.shm_format_cfg[rule["register"]][field.name]["name"]
+                    rules.append(TriggerRule(rule["kind"], shm_name, index, rule["param"], label))
+
+        self.trigger_engine = TriggerEngine(rules, self.capture_pre, self.capture_post)
+        if self.actionArm.isChecked():
+            self.trigger_engine.arm()
+        return True
+
+    def on_action_arm_toggled(self, checked: bool):
+        if self.trigger_engine is None:
+            return
+        if checked:
+            self.trigger_engine.arm()
+        else:
+            self.trigger_engine.armed = False
+
+    def on_capture_complete(self):
+        engine = self.trigger_engine
+        self.actionArm.setChecked(False)
+
+        columns, fields = self.value_columns(self.plan)
+        if self.capture_ring:
+            self.capture_ring.close()
+            self.capture_ring = None
+        if len(columns) > 0:
+            self.capture_ring = SampleRing(columns, len(engine.capture))
+            for timestamp, values in engine.capture:
+                self.capture_ring.append(timestamp, [values[shm_name][index] for shm_name, index in fields])
+            self.capture_fields = fields
+
+        fire_time = datetime.datetime.fromtimestamp(engine.fire_time).strftime('%H:%M:%S.%f')[:-3]
+        self.statusbar.showMessage(f"trigger {engine.fired.description()} fired at {fire_time}; "
+                                   f"{len(engine.capture)} samples captured")
+
+        if self.actionStopOnTrigger.isChecked():
+            self.auto_refresh.setChecked(False)
+
+    def export_capture(self):
+        if self.capture_ring is None:
+            QMessageBox.information(self, "Export capture", "Nothing captured.")
+            return
+
+        file_name, _ = QFileDialog.getSaveFileName(self, caption="Export capture", filter="*.csv")
+        if len(file_name) == 0:
+            return
+        try:
+            with open(file_name, 'w', newline='') as f:
+                self.capture_ring.export_csv(f)
+        except Exception as e:
+            QMessageBox.warning(self, "Export capture", f"failed to export capture:\n{e}")
+
+    def plot_capture(self):
+        if self.capture_ring is None:
+            QMessageBox.information(self, "Plot capture", "Nothing captured.")
+            return
+
+        # selected values or all captured values
+        capture_columns = {field: column for column, field in enumerate(self.capture_fields)}
+        columns = [capture_columns[field] for field in self.selected_fields() if field in capture_columns]
+        if len(columns) == 0:
+            columns = list(range(len(self.capture_fields)))
+
+        plot_window = SHMPlot(self.capture_ring, columns, f"capture {self.name_prefix}*")
+        plot_window.closed.connect(self.plot_windows.remove)
+        self.plot_windows.append(plot_window)
+        plot_window.show()
+
+    def close_plots(self):
+        for plot_window in list(self.plot_windows):
+            plot_window.close()
+
+    def export_recording(self, binary: bool):
+        if self.ring is None or len(self.ring) == 0:
+            QMessageBox.information(self, "Export recording", "Nothing recorded.")
+            return
+
+        file_name, _ = QFileDialog.getSaveFileName(self, caption="Export recording",
+                                                   filter="*.shmrec" if binary else "*.csv")
+        if len(file_name) == 0:
+            return
+
+        self.exec_mutex.lock()
+        try:
+            if binary:
+                with open(file_name, 'wb') as f:
+                    self.ring.export_binary(f)
+            else:
+                with open(file_name, 'w', newline='') as f:
+                    self.ring.export_csv(f)
+        except Exception as e:
+            QMessageBox.warning(self, "Export recording", f"failed to export recording:\n{e}")
+        self.exec_mutex.unlock()
+
+    def apply_shm_format_data(self, data: dict):
         time = datetime.datetime.fromtimestamp(data["time"]).strftime('%Y-%m-%d %H:%M:%S')
 
+        updates = []
         for shm_name, shm_data in data["shm_data"].items():
+            register = shm_name[len(self.name_prefix):]
             for element in shm_data["data"]:
                 name: str = element["name"]
-                raw_value = element["data"]
                 data_type: str = element["type"]
 
-                cfg_data = self.shm_format_cfg[shm_name[len(self.name_prefix):]][name]
-                cfg_widgets = self.shm_format_widgets[shm_name[len(self.name_prefix):]][name]
-                value_widget = cfg_widgets["value_widget"]
-                endian_widget = cfg_widgets["endian_widget"]
-                time_widget = cfg_widgets["time_widget"]
+                # the row might have been deleted while the values were read
+                if name not in self.shm_format_cfg[register]:
+                    continue
 
-                if data_type.startswith("int"):
-                    endian = element["endian"] if "endian" in element else None
-                    value = f"{raw_value:d}"
-                elif data_type.startswith("uint"):
+                cfg_data = self.shm_format_cfg[register][name]
+
+                if data_type.startswith("int") or data_type.startswith("uint"):
                     endian = element["endian"] if "endian" in element else None
-                    format_char = name.split('_')[1]
-                    match format_char:
-                        case 'u':
-                            value = f"{raw_value}"
-                        case 'x':
-                            value = f"0x{raw_value:x}"
-                        case 'o':
-                            value = f"0o{raw_value:o}"
-                        case 'b':
-                            value = f"0b{raw_value:b}"
-                        case _:
-                            raise RuntimeError(f"Unknown int format: {format_char}")
                 elif data_type.startswith("float") or data_type.startswith("double"):
                     endian = element["endian"]
-                    format_char = name.split('_')[1]
-                    match format_char:
-                        case 'f':
-                            value = f"{raw_value}"
-                        case 'e':
-                            value = f"{raw_value:e}"
-                        case _:
-                            raise RuntimeError(f"Unknown float format: {format_char}")
-                elif data_type.startswith("bool"):
-                    endian = None
-                    value = cfg_data['true'] if raw_value else cfg_data['false']
-                elif data_type.startswith("string"):
-                    endian = None
-                    value = raw_value
                 else:
-                    raise RuntimeError(f"Unknown data type: {data_type}")
+                    endian = None
 
-                value_widget.setText(value)
-                endian_widget.setText(endian)
-                time_widget.setText(time)
+                value = self.format_value(cfg_data, name, data_type, element["data"])
+
+                # per interval minimum and maximum (only provided by the sampler)
+                min_value = self.format_value(cfg_data, name, data_type, element["min"]) if "min" in element else ""
+                max_value = self.format_value(cfg_data, name, data_type, element["max"]) if "max" in element else ""
+
+                updates.append((register, name, value, endian, min_value, max_value))
+
+        # only rows with changed values are repainted
+        self.model.set_values(updates, time)
+
+    @staticmethod
+    def format_value(cfg_data: dict, name: str, data_type: str, raw_value) -> str:
+        if data_type.startswith("int"):
+            value = f"{raw_value:d}"
+        elif data_type.startswith("uint"):
+            format_char = name.split('_')[1]
+            match format_char:
+                case 'u':
+                    value = f"{raw_value}"
+                case 'x':
+                    value = f"0x{raw_value:x}"
+                case 'o':
+                    value = f"0o{raw_value:o}"
+                case 'b':
+                    value = f"0b{raw_value:b}"
+                case _:
+                    raise RuntimeError(f"Unknown int format: {format_char}")
+        elif data_type.startswith("float") or data_type.startswith("double"):
+            format_char = name.split('_')[1]
+            match format_char:
+                case 'f':
+                    value = f"{raw_value}"
+                case 'e':
+                    value = f"{raw_value:e}"
+                case _:
+                    raise RuntimeError(f"Unknown float format: {format_char}")
+        elif data_type.startswith("bool"):
+            value = cfg_data['true'] if raw_value else cfg_data['false']
+        elif data_type.startswith("string"):
+            value = raw_value
+        else:
+            raise RuntimeError(f"Unknown data type: {data_type}")
+        return value
+
+    def on_view_clicked(self, index: QModelIndex):
+        if index.column() == int(self.TableCols.BUTTON):
+            self.delete_row(self.proxy.mapToSource(index).row())
 
-    def delete_row(self, row_widget: QTableWidgetItem):
+    def delete_row(self, row: int):
         self.exec_mutex.lock()
-        i = row_widget.row()
-        del self.shm_format_cfg[f"{row_widget.register}"][row_widget.identifier]
-        del self.shm_format_widgets[f"{row_widget.register}"][row_widget.identifier]
-        self.data_table.removeRow(i)
+        register, identifier = self.model.remove_row(row)
+        del self.shm_format_cfg[register][identifier]
+        self.invalidate_plan()
         self.exec_mutex.unlock()
 
     def closeEvent(self, event):
         self.exec_mutex.lock()
         super(InspectSHM, self).closeEvent(event)
         self.timer.stop()
+        self.worker.stop()
+        self.stream.stop()
+        self.stop_sampler()
+        self.close_plots()
+        if self.ring:
+            self.ring.close()
+            self.ring = None
+        if self.capture_ring:
+            self.capture_ring.close()
+            self.capture_ring = None
+        for shm in self.shm.values():
+            shm.close()
+        self.shm = {}
         if self.add_window:
             self.add_window.close()
         self.closed.emit(self.name_prefix)
@@ -411,23 +825,17 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
             return
 
         # TODO check if entries in table, if yes: ask user to save
-        if self.data_table.rowCount() > 0:
+        if self.model.rowCount() > 0:
             pass
 
         # clear table
-        self.data_table.setRowCount(0)
+        self.model.clear()
 
         # apply config
         self.shm_format_cfg = loaded_cfg
+        self.invalidate_plan()
 
         # create table entries
-        self.shm_format_widgets = {
-            "DO": {},
-            "DI": {},
-            "AO": {},
-            "AI": {},
-        }
-
         for register, reg_entry in self.shm_format_cfg.items():
             for identifier, entry_values in reg_entry.items():
                 name = entry_values["name"]
@@ -435,14 +843,7 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
                 type_str = entry_values["type_str"]
                 size = entry_values["size"]
 
-                value_widget, endian_widget, time_widget = self.add_row(name, register, reg_addr, type_str, size,
-                                                                        identifier)
-
-                self.shm_format_widgets[f"{register}"][identifier] = {
-                    "value_widget": value_widget,
-                    "endian_widget": endian_widget,
-                    "time_widget": time_widget,
-                }
+                self.add_row(name, register, reg_addr, type_str, size, identifier)
 
     def save_values(self):
         file_name, _ = QFileDialog.getSaveFileName(self, caption="Save values", filter="*.csv")
@@ -457,18 +858,12 @@ class InspectSHM(QtWidgets.QMainWindow, Ui_InspectSHM):
             writer.writerow(header)
 
             self.exec_mutex.lock()
-            self.data_table.setSortingEnabled(False)
-
-            for row in range(self.data_table.rowCount()):
-                writer.writerow([
-                    self.data_table.item(row, int(self.TableCols.NAME)).text(),
-                    self.data_table.item(row, int(self.TableCols.REGISTER)).text(),
-                    self.data_table.item(row, int(self.TableCols.ADDR)).text(),
-                    self.data_table.item(row, int(self.TableCols.TYPE)).text(),
-                    self.data_table.item(row, int(self.TableCols.SIZE)).text(),
-                    self.data_table.item(row, int(self.TableCols.VALUE)).text(),
-                    self.data_table.item(row, int(self.TableCols.TIME)).text(),
-                ])
-
-            self.data_table.setSortingEnabled(True)
+
+            # export in the order shown in the table
+            columns = (self.TableCols.NAME, self.TableCols.REGISTER, self.TableCols.ADDR, self.TableCols.TYPE,
+                       self.TableCols.SIZE, self.TableCols.VALUE, self.TableCols.TIME)
+            for proxy_row in range(self.proxy.rowCount()):
+                row = self.proxy.mapToSource(self.proxy.index(proxy_row, 0)).row()
+                writer.writerow([self.model.text(row, int(col)) for col in columns])
+
             self.exec_mutex.unlock()
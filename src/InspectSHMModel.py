@@ -0,0 +1,137 @@
+import enum
+
+from PySide6 import QtCore
+from PySide6.QtCore import Qt, QModelIndex
+from PySide6.QtGui import QFontDatabase
+
+
+class InspectSHMModel(QtCore.QAbstractTableModel):
+    """
+    @brief table model of the inspected values
+
+    The table content is kept in a column store (one list per column). Value updates only emit dataChanged for the
+    rows whose value, endianness or time actually changed.
+    """
+
+    class TableCols(enum.IntEnum):
+        NAME = 0
+        REGISTER = 1
+        ADDR = 2
+        TYPE = 3
+        SIZE = 4
+        ENDIAN = 5
+        VALUE = 6
+        MIN = 7
+        MAX = 8
+        TIME = 9
+        BUTTON = 10
+
+    HEADER = ["Name", "Register", "Address", "Data Type", "Size", "Endianness", "Value", "Min", "Max", "Time", ""]
+    FIXED_FONT_COLS = (TableCols.ADDR, TableCols.SIZE, TableCols.VALUE, TableCols.MIN, TableCols.MAX)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super(InspectSHMModel, self).__init__(parent)
+
+        self.fixed_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+
+        # column store
+        self.columns: list[list[str]] = [[] for _ in self.TableCols]
+        self.keys: list[tuple[str, str]] = []
+        self.row_of: dict[tuple[str, str], int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.keys)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.TableCols)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADER[section]
+        return super(InspectSHMModel, self).headerData(section, orientation, role)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        col = index.column()
+        if role == Qt.DisplayRole:
+            return self.columns[col][index.row()]
+        elif role == Qt.FontRole:
+            if col in self.FIXED_FONT_COLS:
+                return self.fixed_font
+        elif role == Qt.TextAlignmentRole:
+            if col in self.FIXED_FONT_COLS:
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            if col == self.TableCols.BUTTON:
+                return int(Qt.AlignCenter)
+        return None
+
+    def add_row(self, name: str, register: str, reg_addr: str, type_str: str, size: str, identifier: str) -> None:
+        row = len(self.keys)
+        self.beginInsertRows(QModelIndex(), row, row)
+        row_values = (name, register, reg_addr, type_str, size, "####", "#####", "", "", "#####", "del")
+        for column, value in zip(self.columns, row_values):
+            column.append(value)
+        self.keys.append((register, identifier))
+        self.row_of[(register, identifier)] = row
+        self.endInsertRows()
+
+    def remove_row(self, row: int) -> tuple[str, str]:
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column in self.columns:
+            del column[row]
+        key = self.keys.pop(row)
+        self.row_of = {k: i for i, k in enumerate(self.keys)}
+        self.endRemoveRows()
+        return key
+
+    def clear(self) -> None:
+        self.beginResetModel()
+        self.columns = [[] for _ in self.TableCols]
+        self.keys = []
+        self.row_of = {}
+        self.endResetModel()
+
+    def key(self, row: int) -> tuple[str, str]:
+        return self.keys[row]
+
+    def text(self, row: int, col: int) -> str:
+        return self.columns[col][row]
+
+    def set_values(self, updates: list[tuple[str, str, str, str | None, str, str]], time_str: str) -> None:
+        """
+        @brief apply new values
+        @param updates list of (register, identifier, value, endian, min, max)
+        @param time_str time of the read, set only for the rows in updates
+        """
+        values = self.columns[self.TableCols.VALUE]
+        endians = self.columns[self.TableCols.ENDIAN]
+        mins = self.columns[self.TableCols.MIN]
+        maxs = self.columns[self.TableCols.MAX]
+        times = self.columns[self.TableCols.TIME]
+        changed = []
+        for register, identifier, value, endian, min_value, max_value in updates:
+            row = self.row_of.get((register, identifier))
+            if row is None:
+                continue
+            endian = endian or ""
+            if values[row] != value or endians[row] != endian or mins[row] != min_value or maxs[row] != max_value \
+                    or times[row] != time_str:
+                values[row] = value
+                endians[row] = endian
+                mins[row] = min_value
+                maxs[row] = max_value
+                times[row] = time_str
+                changed.append(row)
+
+        # one dataChanged per contiguous range of changed rows
+        changed.sort()
+        first = None
+        for i, row in enumerate(changed):
+            if first is None:
+                first = row
+            if i + 1 == len(changed) or changed[i + 1] != row + 1:
+                self.dataChanged.emit(self.index(first, self.TableCols.ENDIAN), self.index(row, self.TableCols.TIME),
+                                      [Qt.DisplayRole])
+                first = None
@@ -1,9 +1,10 @@
 import os
 import shlex
+from datetime import datetime
 from PySide6 import QtWidgets
-from PySide6.QtCore import QRegularExpression, QProcess
+from PySide6.QtCore import QRegularExpression, QProcess, QTimer
 from PySide6.QtGui import QRegularExpressionValidator
-from PySide6.QtWidgets import QFileDialog, QMessageBox
+from PySide6.QtWidgets import QFileDialog, QMessageBox, QPushButton, QInputDialog, QMenu
 
 from . import MBConfig
 from . import SHMTools
@@ -12,6 +13,8 @@ from .py_ui import Ui_MainWindow
 from .MBxxOutput import MBxxOutput
 from . import constants
 from .MBConfig import MBConfig
+from .SHMReplay import SHMRecording
+from .SHMSnapshots import SnapshotStore
 
 
 class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
@@ -511,9 +514,13 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
         self.__shm_tools_init_hexdump_gui()
         self.__shm_tools_init_random_gui()
         self.__shm_tools_init_dump_gui()
+        self.__shm_tools_init_record_gui()
         self.__shm_tools_init_load_gui()
+        self.__shm_tools_init_replay_gui()
+        self.__shm_tools_init_snapshot_gui()
         self.__shm_tools_init_inspect_gui()
         self.__shm_tools_init_set_gui()
+        self.__shm_tools_init_compare_gui()
 
         self.clien_id_selector.currentTextChanged.connect(self.__enable_tool_buttons)
 
@@ -725,6 +732,85 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
         self.tool_dump_ai.clicked.connect(on_dump_ai)
 
+    def __shm_tools_init_record_gui(self) -> None:
+        """
+        @brief record buttons next to the dump buttons
+        """
+        self.tool_record: dict[str, QPushButton] = {}
+        self.tool_record_shm_names: dict[str, str] = {}
+        self.record_stats_timer = QTimer()
+        self.record_stats_timer.timeout.connect(self.__show_record_stats)
+
+        dump_files = {
+            "DO": self.tool_dump_do_file,
+            "DI": self.tool_dump_di_file,
+            "AO": self.tool_dump_ao_file,
+            "AI": self.tool_dump_ai_file,
+        }
+        for row, (register, dump_file) in enumerate(dump_files.items()):
+            button = QPushButton("record", self.widget_20)
+            button.setCheckable(True)
+            button.setToolTip(f"record {register} register changes (delta compressed)")
+            button.toggled.connect(lambda checked, r=register, f=dump_file: self.__on_record_toggled(r, f, checked))
+            self.gridLayout_28.addWidget(button, row, 4, 1, 1)
+            self.tool_record[register] = button
+
+    def __on_record_toggled(self, register: str, dump_file, checked: bool) -> None:
+        button = self.tool_record[register]
+        if not checked:
+            if register in self.tool_record_shm_names:
+                self.shm_tools.stop_recorder(self.tool_record_shm_names.pop(register))
+            button.setText("record")
+            if len(self.tool_record_shm_names) == 0:
+                self.record_stats_timer.stop()
+            return
+
+        def cancel():
+            button.blockSignals(True)
+            button.setChecked(False)
+            button.blockSignals(False)
+
+        shm_name = f"{self.__get_shm_name_prefix()}{register}"
+        text = dump_file.text()
+        filename = text if len(text) else f"{os.getcwd()}/{shm_name}"
+        file_name, _ = QFileDialog.getSaveFileName(self, caption=f"select {register} register recording file",
+                                                   dir=f"{filename}.shmrec")
+        if not len(file_name):
+            cancel()
+            return
+
+        rate, ok = QInputDialog.getInt(self, "Record", "Sample rate [Hz]:", 100, 1, 1000)
+        if not ok:
+            cancel()
+            return
+
+        try:
+            recorder = self.shm_tools.start_recorder(shm_name, file_name, rate,
+                                                     self.modbus_cfg.sem_name if self.modbus_cfg.sem_enable else None)
+        except Exception as e:
+            cancel()
+            QMessageBox.critical(self, "Error", f"Failed to start recording:\n{e}")
+            return
+
+        recorder.failed.connect(lambda msg: QMessageBox.critical(self, "Error", f"Recording failed:\n{msg}"))
+        self.tool_record_shm_names[register] = shm_name
+        button.setText("stop")
+        self.record_stats_timer.start(1000)
+
+    def __show_record_stats(self) -> None:
+        for register, shm_name in list(self.tool_record_shm_names.items()):
+            button = self.tool_record[register]
+            recorder = self.shm_tools.recorders.get(shm_name)
+            if recorder is None or recorder.isFinished():
+                # stopped with the tool windows or failed
+                self.shm_tools.stop_recorder(shm_name)
+                button.setChecked(False)
+                continue
+
+            samples, written, missed = recorder.take_stats()
+            button.setText(f"stop ({written / 1e3:.1f} kB/s)")
+            button.setToolTip(f"{samples} samples/s, {missed} missed, {written / 1e3:.1f} kB/s written to disk")
+
     def __shm_tools_init_load_gui(self):
         def on_load_do_file_dialog() -> None:
             text = self.tool_load_do_file.text()
@@ -831,6 +917,184 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
         self.tool_load_ai.clicked.connect(on_load_ai)
 
+    def __shm_tools_init_replay_gui(self) -> None:
+        """
+        @brief replay buttons next to the load buttons
+        """
+        self.tool_replay: dict[str, QPushButton] = {}
+        self.tool_replay_shm_names: dict[str, str] = {}
+        self.replay_stats_timer = QTimer()
+        self.replay_stats_timer.timeout.connect(self.__show_replay_stats)
+
+        load_files = {
+            "DO": self.tool_load_do_file,
+            "DI": self.tool_load_di_file,
+            "AO": self.tool_load_ao_file,
+            "AI": self.tool_load_ai_file,
+        }
+        for row, (register, load_file) in enumerate(load_files.items()):
+            button = QPushButton("replay", self.widget_22)
+            button.setCheckable(True)
+            button.setToolTip(f"replay a {register} register recording with the original timing")
+            button.toggled.connect(lambda checked, r=register, f=load_file: self.__on_replay_toggled(r, f, checked))
+            self.gridLayout_31.addWidget(button, row, 5, 1, 1)
+            self.tool_replay[register] = button
+
+    def __on_replay_toggled(self, register: str, load_file, checked: bool) -> None:
+        button = self.tool_replay[register]
+        if not checked:
+            if register in self.tool_replay_shm_names:
+                self.shm_tools.stop_replay(self.tool_replay_shm_names.pop(register))
+            button.setText("replay")
+            if len(self.tool_replay_shm_names) == 0:
+                self.replay_stats_timer.stop()
+            return
+
+        def cancel():
+            button.blockSignals(True)
+            button.setChecked(False)
+            button.blockSignals(False)
+
+        file_name = load_file.text()
+        if not len(file_name):
+            file_name, _ = QFileDialog.getOpenFileName(self, caption=f"select {register} register recording file",
+                                                       filter="Recording (*.shmrec);;All files (*)")
+            if not len(file_name):
+                cancel()
+                return
+
+        try:
+            recording = SHMRecording(file_name)
+            duration = recording.duration()
+            recording.close()
+        except RuntimeError as e:
+            cancel()
+            QMessageBox.critical(self, "Error", f"Failed to open recording:\n{e}")
+            return
+
+        speed, ok = QInputDialog.getDouble(self, "Replay", "Speed factor:", 1.0, 0.001, 1000.0, 3)
+        if not ok:
+            cancel()
+            return
+        seek, ok = QInputDialog.getDouble(self, "Replay", f"Start position [s] (duration {duration:.3f} s):", 0.0,
+                                          0.0, duration, 3)
+        if not ok:
+            cancel()
+            return
+        loop = QMessageBox.question(self, "Replay", "Loop the recording?") == QMessageBox.StandardButton.Yes
+
+        shm_name = f"{self.__get_shm_name_prefix()}{register}"
+        try:
+            replayer = self.shm_tools.start_replay(shm_name, file_name, speed, loop, seek,
+                                                   self.modbus_cfg.sem_name if self.modbus_cfg.sem_enable else None)
+        except Exception as e:
+            cancel()
+            QMessageBox.critical(self, "Error", f"Failed to start replay:\n{e}")
+            return
+
+        replayer.failed.connect(lambda msg: QMessageBox.critical(self, "Error", f"Replay failed:\n{msg}"))
+        self.tool_replay_shm_names[register] = shm_name
+        button.setText("stop")
+        self.replay_stats_timer.start(1000)
+
+    def __show_replay_stats(self) -> None:
+        for register, shm_name in list(self.tool_replay_shm_names.items()):
+            button = self.tool_replay[register]
+            replayer = self.shm_tools.replayers.get(shm_name)
+            if replayer is None or replayer.isFinished():
+                # finished, stopped with the tool windows or failed
+                self.shm_tools.stop_replay(shm_name)
+                button.setChecked(False)
+                continue
+
+            records, written, max_drift = replayer.take_stats()
+            button.setText(f"stop ({replayer.position:.1f} s)")
+            button.setToolTip(f"position {replayer.position:.3f} s, {records} records/s, {written / 1e3:.1f} kB/s, "
+                              f"max drift {max_drift * 1e3:.3f} ms")
+
+    def __shm_tools_init_snapshot_gui(self) -> None:
+        """
+        @brief snapshot buttons next to the dump and load buttons and snapshot menu
+        """
+        for row, register in enumerate(["DO", "DI", "AO", "AI"]):
+            save_button = QPushButton("snapshot", self.widget_20)
+            save_button.setToolTip(f"save the {register} registers in the snapshot library")
+            save_button.clicked.connect(lambda _, r=register: self.__on_save_snapshot(r))
+            self.gridLayout_28.addWidget(save_button, row, 5, 1, 1)
+
+            load_button = QPushButton("snapshot", self.widget_22)
+            load_button.setToolTip(f"load the {register} registers from the snapshot library")
+            load_button.clicked.connect(lambda _, r=register: self.__on_load_snapshot(r))
+            self.gridLayout_31.addWidget(load_button, row, 6, 1, 1)
+
+        self.menuSnapshots = QMenu("Snapshots", self.menubar)
+        self.menubar.insertMenu(self.menuHelp.menuAction(), self.menuSnapshots)
+        self.actionDeleteSnapshot = self.menuSnapshots.addAction("Delete snapshot...")
+        self.actionDeleteSnapshot.triggered.connect(self.__on_delete_snapshot)
+
+    def __on_save_snapshot(self, register: str) -> None:
+        name, ok = QInputDialog.getText(self, "Save snapshot", "Snapshot name:",
+                                        text=f"{register} {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+        if not ok or not len(name):
+            return
+
+        try:
+            store = SnapshotStore()
+            if name in store.snapshots and QMessageBox.question(
+                    self, "Save snapshot", f"Replace snapshot '{name}'?") != QMessageBox.StandardButton.Yes:
+                return
+            chunks, new = store.save(name, f"{self.__get_shm_name_prefix()}{register}", register,
+                                     self.modbus_cfg.sem_name if self.modbus_cfg.sem_enable else None)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to save snapshot:\n{e}")
+            return
+        QMessageBox.information(self, "Save snapshot", f"Snapshot '{name}' saved: {new} of {chunks} chunks stored, "
+                                                       f"{chunks - new} chunks already in the library.")
+
+    def __on_load_snapshot(self, register: str) -> None:
+        try:
+            store = SnapshotStore()
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Error", f"Failed to open snapshot library:\n{e}")
+            return
+
+        names = store.names(register)
+        if len(names) == 0:
+            QMessageBox.information(self, "Load snapshot", f"No {register} snapshots in the library.")
+            return
+        name, ok = QInputDialog.getItem(self, "Load snapshot", "Snapshot:", names, len(names) - 1, False)
+        if not ok:
+            return
+
+        try:
+            written, chunks = store.load(name, f"{self.__get_shm_name_prefix()}{register}",
+                                         self.modbus_cfg.sem_name if self.modbus_cfg.sem_enable else None)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Failed to load snapshot:\n{e}")
+            return
+        QMessageBox.information(self, "Load snapshot", f"Snapshot '{name}' loaded: {written} of {chunks} chunks "
+                                                       f"differed and were written.")
+
+    def __on_delete_snapshot(self) -> None:
+        try:
+            store = SnapshotStore()
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Error", f"Failed to open snapshot library:\n{e}")
+            return
+
+        names = store.names()
+        if len(names) == 0:
+            QMessageBox.information(self, "Delete snapshot", "The snapshot library is empty.")
+            return
+        name, ok = QInputDialog.getItem(self, "Delete snapshot", "Snapshot:", names, 0, False)
+        if not ok:
+            return
+
+        try:
+            store.delete(name)
+        except RuntimeError as e:
+            QMessageBox.critical(self, "Error", f"Failed to delete snapshot:\n{e}")
+
     def __shm_tools_init_inspect_gui(self):
         def on_button_tool_inspect() -> None:
             inspect_values = self.shm_tools.start_inspect_values(self.__get_shm_name_prefix(), self.modbus_cfg.do,
@@ -862,6 +1126,17 @@ class MainWindow(QtWidgets.QMainWindow, Ui_MainWindow):
 
         self.tool_set_values.clicked.connect(on_button_tool_set)
 
+    def __shm_tools_init_compare_gui(self):
+        self.tool_compare = QPushButton("compare segments", self.scrollAreaWidgetContents)
+        self.tool_compare.setToolTip("compare segments, dump files and snapshots register by register")
+        self.verticalLayout_6.insertWidget(self.verticalLayout_6.indexOf(self.tool_set_values) + 1, self.tool_compare)
+
+        def on_button_tool_compare() -> None:
+            self.shm_tools.start_compare(self.__get_shm_name_prefix(),
+                                         self.modbus_cfg.sem_name if self.modbus_cfg.sem_enable else None)
+
+        self.tool_compare.clicked.connect(on_button_tool_compare)
+
     def __close_tool_windows(self):
         """
         @brief close all tool windows
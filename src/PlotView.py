@@ -0,0 +1,205 @@
+import datetime
+from array import array
+
+from PySide6 import QtWidgets
+from PySide6.QtCore import QLineF
+from PySide6.QtGui import QColor, QFontMetrics, QPainter, QPalette, QPen
+
+from .SampleRing import SampleRing
+
+TRACE_COLORS = ["#1f77b4", "#ff7f0e", "#2ca02c", "#d62728", "#9467bd", "#8c564b", "#e377c2", "#7f7f7f"]
+MARGIN = 6
+
+
+class Decimator:
+    """
+    @brief incremental min/max decimation of one ring buffer column
+
+    The recorded samples are folded into at most max_buckets buckets (min, max, first and last value per bucket).
+    New samples are folded into the existing buckets; if there are too many buckets, neighbouring buckets are merged
+    and the number of samples per bucket doubles. Samples are therefore only visited once.
+    """
+
+    def __init__(self, ring: SampleRing, column: int, max_buckets: int) -> None:
+        self.ring = ring
+        self.column = ring.columns[column]
+        self.max_buckets = max_buckets
+        self.reset(ring.total - ring.count)
+
+    def reset(self, first: int) -> None:
+        self.per_bucket = 1
+        self.base = first  # sample number of the first sample of bucket 0
+        self.done = first  # next sample to fold
+        self.mins = array('d')
+        self.maxs = array('d')
+        self.firsts = array('d')
+        self.lasts = array('d')
+
+    def __len__(self) -> int:
+        return len(self.mins)
+
+    def update(self) -> bool:
+        """
+        @brief fold new samples
+        @return True if the buckets changed
+        """
+        total = self.ring.total
+        first = total - self.ring.count
+
+        if self.done < first:
+            # samples were overwritten before they were folded (or the ring was cleared)
+            self.reset(first)
+
+        # drop buckets that only contain overwritten samples
+        drop = (first - self.base) // self.per_bucket
+        if drop > 0:
+            for values in (self.mins, self.maxs, self.firsts, self.lasts):
+                del values[:drop]
+            self.base += drop * self.per_bucket
+
+        if self.done == total:
+            return drop > 0
+
+        n = self.done
+        while n < total:
+            bucket = (n - self.base) // self.per_bucket
+            end = min(self.base + (bucket + 1) * self.per_bucket, total)
+            views = self.ring.slices(self.column, n, end)
+            lo = min(min(v) for v in views)
+            hi = max(max(v) for v in views)
+            if bucket == len(self.mins):
+                self.mins.append(lo)
+                self.maxs.append(hi)
+                self.firsts.append(views[0][0])
+                self.lasts.append(views[-1][-1])
+            else:
+                self.mins[bucket] = min(self.mins[bucket], lo)
+                self.maxs[bucket] = max(self.maxs[bucket], hi)
+                self.lasts[bucket] = views[-1][-1]
+            n = end
+
+            if len(self.mins) > self.max_buckets:
+                self.__merge()
+
+        self.done = total
+        return True
+
+    def __merge(self) -> None:
+        odd = len(self.mins) % 2
+        self.mins = array('d', map(min, self.mins[0::2], self.mins[1::2])) + self.mins[len(self.mins) - odd:]
+        self.maxs = array('d', map(max, self.maxs[0::2], self.maxs[1::2])) + self.maxs[len(self.maxs) - odd:]
+        self.firsts = self.firsts[0::2]
+        self.lasts = self.lasts[1::2] + self.lasts[len(self.lasts) - odd:]
+        self.per_bucket *= 2
+
+
+class PlotView(QtWidgets.QWidget):
+    """
+    @brief plot of ring buffer columns over the recorded samples
+
+    Each trace is drawn from its min/max decimation (at most two buckets per pixel column), so the paint cost does
+    not depend on the number of recorded samples. Bool traces are drawn as step traces.
+    """
+
+    def __init__(self, parent: QtWidgets.QWidget | None = None) -> None:
+        super(PlotView, self).__init__(parent)
+
+        self.ring: SampleRing | None = None
+        self.traces: list[tuple[str, Decimator, bool]] = []
+        self.setMinimumSize(200, 100)
+
+    def set_source(self, ring: SampleRing, columns: list[int]) -> None:
+        self.ring = ring
+        buckets = max(self.width(), 1) * 2
+        self.traces = [(ring.names[c], Decimator(ring, c, buckets), ring.codes[c] == 'B') for c in columns]
+        self.update_data()
+
+    def update_data(self) -> None:
+        """
+        @brief fold new samples of the ring into the traces and repaint if necessary
+        """
+        if self.ring is None or self.ring.closed():
+            return
+        changed = False
+        for _, decimator, _ in self.traces:
+            changed |= decimator.update()
+        if changed:
+            self.update()
+
+    def resizeEvent(self, event) -> None:
+        super(PlotView, self).resizeEvent(event)
+        buckets = max(self.width(), 1) * 2
+        for _, decimator, _ in self.traces:
+            decimator.max_buckets = buckets
+
+    def paintEvent(self, event) -> None:
+        painter = QPainter(self)
+        palette = self.palette()
+        painter.fillRect(self.rect(), palette.color(QPalette.Base))
+
+        traces = [t for t in self.traces if len(t[1]) > 0]
+        if len(traces) == 0 or self.ring.closed():
+            painter.end()
+            return
+
+        metrics = QFontMetrics(self.font())
+        line_height = metrics.height()
+
+        lo = min(min(d.mins) for _, d, _ in traces)
+        hi = max(max(d.maxs) for _, d, _ in traces)
+        if hi == lo:
+            hi += 0.5
+            lo -= 0.5
+
+        left = MARGIN
+        top = MARGIN + line_height * len(traces)
+        width = self.width() - 2 * MARGIN
+        height = self.height() - top - MARGIN - line_height
+        if width <= 0 or height <= 0:
+            painter.end()
+            return
+
+        def y_pos(value: float) -> float:
+            return top + (hi - value) / (hi - lo) * height
+
+        # all traces share the same sample axis
+        first = min(d.base for _, d, _ in traces)
+        end = self.ring.total
+        scale = width / max(end - first, 1)
+
+        for i, (name, decimator, step) in enumerate(traces):
+            pen = QPen(QColor(TRACE_COLORS[i % len(TRACE_COLORS)]))
+            pen.setCosmetic(True)
+            painter.setPen(pen)
+            painter.drawText(left, MARGIN + line_height * i + metrics.ascent(), name)
+
+            lines = []
+            prev = None
+            for b in range(len(decimator)):
+                x = left + (decimator.base + b * decimator.per_bucket - first) * scale
+                lines.append(QLineF(x, y_pos(decimator.mins[b]), x, y_pos(decimator.maxs[b])))
+                if prev is not None:
+                    prev_x, prev_y = prev
+                    y = y_pos(decimator.firsts[b])
+                    if step:
+                        lines.append(QLineF(prev_x, prev_y, x, prev_y))
+                        lines.append(QLineF(x, prev_y, x, y))
+                    else:
+                        lines.append(QLineF(prev_x, prev_y, x, y))
+                prev = (x, y_pos(decimator.lasts[b]))
+            painter.drawLines(lines)
+
+        # axis labels: value range and time range
+        painter.setPen(palette.color(QPalette.Text))
+        painter.drawText(left, top + metrics.ascent(), f"{hi:g}")
+        painter.drawText(left, top + height, f"{lo:g}")
+
+        segments = self.ring.segments()
+        if segments:
+            start_time = datetime.datetime.fromtimestamp(self.ring.time[segments[0][0]]).strftime('%H:%M:%S.%f')
+            end_time = datetime.datetime.fromtimestamp(self.ring.time[segments[-1][1] - 1]).strftime('%H:%M:%S.%f')
+            y = self.height() - MARGIN
+            painter.drawText(left, y, start_time[:-3])
+            painter.drawText(self.width() - MARGIN - metrics.horizontalAdvance(end_time[:-3]), y, end_time[:-3])
+
+        painter.end()
@@ -0,0 +1,272 @@
+import array
+import os
+import sys
+import time
+
+from PySide6 import QtWidgets, QtCore
+from PySide6.QtCore import Qt, QModelIndex, QTimer
+from PySide6.QtGui import QFontDatabase
+from PySide6.QtWidgets import QFileDialog, QHeaderView
+
+from .py_ui import Ui_ShmCompare
+from .SHMDiff import changed_registers
+from .SHMMap import SHMMap
+from .SHMSnapshots import SnapshotStore
+
+SOURCE_KINDS = ["segment", "dump file", "snapshot"]
+DECODE_MODES = ["unsigned", "signed", "hex"]
+
+
+class DiffSource:
+    """
+    @brief one side of the comparison: a live shared memory segment, a dump file or a snapshot of the library
+
+    Dump files and snapshots are cached and only read again when the file (for snapshots the index of the library,
+    which changes whenever a snapshot is saved or deleted) was modified since the previous read (mtime or size).
+    """
+
+    def __init__(self, kind: str, value: str, semaphore: str | None = None) -> None:
+        if kind not in SOURCE_KINDS:
+            raise RuntimeError(f"unknown source '{kind}'")
+        if len(value) == 0:
+            raise RuntimeError(f"no {kind} selected")
+        self.kind = kind
+        self.value = value
+        self.semaphore = semaphore
+        self.shm: SHMMap | None = None
+        self.store: SnapshotStore | None = None
+        self.data: bytes | None = None
+        self.file_state: tuple[int, int] | None = None
+
+    def read(self) -> bytes:
+        match self.kind:
+            case "segment":
+                if self.shm is None:
+                    self.shm = SHMMap(self.value, self.semaphore)
+                return self.shm.read()
+            case "dump file":
+                return self.__cached(self.value, self.__read_dump)
+            case _:
+                if self.store is None:
+                    self.store = SnapshotStore()
+                return self.__cached(self.store.index_file, self.__read_snapshot)
+
+    def __read_dump(self) -> bytes:
+        with open(self.value, "rb") as f:
+            return f.read()
+
+    def __read_snapshot(self) -> bytes:
+        # the snapshot might have been saved again: reload the index
+        self.store = SnapshotStore(self.store.directory)
+        return self.store.read(self.value)
+
+    def __cached(self, path: str, read) -> bytes:
+        try:
+            stat = os.stat(path)
+            file_state = (stat.st_mtime_ns, stat.st_size)
+            if self.data is None or file_state != self.file_state:
+                self.data = read()
+                self.file_state = file_state
+        except OSError as e:
+            raise RuntimeError(f"failed to read '{path}': {e.strerror}")
+        return self.data
+
+    def close(self) -> None:
+        if self.shm:
+            self.shm.close()
+            self.shm = None
+
+
+class SHMCompareModel(QtCore.QAbstractTableModel):
+    """
+    @brief table model of the differing registers
+
+    Only the addresses of the differing registers and the two buffers are stored; the values are decoded when the
+    view requests them, so the model stays cheap for 65536 differing registers.
+    """
+
+    HEADER = ["Address", "A", "B", "Changed bits"]
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super(SHMCompareModel, self).__init__(parent)
+
+        self.fixed_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
+        self.registers = array.array('I')
+        self.a = b""
+        self.b = b""
+        self.register_size = 1
+        self.decode = DECODE_MODES[0]
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.registers)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADER)
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADER[section]
+        return super(SHMCompareModel, self).headerData(section, orientation, role)
+
+    def __value(self, data: bytes, register: int, signed: bool = False) -> int:
+        offset = register * self.register_size
+        return int.from_bytes(data[offset:offset + self.register_size], sys.byteorder, signed=signed)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        if role == Qt.DisplayRole:
+            register = self.registers[index.row()]
+            digits = self.register_size * 2
+            match index.column():
+                case 0:
+                    return f"0x{register:04x}"
+                case 1 | 2:
+                    value = self.__value(self.a if index.column() == 1 else self.b, register, self.decode == "signed")
+                    return f"0x{value:0{digits}x}" if self.decode == "hex" else f"{value}"
+                case _:
+                    changed = self.__value(self.a, register) ^ self.__value(self.b, register)
+                    return f"{changed:0{self.register_size * 8}b}"
+        if role == Qt.FontRole:
+            return self.fixed_font
+        if role == Qt.TextAlignmentRole:
+            return Qt.AlignRight | Qt.AlignVCenter
+        return None
+
+    def set_diff(self, a: bytes, b: bytes, registers: array.array, register_size: int, decode: str) -> None:
+        if registers == self.registers and register_size == self.register_size:
+            # same registers differ: keep the view (scroll position, selection) and only update the values
+            self.a, self.b, self.decode = a, b, decode
+            if len(registers) > 0:
+                self.dataChanged.emit(self.index(0, 1), self.index(len(registers) - 1, len(self.HEADER) - 1))
+            return
+
+        self.beginResetModel()
+        self.a, self.b, self.registers, self.register_size, self.decode = a, b, registers, register_size, decode
+        self.endResetModel()
+
+
+class SHMCompare(QtWidgets.QMainWindow, Ui_ShmCompare):
+    """
+    @brief compares two shared memory segments, dump files or snapshots register by register
+    """
+
+    closed = QtCore.Signal(object)
+
+    def __init__(self, shm_prefix: str, semaphore: str | None = None) -> None:
+        super(SHMCompare, self).__init__()
+        self.setupUi(self)
+
+        self.shm_prefix = shm_prefix
+        self.semaphore = semaphore
+        self.sources: list[DiffSource | None] = [None, None]
+
+        self.setWindowTitle(f"compare segments {shm_prefix}*")
+
+        # sources
+        self.source_kind = [self.combobox_kind_a, self.combobox_kind_b]
+        self.source_value = [self.combobox_value_a, self.combobox_value_b]
+        for i, browse in enumerate([self.button_browse_a, self.button_browse_b]):
+            self.source_kind[i].addItems(SOURCE_KINDS)
+            browse.clicked.connect(lambda _, row=i: self.on_browse(row))
+            self.source_kind[i].currentTextChanged.connect(lambda _, row=i: self.on_kind_changed(row))
+            self.source_value[i].currentTextChanged.connect(lambda _, row=i: self.on_source_changed(row))
+
+        # options
+        self.combobox_decode.addItems(DECODE_MODES)
+
+        # differing registers
+        self.model = SHMCompareModel(self)
+        self.view.setModel(self.model)
+        self.view.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Stretch)
+
+        # periodic re-diff
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.execute)
+
+        for i in range(2):
+            self.on_kind_changed(i)
+        self.source_value[1].setCurrentIndex(-1)
+
+        self.button_compare.clicked.connect(self.execute)
+        self.checkbox_auto.toggled.connect(self.on_auto_toggled)
+        self.spinbox_interval.valueChanged.connect(self.timer.setInterval)
+        self.combobox_register_size.currentIndexChanged.connect(self.execute)
+        self.combobox_decode.currentIndexChanged.connect(self.execute)
+
+    def on_kind_changed(self, i: int) -> None:
+        kind = self.source_kind[i].currentText()
+        value = self.source_value[i]
+        value.blockSignals(True)
+        value.clear()
+        match kind:
+            case "segment":
+                value.addItems([f"{self.shm_prefix}{register}" for register in ["DO", "DI", "AO", "AI"]])
+                value.setCurrentIndex(2)
+            case "snapshot":
+                try:
+                    value.addItems(SnapshotStore().names())
+                except RuntimeError as e:
+                    self.statusbar.showMessage(f"{e}")
+        value.blockSignals(False)
+        self.on_source_changed(i)
+
+    def on_browse(self, i: int) -> None:
+        file_name, _ = QFileDialog.getOpenFileName(self, caption="select dump file",
+                                                   dir=self.source_value[i].currentText())
+        if len(file_name):
+            self.source_kind[i].setCurrentText("dump file")
+            self.source_value[i].setCurrentText(file_name)
+
+    def on_source_changed(self, i: int) -> None:
+        if self.sources[i]:
+            self.sources[i].close()
+            self.sources[i] = None
+
+        # registers of the digital segments are one byte, of the analog segments two bytes
+        value = self.source_value[i].currentText()
+        if self.source_kind[i].currentText() == "segment" and value[-2:] in ("DO", "DI", "AO", "AI"):
+            self.combobox_register_size.setCurrentIndex(0 if value[-2:] in ("DO", "DI") else 1)
+
+    def on_auto_toggled(self, checked: bool) -> None:
+        if checked:
+            self.timer.start(self.spinbox_interval.value())
+        else:
+            self.timer.stop()
+
+    def execute(self) -> None:
+        try:
+            data = []
+            for i in range(2):
+                if self.sources[i] is None:
+                    self.sources[i] = DiffSource(self.source_kind[i].currentText(),
+                                                 self.source_value[i].currentText(), self.semaphore)
+                data.append(self.sources[i].read())
+        except RuntimeError as e:
+            self.checkbox_auto.setChecked(False)
+            self.statusbar.showMessage(f"{e}")
+            return
+
+        a, b = data
+        register_size = self.combobox_register_size.currentIndex() + 1
+        size = min(len(a), len(b)) // register_size * register_size
+
+        start = time.perf_counter()
+        registers = changed_registers(memoryview(a)[:size], memoryview(b)[:size], register_size)
+        duration = time.perf_counter() - start
+
+        self.model.set_diff(a, b, registers, register_size, self.combobox_decode.currentText())
+
+        message = f"{len(registers)} of {size // register_size} registers differ (diff {duration * 1e3:.2f} ms)"
+        if len(a) != len(b):
+            message += f", size differs: A {len(a)} bytes, B {len(b)} bytes"
+        self.statusbar.showMessage(message)
+
+    def closeEvent(self, event):
+        super(SHMCompare, self).closeEvent(event)
+        self.timer.stop()
+        for source in self.sources:
+            if source:
+                source.close()
+        self.closed.emit(self)
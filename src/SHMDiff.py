@@ -0,0 +1,125 @@
+import array
+import re
+import struct
+
+_NONZERO_RUN = re.compile(rb"[^\x00]+")
+
+# runs of a delta; gaps of up to 8 unchanged bytes are included in a run, because they are cheaper than the header of
+# a new run
+_DELTA_RUN = re.compile(rb"[^\x00]+(?:\x00{1,8}[^\x00]+)*")
+
+# header of a run in a delta: offset, length
+RUN = struct.Struct("<II")
+
+# 256 entry lookup table to decrement all fade counters at once (saturating at 0)
+_DECREMENT_TABLE = bytes(max(i - 1, 0) for i in range(256))
+
+
+def xor_bytes(a: bytes | bytearray | memoryview, b: bytes | bytearray | memoryview) -> bytes:
+    """
+    @brief byte wise xor of two equally sized buffers (computed as one big integer operation)
+    """
+    if len(a) != len(b):
+        raise RuntimeError(f"size mismatch: {len(a)} != {len(b)}")
+    return (int.from_bytes(a, "little") ^ int.from_bytes(b, "little")).to_bytes(len(a), "little")
+
+
+def nonzero_ranges(data: bytes | bytearray) -> list[tuple[int, int]]:
+    """
+    @brief [start, end) ranges of all non zero bytes
+    """
+    return [m.span() for m in _NONZERO_RUN.finditer(data)]
+
+
+def changed_ranges(old: bytes | bytearray | memoryview, new: bytes | bytearray | memoryview) -> list[tuple[int, int]]:
+    """
+    @brief [start, end) ranges of all bytes that differ between old and new
+    """
+    if old == new:
+        return []
+    return nonzero_ranges(xor_bytes(old, new))
+
+
+def ranges_to_rows(ranges: list[tuple[int, int]], row_size: int) -> list[tuple[int, int]]:
+    """
+    @brief convert byte ranges to merged, inclusive row ranges
+    """
+    rows = []
+    for start, end in ranges:
+        first = start // row_size
+        last = (end - 1) // row_size
+        if rows and first <= rows[-1][1] + 1:
+            rows[-1] = (rows[-1][0], max(rows[-1][1], last))
+        else:
+            rows.append((first, last))
+    return rows
+
+
+def changed_registers(old: bytes | bytearray | memoryview, new: bytes | bytearray | memoryview,
+                      register_size: int) -> array.array:
+    """
+    @brief addresses of all registers that differ between old and new
+    """
+    registers = array.array('I')
+    for first, last in ranges_to_rows(changed_ranges(old, new), register_size):
+        registers.extend(range(first, last + 1))
+    return registers
+
+
+def encode_delta(prev: bytes | bytearray, cur: bytes | bytearray) -> bytes:
+    """
+    @brief delta of two equally sized frames: the runs of changed bytes as RUN header (offset, length) + xor
+    """
+    diff = xor_bytes(prev, cur)
+    return b"".join(RUN.pack(m.start(), m.end() - m.start()) + m.group() for m in _DELTA_RUN.finditer(diff))
+
+
+def apply_delta(frame: bytearray, delta: bytes | memoryview) -> None:
+    """
+    @brief apply a delta (see encode_delta) to a frame in place
+    """
+    pos = 0
+    while pos < len(delta):
+        offset, length = RUN.unpack_from(delta, pos)
+        pos += RUN.size
+        end = offset + length
+        frame[offset:end] = xor_bytes(frame[offset:end], delta[pos:pos + length])
+        pos += length
+
+
+class ChangeTracker:
+    """
+    @brief tracks byte changes between consecutive snapshots
+
+    Each changed byte gets a fade counter that starts at fade_ticks and is decremented with every snapshot.
+    """
+
+    def __init__(self, fade_ticks: int = 10) -> None:
+        self.fade_ticks = max(min(fade_ticks, 255), 1)
+        self.previous: bytes | None = None
+        self.ages = bytearray()
+
+    def reset(self) -> None:
+        self.previous = None
+        self.ages = bytearray()
+
+    def update(self, data: bytes) -> list[tuple[int, int]] | None:
+        """
+        @brief add a new snapshot
+        @return byte ranges that need to be repainted, None if everything needs to be repainted
+        """
+        if self.previous is None or len(self.previous) != len(data):
+            self.previous = data
+            self.ages = bytearray(len(data))
+            return None
+
+        fading = nonzero_ranges(self.ages)
+        self.ages = bytearray(self.ages.translate(_DECREMENT_TABLE))
+
+        changed = changed_ranges(self.previous, data)
+        fill = bytes([self.fade_ticks])
+        for start, end in changed:
+            self.ages[start:end] = fill * (end - start)
+
+        self.previous = data
+        return sorted(fading + changed)
@@ -0,0 +1,76 @@
+import os
+from typing import Callable
+
+from .SHMMap import SHMMap
+
+# transfers between file and memory are split into chunks of this size to report progress
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# translation table that inverts all bits of a byte
+INVERT_TABLE = bytes(255 - i for i in range(256))
+
+# progress callback: (bytes done, bytes total)
+Progress = Callable[[int, int], None]
+
+
+def dump_shm(shm_name: str, filename: str, semaphore: str | None = None, progress: Progress | None = None) -> int:
+    """
+    @brief write the content of a shared memory to a file (like dump-shm)
+
+    The semaphore is only held while the shared memory is copied to a private buffer, not during the file I/O.
+    @return number of bytes written
+    """
+    with SHMMap(shm_name, semaphore) as shm:
+        data = memoryview(shm.read())
+
+    total = len(data)
+    try:
+        with open(filename, "wb") as f:
+            for offset in range(0, total, CHUNK_SIZE):
+                f.write(data[offset:offset + CHUNK_SIZE])
+                if progress:
+                    progress(min(offset + CHUNK_SIZE, total), total)
+    except OSError as e:
+        raise RuntimeError(f"failed to write '{filename}': {e.strerror}")
+    return total
+
+
+def load_shm(shm_name: str, filename: str, invert: bool = False, repeat: bool = False, semaphore: str | None = None,
+             progress: Progress | None = None) -> int:
+    """
+    @brief write the content of a file to a shared memory (like write-shm)
+
+    The file is read into a private buffer (readinto), inverted (-i) with one translate call and repeated (-r) until
+    the shared memory is full. The semaphore is only held while the buffer is copied to the shared memory.
+    @return number of bytes written to the shared memory
+    """
+    with SHMMap(shm_name, semaphore, writable=True) as shm:
+        try:
+            with open(filename, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                if size > shm.size:
+                    raise RuntimeError(f"file '{filename}' ({size} bytes) is larger than shared memory "
+                                       f"'{shm_name}' ({shm.size} bytes)")
+                buffer = bytearray(size)
+                view = memoryview(buffer)
+                done = 0
+                while done < size:
+                    count = f.readinto(view[done:done + CHUNK_SIZE])
+                    if count == 0:
+                        raise RuntimeError(f"unexpected end of file '{filename}'")
+                    done += count
+                    if progress:
+                        progress(done, size)
+        except OSError as e:
+            raise RuntimeError(f"failed to read '{filename}': {e.strerror}")
+
+        data = buffer
+        if invert:
+            data = data.translate(INVERT_TABLE)
+        if repeat and size < shm.size:
+            if size == 0:
+                raise RuntimeError(f"file '{filename}' is empty")
+            data = (data * -(-shm.size // size))[:shm.size]
+
+        shm.write(0, data)
+        return len(data)
@@ -0,0 +1,259 @@
+import itertools
+import operator
+import struct
+import time
+
+from .SHMMap import SHMMap, LockStats, read_consistent
+
+INT_TYPES = {8: 'b', 16: 'h', 32: 'i', 64: 'q'}
+FLOAT_TYPES = {32: 'f', 64: 'd'}
+ENDIAN_NAMES = {'b': "big", 'l': "little"}
+
+
+class SHMFormatField:
+    """
+    @brief one parsed cfg line (addr[:bit],type,name) as used by shm-format
+    """
+
+    def __init__(self, cfg_line: str) -> None:
+        try:
+            addr_str, type_str, self.name = cfg_line.strip().split(',', maxsplit=2)
+        except ValueError:
+            raise RuntimeError(f"invalid cfg line '{cfg_line}'")
+
+        addr_parts = addr_str.split(':')
+        self.offset = int(addr_parts[0])
+        self.bit = int(addr_parts[1]) if len(addr_parts) > 1 else 0
+        if self.offset < 0 or not 0 <= self.bit < 8:
+            raise RuntimeError(f"invalid address in cfg line '{cfg_line}'")
+
+        self.endian: str | None = None
+        self.reverse = False
+
+        kind = type_str[0]
+        if kind == 'b' and len(type_str) == 1:
+            self.kind = "bool"
+            self.type_name = "bool"
+            self.size = 1
+            self.code = 'B'
+        elif kind == 's':
+            self.kind = "string"
+            self.size = int(type_str[1:])
+            self.type_name = "string"
+            self.code = f"{self.size}s"
+        elif kind in "uif":
+            digits = type_str[1:].rstrip("lbr")
+            bits = int(digits)
+            flags = type_str[1 + len(digits):]
+            if kind == 'f':
+                if bits not in FLOAT_TYPES:
+                    raise RuntimeError(f"invalid float size in cfg line '{cfg_line}'")
+                self.code = FLOAT_TYPES[bits]
+                self.kind = "float"
+                self.type_name = "float" if bits == 32 else "double"
+            else:
+                if bits not in INT_TYPES:
+                    raise RuntimeError(f"invalid int size in cfg line '{cfg_line}'")
+                self.code = INT_TYPES[bits] if kind == 'i' else INT_TYPES[bits].upper()
+                self.kind = "int"
+                self.type_name = f"{'int' if kind == 'i' else 'uint'}{bits}"
+
+            if bits > 8:
+                if not flags or flags[0] not in "lb":
+                    raise RuntimeError(f"missing endian in cfg line '{cfg_line}'")
+                self.endian = flags[0]
+                self.reverse = flags[1:] == 'r'
+                if self.reverse and bits < 32:
+                    raise RuntimeError(f"word swap requires at least 32 bit in cfg line '{cfg_line}'")
+
+            self.size = bits // 8
+        else:
+            raise RuntimeError(f"invalid type in cfg line '{cfg_line}'")
+
+    def byte_order(self) -> str:
+        return '>' if self.endian == 'b' else '<'
+
+    def endian_name(self) -> str | None:
+        if self.endian is None:
+            return None
+        name = ENDIAN_NAMES[self.endian]
+        return f"{name}-swap16" if self.reverse else name
+
+    def to_element(self, value) -> dict:
+        element = {"name": self.name, "type": self.type_name, "data": value}
+        if self.endian is not None:
+            element["endian"] = self.endian_name()
+        return element
+
+
+def _lanes(fields: list[tuple[int, SHMFormatField]]) -> list[list[tuple[int, SHMFormatField]]]:
+    """
+    @brief distribute fields to as few lanes as possible, so that the fields of one lane do not overlap
+    """
+    lanes = []
+    ends = []
+    for index, field in sorted(fields, key=lambda x: x[1].offset):
+        for i, end in enumerate(ends):
+            if end <= field.offset:
+                lanes[i].append((index, field))
+                ends[i] = field.offset + field.size
+                break
+        else:
+            lanes.append([(index, field)])
+            ends.append(field.offset + field.size)
+    return lanes
+
+
+class _Gather:
+    """
+    @brief gathers the fields of one lane with a single struct call (gaps are skipped with pad bytes)
+    """
+
+    def __init__(self, byte_order: str, lane: list[tuple[int, SHMFormatField]], base: int, raw: bool) -> None:
+        self.start = lane[0][1].offset - base
+        self.indices = [index for index, _ in lane]
+
+        fmt = byte_order
+        pos = lane[0][1].offset
+        for _, field in lane:
+            gap = field.offset - pos
+            if gap > 0:
+                fmt += f"{gap}x"
+            fmt += f"{field.size}s" if raw else field.code
+            pos = field.offset + field.size
+        self.struct = struct.Struct(fmt)
+
+    def gather(self, data: bytes) -> tuple:
+        return self.struct.unpack_from(data, self.start)
+
+
+class _SwappedGroup:
+    """
+    @brief word swapped ('r') fields of the same size and byte order
+
+    The raw bytes of all fields are gathered, the 16 bit words of all fields are reversed at once with extended
+    slice assignments and the result is unpacked with a single struct call.
+    """
+
+    def __init__(self, byte_order: str, size: int, fields: list[tuple[int, SHMFormatField]], base: int) -> None:
+        self.size = size
+        self.gathers = [_Gather('<', lane, base, True) for lane in _lanes(fields)]
+        self.indices = [index for g in self.gathers for index in g.indices]
+        codes = {index: field.code for index, field in fields}
+        self.struct = struct.Struct(byte_order + "".join(codes[i] for i in self.indices))
+
+    def gather(self, data: bytes) -> tuple:
+        raw = b"".join(value for g in self.gathers for value in g.gather(data))
+        swapped = bytearray(len(raw))
+        words = self.size // 2
+        for w in range(words):
+            src = 2 * (words - 1 - w)
+            swapped[2 * w::self.size] = raw[src::self.size]
+            swapped[2 * w + 1::self.size] = raw[src + 1::self.size]
+        return self.struct.unpack(swapped)
+
+
+class _SegmentPlan:
+    """
+    @brief extraction plan for all fields of one shared memory
+    """
+
+    def __init__(self, fields: list[SHMFormatField]) -> None:
+        self.fields = fields
+        self.start = min(f.offset for f in fields)
+        self.end = max(f.offset + f.size for f in fields)
+
+        # group fields by byte order (fields without byte order use little endian) and word swapped fields by size
+        plain: dict[str, list] = {'<': [], '>': []}
+        swapped: dict[tuple[str, int], list] = {}
+        for index, field in enumerate(fields):
+            if field.reverse:
+                swapped.setdefault((field.byte_order(), field.size), []).append((index, field))
+            else:
+                plain[field.byte_order()].append((index, field))
+
+        self.gathers = []
+        for byte_order, group in plain.items():
+            self.gathers += [_Gather(byte_order, lane, self.start, False) for lane in _lanes(group)]
+        for (byte_order, size), group in swapped.items():
+            self.gathers.append(_SwappedGroup(byte_order, size, group, self.start))
+
+        # permutation from gathered order to field order
+        gathered_order = [index for g in self.gathers for index in g.indices]
+        position = [0] * len(fields)
+        for pos, index in enumerate(gathered_order):
+            position[index] = pos
+        self.permute = operator.itemgetter(*position) if len(position) > 1 else lambda x: (x[position[0]],)
+
+        self.bool_fields = [(i, f.bit) for i, f in enumerate(fields) if f.kind == "bool"]
+        self.string_fields = [i for i, f in enumerate(fields) if f.kind == "string"]
+
+    def decode(self, data: bytes) -> list:
+        gathered = tuple(itertools.chain.from_iterable(g.gather(data) for g in self.gathers))
+        values = list(self.permute(gathered))
+
+        for i, bit in self.bool_fields:
+            values[i] = bool((values[i] >> bit) & 0x1)
+        for i in self.string_fields:
+            values[i] = values[i].split(b'\0', maxsplit=1)[0].decode("utf-8", errors="replace")
+        return values
+
+
+class SHMFormatPlan:
+    """
+    @brief precompiled extraction plan for a set of shm-format configurations
+
+    The plan is compiled once from the cfg lines of each shared memory and decodes the configured values from
+    copies of the shared memories, without temporary files, subprocess or json.
+    Fields are grouped by byte order; each group is gathered with one struct call per shared memory and tick.
+    """
+
+    def __init__(self, cfg_lines: dict[str, list[str]]) -> None:
+        self.fields: dict[str, list[SHMFormatField]] = {}
+        self.spans: dict[str, tuple[int, int]] = {}
+        self.segments: dict[str, _SegmentPlan] = {}
+        self.lock_stats = LockStats()
+
+        for shm_name, lines in cfg_lines.items():
+            fields = [SHMFormatField(line) for line in lines]
+            if len(fields) == 0:
+                continue
+            segment = _SegmentPlan(fields)
+            self.fields[shm_name] = fields
+            self.spans[shm_name] = (segment.start, segment.end)
+            self.segments[shm_name] = segment
+
+    def check_size(self, shm_name: str, shm_size: int) -> None:
+        end = self.spans[shm_name][1]
+        if end > shm_size:
+            raise RuntimeError(f"shared memory {shm_name} is to small ({shm_size} bytes) for configured values "
+                               f"({end} bytes)")
+
+    def read(self, shm: dict[str, SHMMap]) -> dict[str, bytes]:
+        """
+        @brief copy the required range of each shared memory
+
+        All ranges are copied in one critical section of the semaphore, so the values of all shared memories are
+        consistent. Decoding happens afterwards, without holding the semaphore. The hold time is added to lock_stats.
+        """
+        names = list(self.spans.keys())
+        copies = read_consistent([(shm[name], start, end - start) for name, (start, end) in self.spans.items()],
+                                 self.lock_stats)
+        return dict(zip(names, copies))
+
+    def decode(self, snapshots: dict[str, bytes]) -> dict[str, list]:
+        return {shm_name: segment.decode(snapshots[shm_name]) for shm_name, segment in self.segments.items()}
+
+    def to_shm_format_dict(self, values: dict[str, list], timestamp: float | None = None) -> dict:
+        """
+        @brief create the same data structure that shm-format prints as json
+        """
+        shm_data = {}
+        for shm_name, fields in self.fields.items():
+            shm_data[shm_name] = {
+                "data": [field.to_element(value) for field, value in zip(fields, values[shm_name])]
+            }
+        return {
+            "time": time.time() if timestamp is None else timestamp,
+            "shm_data": shm_data,
+        }
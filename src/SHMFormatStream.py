@@ -0,0 +1,117 @@
+import json
+import os
+import sys
+
+from PySide6 import QtCore
+from PySide6.QtCore import QProcess
+
+from .SHMFormat import SHMFormatPlan
+
+
+class SHMFormatStream(QtCore.QObject):
+    """
+    @brief client of a persistent SHMFormatStreamProcess
+
+    The process is started once per layout. Each tick writes one line to the process; the answers are read
+    incrementally and delivered as shm-format data structure via the signal values.
+    """
+
+    values = QtCore.Signal(object)
+    error = QtCore.Signal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super(SHMFormatStream, self).__init__(parent)
+
+        self.process: QProcess | None = None
+        self.plan: SHMFormatPlan | None = None
+        self.buffer = b""
+        self.pending = 0
+        self.skipped = 0
+
+    def running(self) -> bool:
+        return self.process is not None
+
+    def busy(self) -> bool:
+        return self.pending > 0
+
+    def start(self, plan: SHMFormatPlan, cfg_lines: dict[str, list[str]], semaphore: str | None = None) -> None:
+        self.stop()
+
+        # SHMFormatStreamProcess.main() is run in a new interpreter; the package root is added to the module search
+        # path, so the process does not depend on the working directory or on the package being installed
+        package_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        cmd_args = ["-c", f"import sys; sys.path.insert(0, {package_root!r}); "
+                          f"from {__package__}.SHMFormatStreamProcess import main; main()"]
+        if semaphore:
+            cmd_args.append("--semaphore")
+            cmd_args.append(semaphore)
+
+        self.plan = plan
+        self.buffer = b""
+        self.pending = 0
+        self.process = QProcess(self)
+        self.process.readyReadStandardOutput.connect(self.__on_ready_read)
+        self.process.finished.connect(self.__on_finished)
+        self.process.start(sys.executable, cmd_args)
+        if not self.process.waitForStarted(1000):
+            self.process = None
+            raise RuntimeError("failed to start shm-format stream process")
+
+        layout = {shm_name: lines for shm_name, lines in cfg_lines.items() if shm_name in plan.fields}
+        self.process.write(json.dumps(layout).encode("utf-8") + b"\n")
+
+    def tick(self) -> bool:
+        """
+        @brief request one set of values, unless the previous request has not been answered yet
+        @return False if the tick was skipped
+        """
+        if self.process is None:
+            return False
+        if self.pending > 0:
+            self.skipped += 1
+            return False
+        self.pending += 1
+        self.process.write(b"\n")
+        return True
+
+    def __on_ready_read(self) -> None:
+        if self.sender() is not self.process:
+            return
+        self.buffer += bytes(self.process.readAllStandardOutput())
+        *lines, self.buffer = self.buffer.split(b"\n")
+        for line in lines:
+            self.pending = max(self.pending - 1, 0)
+            try:
+                data = json.loads(line)
+            except json.JSONDecodeError as e:
+                self.error.emit(f"failed to parse shm-format stream data: {e}")
+                continue
+
+            if "error" in data:
+                self.error.emit(data["error"])
+            else:
+                self.values.emit(self.plan.to_shm_format_dict(data["values"], data["time"]))
+
+    def __on_finished(self, exit_code: int, _exit_status) -> None:
+        process = self.process
+        self.process = None
+        self.pending = 0
+        if process is not None:
+            stderr = bytes(process.readAllStandardError()).decode("utf-8")
+            self.error.emit(f"shm-format stream terminated ({exit_code}): {stderr}")
+            process.deleteLater()
+
+    def stop(self) -> None:
+        if self.process is None:
+            return
+
+        process = self.process
+        self.process = None
+        # waitForFinished delivers pending output synchronously; it belongs to the stopped layout and is discarded
+        process.blockSignals(True)
+        process.closeWriteChannel()
+        if not process.waitForFinished(1000):
+            process.kill()
+            process.waitForFinished(100)
+        process.deleteLater()
+
@@ -0,0 +1,52 @@
+"""
+Long running stand-in for shm-format.
+
+The layout is received once as first line on stdin (json object: shared memory name -> list of cfg lines).
+Afterwards every line on stdin triggers one read of the shared memories and one json line on stdout:
+    {"time": <timestamp>, "values": {<shared memory name>: [<value>, ...]}}
+or, if the read failed:
+    {"error": <message>}
+The process terminates at the end of stdin.
+
+This module is run in a separate interpreter by SHMFormatStream and must not import Qt.
+"""
+
+import argparse
+import json
+import sys
+import time
+
+from .SHMFormat import SHMFormatPlan
+from .SHMMap import SHMMap
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser("shm-format-stream", "persistent stand-in for shm-format")
+    parser.add_argument("--semaphore", help="protect the shared memory with an existing named semaphore")
+    args = parser.parse_args()
+
+    cfg_lines = json.loads(sys.stdin.readline())
+    plan = SHMFormatPlan(cfg_lines)
+
+    shm = {}
+    try:
+        for shm_name in plan.fields.keys():
+            shm[shm_name] = SHMMap(shm_name, args.semaphore)
+            plan.check_size(shm_name, shm[shm_name].size)
+    except Exception as e:
+        print(f"{e}", file=sys.stderr)
+        sys.exit(1)
+
+    for _ in sys.stdin:
+        try:
+            line = json.dumps({"time": time.time(), "values": plan.decode(plan.read(shm))})
+        except Exception as e:
+            line = json.dumps({"error": f"{e}"})
+        print(line, flush=True)
+
+    for m in shm.values():
+        m.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+import math
+import random
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMWriter import SHMWriter, ValueEncoder
+
+WAVEFORMS = ["ramp", "sine", "square", "triangle", "random walk", "step table"]
+
+
+class Waveform:
+    """
+    @brief generated signal: offset + amplitude * f(t / period)
+
+    ramp: 0 .. 1, sine/square/triangle: -1 .. 1, random walk: random steps (at most one amplitude per period),
+    step table: the values of the table, each held for period / len(table).
+    """
+
+    def __init__(self, kind: str, amplitude: float, offset: float, period: float,
+                 steps: list[float] | None = None) -> None:
+        if kind not in WAVEFORMS:
+            raise RuntimeError(f"unknown waveform '{kind}'")
+        if period <= 0:
+            raise RuntimeError(f"invalid period {period}")
+        if kind == "step table" and not steps:
+            raise RuntimeError("step table is empty")
+
+        self.kind = kind
+        self.amplitude = amplitude
+        self.offset = offset
+        self.period = period
+        self.steps = steps or []
+
+        self.__walk = 0.0
+        self.__last_t = 0.0
+
+    def value(self, t: float) -> float:
+        phase = (t / self.period) % 1.0
+        match self.kind:
+            case "ramp":
+                y = phase
+            case "sine":
+                y = math.sin(2 * math.pi * phase)
+            case "square":
+                y = 1.0 if phase < 0.5 else -1.0
+            case "triangle":
+                y = 4 * phase - 1 if phase < 0.5 else 3 - 4 * phase
+            case "random walk":
+                dt = t - self.__last_t
+                self.__last_t = t
+                self.__walk = min(max(self.__walk + random.uniform(-1.0, 1.0) * dt / self.period, -1.0), 1.0)
+                y = self.__walk
+            case _:
+                y = self.steps[min(int(phase * len(self.steps)), len(self.steps) - 1)]
+        return self.offset + self.amplitude * y
+
+    def to_json_dict(self) -> dict:
+        return {
+            "kind": self.kind,
+            "amplitude": self.amplitude,
+            "offset": self.offset,
+            "period": self.period,
+            "steps": self.steps,
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict):
+        return cls(json_dict["kind"], float(json_dict["amplitude"]), float(json_dict["offset"]),
+                   float(json_dict["period"]), [float(x) for x in json_dict.get("steps", [])])
+
+    def description(self) -> str:
+        return f"{self.kind} (amplitude {self.amplitude:g}, offset {self.offset:g}, period {self.period:g}s)"
+
+
+class SHMGenerator(QThread):
+    """
+    @brief writes generated signals at a fixed rate
+
+    All active signals are computed for the same tick time, encoded and written in one critical section of the
+    semaphore. Each generated value is clamped to the range of the data type of its entry.
+    The lateness of each tick is tracked as jitter; ticks that were missed because a tick took longer than the
+    period are counted as overruns.
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, writer: SHMWriter, signals: list[tuple[ValueEncoder, Waveform]], rate: float,
+                 parent: QtCore.QObject | None = None) -> None:
+        super(SHMGenerator, self).__init__(parent)
+
+        self.writer = writer
+        self.signals = signals
+        self.period = 1.0 / rate
+
+        # statistics (only written by the generator thread)
+        self.ticks = 0
+        self.overruns = 0
+        self.max_late = 0.0
+
+        self.__stop = False
+
+    def take_stats(self) -> tuple[int, int, float]:
+        """
+        @brief ticks, overruns and maximum lateness since the previous call
+        """
+        ticks, overruns, max_late = self.ticks, self.overruns, self.max_late
+        self.ticks = 0
+        self.overruns = 0
+        self.max_late = 0.0
+        return ticks, overruns, max_late
+
+    def run(self) -> None:
+        signals = self.signals
+        period = self.period
+        write = self.writer.write
+
+        start = time.perf_counter()
+        deadline = start
+        while not self.__stop:
+            now = time.perf_counter()
+            if now < deadline:
+                time.sleep(deadline - now)
+                now = time.perf_counter()
+
+            late = now - deadline
+            if late > self.max_late:
+                self.max_late = late
+
+            t = deadline - start
+            try:
+                write([(encoder.register, encoder.offset, encoder.encode(encoder.clamp(waveform.value(t))))
+                       for encoder, waveform in signals])
+            except Exception as e:
+                self.failed.emit(f"{e}")
+                return
+            self.ticks += 1
+
+            deadline += period
+            behind = time.perf_counter() - deadline
+            if behind > period:
+                skip = int(behind / period)
+                self.overruns += skip
+                deadline += skip * period
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
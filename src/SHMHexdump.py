@@ -1,9 +1,10 @@
 from PySide6 import QtWidgets, QtCore
-from PySide6.QtCore import QProcess, QMutex, QTimer
-from PySide6.QtGui import QFontDatabase, QTextCursor
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMessageBox, QFileDialog
 
 from .py_ui import Ui_ShmHexdump
+from .SHMMap import SHMMap
+from .SHMWorker import SHMWorker
 
 
 class SHMHexdump(QtWidgets.QMainWindow, Ui_ShmHexdump):
@@ -18,6 +19,7 @@ class SHMHexdump(QtWidgets.QMainWindow, Ui_ShmHexdump):
         self.register_size = register_size
         self.shm_size = num_registers * register_size
         self.semaphore = semaphore
+        self.shm: SHMMap | None = None
 
         self.setWindowTitle(f"hexdump {self.shm_name}")
 
@@ -31,15 +33,21 @@ class SHMHexdump(QtWidgets.QMainWindow, Ui_ShmHexdump):
         self.spinbox_interval.setSingleStep(self.slider_interval.singleStep())
         self.spinbox_interval.setValue(self.slider_interval.value())
 
-        fixed_font = QFontDatabase.systemFont(QFontDatabase.FixedFont)
-        self.hexdump_text.setFont(fixed_font)
+        # change highlighting
+        def on_highlight_changed():
+            self.hexdump_view.set_highlight_changes(self.checkbox_highlight.isChecked(), self.spinbox_fade.value())
+
+        self.checkbox_highlight.stateChanged.connect(on_highlight_changed)
+        self.spinbox_fade.valueChanged.connect(on_highlight_changed)
 
         # auto refresh timer
         self.timer = QTimer()
         self.timer.timeout.connect(self.execute)
 
-        # execution mutex
-        self.exec_mutex = QMutex()
+        # shared memory is read on a worker thread, the results are applied in the GUI thread
+        self.worker = SHMWorker(self)
+        self.worker.result.connect(lambda result: self.hexdump_view.set_data(*result))
+        self.worker.error.connect(self.hexdump_view.set_message)
 
         # ui actions
         self.button_refresh.clicked.connect(self.execute)
@@ -80,7 +88,7 @@ class SHMHexdump(QtWidgets.QMainWindow, Ui_ShmHexdump):
         self.checkbox_autorefresh.stateChanged.connect(on_checkbox_autorefresh_clicked)
 
         def on_action_save_triggered():
-            data = self.hexdump_text.toPlainText()
+            data = self.hexdump_view.text()
             file_name, _ = QFileDialog.getSaveFileName(self, caption="Save Hexdump", filter="*.txt")
             if file_name and len(file_name) > 0:
                 try:
@@ -95,33 +103,29 @@ class SHMHexdump(QtWidgets.QMainWindow, Ui_ShmHexdump):
         self.execute()
 
     def execute(self):
-        self.exec_mutex.lock()
-
         size = self.registers.value() * self.register_size
         offset = self.offset.value() * self.register_size
-        sem_cmd = f" -s {self.semaphore}" if self.semaphore else ""
-        command = f"dump-shm --bytes {size} --offset {offset} {self.shm_name}{sem_cmd} | hexdump -C -v"
-
-        process = QProcess()
-        process.start("bash", ["-c", command])
-        if process.waitForFinished(min(self.slider_interval.value() * 0.8, 1000)):
-            self.hexdump_text.clear()
-            self.hexdump_text.insertPlainText(bytes(process.readAllStandardError()).decode("utf-8"))
-            self.hexdump_text.moveCursor(QTextCursor.End)
-            self.hexdump_text.insertPlainText(bytes(process.readAllStandardOutput()).decode("utf-8"))
-        else:
-            process.kill()
-            self.hexdump_text.clear()
-            self.hexdump_text.insertPlainText("COMMAND TIMEOUT")
-
-        self.exec_mutex.unlock()
+
+        # skip this tick if the previous read has not finished yet
+        self.worker.submit(self.read_shm, offset, size)
+
+    def read_shm(self, offset: int, size: int) -> tuple[bytes, int]:
+        # executed on the worker thread
+        # map shared memory once and keep it for the lifetime of the window
+        if self.shm is None:
+            self.shm = SHMMap(self.shm_name, self.semaphore)
+        # the offset is passed on with the data: a read that was started before the offset was changed must not be
+        # compared with a read of the new window
+        return self.shm.read(offset, size), offset
 
     def closeEvent(self, event):
-        self.exec_mutex.lock()
         super(SHMHexdump, self).closeEvent(event)
         self.timer.stop()
+        self.worker.stop()
+        if self.shm:
+            self.shm.close()
+            self.shm = None
         self.closed.emit(self.shm_name)
-        self.exec_mutex.unlock()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,262 @@
+import ctypes
+import ctypes.util
+import mmap
+import os
+import time
+
+SHM_DIR = "/dev/shm"
+DEFAULT_SEM_TIMEOUT = 1.0
+
+
+class _Timespec(ctypes.Structure):
+    _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+
+def _load_libc() -> ctypes.CDLL:
+    libc = ctypes.CDLL(None, use_errno=True)
+    if hasattr(libc, "sem_open"):
+        return libc
+
+    # glibc < 2.34: semaphores live in libpthread
+    pthread = ctypes.util.find_library("pthread")
+    if pthread is None:
+        raise RuntimeError("POSIX semaphores are not available on this system")
+    return ctypes.CDLL(pthread, use_errno=True)
+
+
+_libc = None
+_SEM_FAILED = ctypes.c_void_p(-1).value
+
+
+def _get_libc() -> ctypes.CDLL:
+    global _libc
+    if _libc is None:
+        _libc = _load_libc()
+        _libc.sem_open.restype = ctypes.c_void_p
+        _libc.sem_open.argtypes = [ctypes.c_char_p, ctypes.c_int]
+        _libc.sem_close.argtypes = [ctypes.c_void_p]
+        _libc.sem_post.argtypes = [ctypes.c_void_p]
+        _libc.sem_timedwait.argtypes = [ctypes.c_void_p, ctypes.POINTER(_Timespec)]
+    return _libc
+
+
+class SHMSemaphore:
+    """
+    @brief named POSIX semaphore as used by the shm modbus clients (-s/--semaphore)
+    """
+
+    def __init__(self, name: str, timeout: float = DEFAULT_SEM_TIMEOUT) -> None:
+        self.name = name
+        self.timeout = timeout
+
+        libc = _get_libc()
+        sem_name = name if name.startswith('/') else f"/{name}"
+        sem = libc.sem_open(sem_name.encode(), 0)
+        if sem is None or sem == _SEM_FAILED:
+            errno = ctypes.get_errno()
+            raise RuntimeError(f"failed to open semaphore '{name}': {os.strerror(errno)}")
+        self.__sem = sem
+
+    def acquire(self) -> None:
+        deadline = time.time() + self.timeout
+        ts = _Timespec(int(deadline), int((deadline % 1) * 1e9))
+        libc = _get_libc()
+        while libc.sem_timedwait(self.__sem, ctypes.byref(ts)) != 0:
+            errno = ctypes.get_errno()
+            if errno == 4:  # EINTR
+                continue
+            if errno == 110:  # ETIMEDOUT
+                raise RuntimeError(f"failed to acquire semaphore '{self.name}': timeout")
+            raise RuntimeError(f"failed to acquire semaphore '{self.name}': {os.strerror(errno)}")
+
+    def release(self) -> None:
+        _get_libc().sem_post(self.__sem)
+
+    def close(self) -> None:
+        if self.__sem is not None:
+            _get_libc().sem_close(self.__sem)
+            self.__sem = None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.release()
+
+
+class SHMMap:
+    """
+    @brief memory mapping of a shared memory segment in /dev/shm
+
+    The mapping is created once and can be kept for the lifetime of the owning tool window.
+    All accesses are guarded by the (optional) semaphore of the modbus client.
+    """
+
+    def __init__(self, shm_name: str, semaphore: str | None = None, writable: bool = False) -> None:
+        self.shm_name = shm_name
+        self.writable = writable
+        self.semaphore = SHMSemaphore(semaphore) if semaphore else None
+
+        path = os.path.join(SHM_DIR, shm_name)
+        try:
+            fd = os.open(path, os.O_RDWR if writable else os.O_RDONLY)
+        except OSError as e:
+            self.close()
+            raise RuntimeError(f"failed to open shared memory '{shm_name}': {e.strerror}")
+
+        try:
+            self.size = os.fstat(fd).st_size
+            if self.size == 0:
+                raise RuntimeError(f"shared memory '{shm_name}' is empty")
+            prot = mmap.PROT_READ | mmap.PROT_WRITE if writable else mmap.PROT_READ
+            self.mmap = mmap.mmap(fd, self.size, mmap.MAP_SHARED, prot)
+        except Exception:
+            self.close()
+            raise
+        finally:
+            os.close(fd)
+
+    def __check_range(self, offset: int, size: int) -> None:
+        if offset < 0 or size < 0 or offset + size > self.size:
+            raise RuntimeError(f"range {offset}+{size} exceeds shared memory '{self.shm_name}' ({self.size} bytes)")
+
+    def lock(self) -> None:
+        if self.semaphore:
+            self.semaphore.acquire()
+
+    def unlock(self) -> None:
+        if self.semaphore:
+            self.semaphore.release()
+
+    def read(self, offset: int = 0, size: int | None = None) -> bytes:
+        if size is None:
+            size = self.size - offset
+        self.__check_range(offset, size)
+
+        self.lock()
+        try:
+            return self.mmap[offset:offset + size]
+        finally:
+            self.unlock()
+
+    def write(self, offset: int, data: bytes | bytearray | memoryview) -> None:
+        if not self.writable:
+            raise RuntimeError(f"shared memory '{self.shm_name}' is mapped read only")
+        self.__check_range(offset, len(data))
+
+        self.lock()
+        try:
+            self.mmap[offset:offset + len(data)] = data
+        finally:
+            self.unlock()
+
+    def close(self) -> None:
+        if getattr(self, "mmap", None) is not None:
+            self.mmap.close()
+            self.mmap = None
+        if self.semaphore:
+            self.semaphore.close()
+            self.semaphore = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class LockStats:
+    """
+    @brief statistics of the semaphore hold times
+    """
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def take(self) -> tuple[int, float, float]:
+        """
+        @brief count, mean and maximum hold time since the previous call
+        """
+        count, total, maximum = self.count, self.total, self.max
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        return count, total / count if count else 0.0, maximum
+
+
+def _semaphores(shms: list[SHMMap]) -> list[SHMSemaphore]:
+    # all semaphores of the given shared memories, each once, in name order (fixed lock order)
+    semaphores = {}
+    for shm in shms:
+        if shm.semaphore:
+            semaphores.setdefault(shm.semaphore.name, shm.semaphore)
+    return [semaphores[name] for name in sorted(semaphores)]
+
+
+def _check_ranges(ranges) -> None:
+    for shm, offset, data in ranges:
+        size = data if isinstance(data, int) else len(data)
+        if offset < 0 or size < 0 or offset + size > shm.size:
+            raise RuntimeError(f"range {offset}+{size} exceeds shared memory '{shm.shm_name}' ({shm.size} bytes)")
+
+
+def _critical_section(semaphores: list[SHMSemaphore], func, stats: LockStats | None):
+    acquired = []
+    try:
+        for semaphore in semaphores:
+            semaphore.acquire()
+            acquired.append(semaphore)
+        start = time.perf_counter()
+        result = func()
+        hold_time = time.perf_counter() - start
+    finally:
+        for semaphore in reversed(acquired):
+            semaphore.release()
+
+    if stats is not None:
+        stats.add(hold_time)
+    return result
+
+
+def read_consistent(ranges: list[tuple[SHMMap, int, int]], stats: LockStats | None = None) -> list[bytes]:
+    """
+    @brief copy several ranges (of possibly different shared memories) in one critical section
+
+    The semaphores of all involved shared memories are acquired once (in name order), all ranges are copied
+    (plain memcpy of the mapped memory) and the semaphores are released. Nothing else happens while the semaphores
+    are held.
+    @param ranges list of (shared memory, offset, size)
+    @param stats optional statistics of the semaphore hold time
+    """
+    _check_ranges(ranges)
+    return _critical_section(_semaphores([shm for shm, _, _ in ranges]),
+                             lambda: [shm.mmap[offset:offset + size] for shm, offset, size in ranges], stats)
+
+
+def write_consistent(writes: list[tuple[SHMMap, int, bytes]], stats: LockStats | None = None) -> None:
+    """
+    @brief write several already encoded ranges (of possibly different shared memories) in one critical section
+    @param writes list of (shared memory, offset, data)
+    @param stats optional statistics of the semaphore hold time
+    """
+    for shm, _, _ in writes:
+        if not shm.writable:
+            raise RuntimeError(f"shared memory '{shm.shm_name}' is mapped read only")
+    _check_ranges(writes)
+
+    def write_all():
+        for shm, offset, data in writes:
+            shm.mmap[offset:offset + len(data)] = data
+
+    _critical_section(_semaphores([shm for shm, _, _ in writes]), write_all, stats)
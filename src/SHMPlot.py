@@ -0,0 +1,37 @@
+from PySide6 import QtWidgets, QtCore
+from PySide6.QtCore import QTimer
+
+from .PlotView import PlotView
+from .SampleRing import SampleRing
+
+REFRESH_INTERVAL = 100
+
+
+class SHMPlot(QtWidgets.QMainWindow):
+    """
+    @brief window that plots recorded values
+
+    The plot does not read the shared memory itself; it only folds the samples that were appended to the ring buffer
+    since the last refresh.
+    """
+
+    closed = QtCore.Signal(object)
+
+    def __init__(self, ring: SampleRing, columns: list[int], title: str) -> None:
+        super(SHMPlot, self).__init__()
+
+        self.setWindowTitle(title)
+        self.resize(800, 400)
+
+        self.plot_view = PlotView(self)
+        self.setCentralWidget(self.plot_view)
+        self.plot_view.set_source(ring, columns)
+
+        self.timer = QTimer()
+        self.timer.timeout.connect(self.plot_view.update_data)
+        self.timer.start(REFRESH_INTERVAL)
+
+    def closeEvent(self, event):
+        super(SHMPlot, self).closeEvent(event)
+        self.timer.stop()
+        self.closed.emit(self)
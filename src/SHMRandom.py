@@ -1,7 +1,10 @@
 from PySide6 import QtWidgets, QtCore
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QMessageBox
 
 from .py_ui import Ui_RandomizeShm
+from .SHMMap import SHMMap
+from .SHMRandomizer import FILL_MODES, SHMRandomizer, create_fill
 
 
 class SHMRandom(QtWidgets.QWidget, Ui_RandomizeShm):
@@ -22,6 +25,14 @@ class SHMRandom(QtWidgets.QWidget, Ui_RandomizeShm):
 
         self.setWindowTitle(f"randomize {self.shm_name}")
 
+        # fill mode (random or pattern)
+        self.combobox_mode.addItems(list(FILL_MODES.keys()))
+        self.combobox_mode.currentTextChanged.connect(self.on_mode_changed)
+        self.on_mode_changed(self.combobox_mode.currentText())
+
+        # intervals below the minimum of the ui are supported
+        self.slider_interval.setMinimum(1)
+
         self.offset.setMaximum(num_registers - 1)
         self.offset.setValue(0)
         self.registers.setMaximum(num_registers)
@@ -55,93 +66,94 @@ class SHMRandom(QtWidgets.QWidget, Ui_RandomizeShm):
         self.registers.valueChanged.connect(on_registers_value_changed)
 
         # internal variables
-        self.process: QtCore.QProcess | None = None
+        self.shm: SHMMap | None = None
+        self.randomizer: SHMRandomizer | None = None
         self.active: bool = False
-
-    def __get_cmd(self):
-        cmd = [
-            "-n",
-            self.shm_name,
-            "-a",
-            f"{self.register_size}",
-            "-o",
-            f"{self.offset.value()}",
-            "-e",
-            f"{self.registers.value()}",
-        ]
-
-        if self.semaphore:
-            cmd.append("--semaphore")
-            cmd.append(self.semaphore)
-
-        if self.bitmask:
-            cmd.append("-m")
-            cmd.append(f"{self.bitmask:x}")
-
-        if self.pid:
-            cmd.append("--pid")
-            cmd.append(f"{self.pid}")
-
-        return cmd
+        self.stats_timer = QTimer()
+        self.stats_timer.timeout.connect(self.show_stats)
+
+    def __get_fill(self):
+        if self.shm is None:
+            self.shm = SHMMap(self.shm_name, self.semaphore, writable=True)
+        return create_fill(self.shm, self.offset.value(), self.registers.value(), self.register_size, self.bitmask,
+                           self.combobox_mode.currentText(), self.spinbox_param.value())
+
+    def on_mode_changed(self, mode: str) -> None:
+        param = FILL_MODES[mode]
+        self.label_param.setText(f"{param}:" if param else "")
+        self.label_param.setVisible(param is not None)
+        self.spinbox_param.setVisible(param is not None)
+        if mode == "sine" and self.spinbox_param.value() < 1:
+            self.spinbox_param.setValue(100)
 
     def __options_enable(self, enable: bool) -> None:
         self.spinbox_interval.setEnabled(enable)
         self.slider_interval.setEnabled(enable)
         self.offset.setEnabled(enable)
         self.registers.setEnabled(enable)
+        self.combobox_mode.setEnabled(enable)
+        self.spinbox_param.setEnabled(enable)
 
     def on_button_start_clicked(self) -> None:
         if not self.active:
+            try:
+                fill = self.__get_fill()
+            except RuntimeError as e:
+                QMessageBox.warning(self, "Randomize failed", f"{e}")
+                return
+
             self.__options_enable(False)
             self.button_once.setEnabled(False)
             self.button_start.setText("Stop")
             self.active = True
 
-            cmd = self.__get_cmd()
-            cmd += ["-i", f"{self.spinbox_interval.value()}"]
-
-            self.process = QtCore.QProcess()
-            self.process.finished.connect(self.on_process_finished)
-            self.process.start("shared-mem-random", cmd)
-
-            if not self.process.waitForStarted(min(self.slider_interval.value() * 0.8, 1000)):
-                self.process.kill()
-                QMessageBox.warning(self, "Command Timeout", "Execution of command shared-mem-random timed out")
+            self.randomizer = SHMRandomizer(fill, self.spinbox_interval.value() / 1000, self.pid)
+            self.randomizer.failed.connect(self.on_randomizer_failed)
+            self.randomizer.finished.connect(self.on_randomizer_finished)
+            self.randomizer.start()
+            self.stats_timer.start(1000)
         else:
-            self.process.terminate()
+            self.randomizer.stop()
 
     def on_button_once_clicked(self) -> None:
-        self.button_start.setEnabled(False)
-        self.button_once.setEnabled(False)
-        self.__options_enable(False)
-
-        cmd = self.__get_cmd()
-        cmd += ["-l", "1"]
+        try:
+            self.__get_fill().fill()
+        except RuntimeError as e:
+            QMessageBox.warning(self, "Randomize failed", f"{e}")
+
+    def on_randomizer_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Randomize failed", message)
+
+    def on_randomizer_finished(self) -> None:
+        if self.randomizer is None or self.sender() is not self.randomizer:
+            return
+        if self.randomizer.message:
+            self.label_stats.setText(self.randomizer.message)
+        self.stats_timer.stop()
+        self.randomizer = None
 
-        self.process = QtCore.QProcess()
-        self.process.finished.connect(self.on_process_finished)
-        self.process.start("shared-mem-random", cmd)
-
-        if not self.process.waitForFinished(1000):
-            self.process.kill()
-            QMessageBox.warning(self, "Command Timeout", "Execution of command shared-mem-random timed out")
-
-    def on_process_finished(self, exit_code) -> None:
         self.button_start.setEnabled(True)
         self.button_once.setEnabled(True)
         self.button_start.setText("Start")
         self.__options_enable(True)
         self.active = False
-        if exit_code != 0:
-            stderr = bytes(self.process.readAllStandardError()).decode("utf-8")
-            QMessageBox.warning(self, "Command Failed",
-                                f"Execution of command shared-mem-random failed (exit code: {exit_code}):\n {stderr}")
+
+    def show_stats(self) -> None:
+        if self.randomizer is None:
+            return
+        writes, written, max_fill_time = self.randomizer.take_stats()
+        self.label_stats.setText(f"{writes} writes/s, {written / 1e6:.3f} MB/s, "
+                                 f"max fill time {max_fill_time * 1e3:.3f} ms")
 
     def closeEvent(self, event):
         super(SHMRandom, self).closeEvent(event)
-        if self.process:
-            self.process.terminate()
-            self.process.waitForFinished(500)
+        self.stats_timer.stop()
+        if self.randomizer:
+            self.randomizer.stop()
+            self.randomizer = None
+        if self.shm:
+            self.shm.close()
+            self.shm = None
         self.closed.emit(self.shm_name)
 
 
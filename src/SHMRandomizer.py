@@ -0,0 +1,223 @@
+import abc
+import math
+import os
+import random
+import sys
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMMap import SHMMap
+
+
+# fill modes and the meaning of their parameter (None: no parameter)
+FILL_MODES = {
+    "random": None,
+    "seeded random": "seed",
+    "counter": None,
+    "walking ones": None,
+    "gray code": None,
+    "sine": "period [ticks]",
+    "constant": "value",
+}
+
+
+class _MaskedFill(abc.ABC):
+    """
+    @brief common part of the fills of a register range: location and bitmask
+
+    If a bitmask is given, it is applied to every register: for 1 byte registers with bytes.translate (one table
+    lookup per byte in C), for larger registers with one and operation of the whole range as a big integer.
+    """
+
+    def __init__(self, shm: SHMMap, offset: int, registers: int, register_size: int, bitmask: int | None = None):
+        self.shm = shm
+        self.offset = offset * register_size
+        self.registers = registers
+        self.register_size = register_size
+        self.size = registers * register_size
+        self.table: bytes | None = None
+        self.mask: int | None = None
+
+        if bitmask is not None:
+            if register_size == 1:
+                self.table = bytes(i & bitmask for i in range(256))
+            else:
+                pattern = (bitmask & (2 ** (register_size * 8) - 1)).to_bytes(register_size, sys.byteorder)
+                self.mask = int.from_bytes(pattern * registers, "little")
+
+    def apply_mask(self, data: bytes) -> bytes:
+        """
+        @brief apply the bitmask to the data of the whole register range
+        """
+        if self.table is not None:
+            return data.translate(self.table)
+        if self.mask is not None:
+            return (int.from_bytes(data, "little") & self.mask).to_bytes(len(data), "little")
+        return data
+
+    @abc.abstractmethod
+    def fill(self) -> int:
+        """
+        @brief write one fill
+        @return number of bytes written
+        """
+
+
+class RandomFill(_MaskedFill):
+    """
+    @brief fills a register range with random data
+
+    Without a seed, the random bytes are taken from os.urandom. With a seed, they are generated by a seeded
+    random.Random, so the sequence of fills is reproduced bit for bit every time the fill is created.
+    """
+
+    def __init__(self, shm: SHMMap, offset: int, registers: int, register_size: int, bitmask: int | None = None,
+                 seed: int | None = None):
+        super(RandomFill, self).__init__(shm, offset, registers, register_size, bitmask)
+        self.random = random.Random(seed) if seed is not None else None
+
+    def fill(self) -> int:
+        data = self.random.randbytes(self.size) if self.random else os.urandom(self.size)
+        self.shm.write(self.offset, self.apply_mask(data))
+        return self.size
+
+
+class PatternFill(_MaskedFill):
+    """
+    @brief fills a register range with a deterministic pattern
+
+    Register i of tick n holds f((n + i) mod period):
+        counter: c, walking ones: 1 << c, gray code: c ^ (c >> 1), sine: sine wave over the period (full register
+        range), constant: the value
+    Because every register only depends on (n + i) mod period, the pattern (plus the registers of the range) is
+    computed and masked once; each tick is a slice of it, i.e. a plain memcpy for the whole range.
+    """
+
+    def __init__(self, shm: SHMMap, offset: int, registers: int, register_size: int, bitmask: int | None,
+                 pattern: str, param: int = 0):
+        super(PatternFill, self).__init__(shm, offset, registers, register_size, bitmask)
+
+        bits = register_size * 8
+        top = 2 ** bits - 1
+        match pattern:
+            case "counter":
+                period = 2 ** bits
+                values = range(period)
+            case "walking ones":
+                period = bits
+                values = (1 << c for c in range(period))
+            case "gray code":
+                period = 2 ** bits
+                values = (c ^ (c >> 1) for c in range(period))
+            case "sine":
+                if param < 1:
+                    raise RuntimeError(f"invalid sine period {param}")
+                period = param
+                values = (round((math.sin(2 * math.pi * c / period) + 1) / 2 * top) for c in range(period))
+            case "constant":
+                period = 1
+                values = [param & top]
+            case _:
+                raise RuntimeError(f"unknown pattern '{pattern}'")
+
+        one_period = b"".join(v.to_bytes(register_size, sys.byteorder) for v in values)
+        repeat = (period + registers - 1 + period - 1) // period
+        self.period = period
+        self.pattern = memoryview(self.apply_mask(one_period * repeat))
+        self.tick = 0
+
+    def fill(self) -> int:
+        start = (self.tick % self.period) * self.register_size
+        self.shm.write(self.offset, self.pattern[start:start + self.size])
+        self.tick += 1
+        return self.size
+
+
+def create_fill(shm: SHMMap, offset: int, registers: int, register_size: int, bitmask: int | None, mode: str,
+                param: int = 0) -> _MaskedFill:
+    """
+    @brief create the fill for one of FILL_MODES
+    """
+    if mode == "random":
+        return RandomFill(shm, offset, registers, register_size, bitmask)
+    if mode == "seeded random":
+        return RandomFill(shm, offset, registers, register_size, bitmask, seed=param)
+    return PatternFill(shm, offset, registers, register_size, bitmask, mode, param)
+
+
+class SHMRandomizer(QThread):
+    """
+    @brief writes fills (random data or patterns) at a fixed interval
+
+    If the pid of the modbus client is given, the randomizer stops when the client terminates (like the --pid option
+    of shared-mem-random).
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, fill: _MaskedFill, interval: float, pid: int | None = None,
+                 parent: QtCore.QObject | None = None) -> None:
+        super(SHMRandomizer, self).__init__(parent)
+
+        self.filler = fill
+        self.interval = interval
+        self.pid = pid
+
+        # statistics (only written by the randomizer thread)
+        self.writes = 0
+        self.bytes = 0
+        self.max_fill_time = 0.0
+
+        # reason why the randomizer stopped by itself
+        self.message = ""
+
+        self.__stop = False
+
+    def take_stats(self) -> tuple[int, int, float]:
+        """
+        @brief writes, bytes written and maximum duration of one fill since the previous call
+        """
+        writes, written, max_fill_time = self.writes, self.bytes, self.max_fill_time
+        self.writes = 0
+        self.bytes = 0
+        self.max_fill_time = 0.0
+        return writes, written, max_fill_time
+
+    def __client_alive(self) -> bool:
+        try:
+            os.kill(self.pid, 0)
+        except ProcessLookupError:
+            return False
+        except PermissionError:
+            pass
+        return True
+
+    def run(self) -> None:
+        fill = self.filler.fill
+        interval = self.interval
+
+        deadline = time.perf_counter()
+        while not self.__stop:
+            now = time.perf_counter()
+            if now < deadline:
+                time.sleep(deadline - now)
+            deadline = max(deadline + interval, time.perf_counter())
+
+            if self.pid and not self.__client_alive():
+                self.message = f"modbus client (pid {self.pid}) terminated"
+                return
+
+            start = time.perf_counter()
+            try:
+                self.bytes += fill()
+            except Exception as e:
+                self.failed.emit(f"{e}")
+                return
+            self.max_fill_time = max(self.max_fill_time, time.perf_counter() - start)
+            self.writes += 1
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
@@ -0,0 +1,132 @@
+import json
+import struct
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMDiff import encode_delta
+from .SHMMap import SHMMap
+
+# file format of a shared memory recording:
+#   MAGIC, json header line (with the wall clock time of the start of the recording)
+#   records: RECORD header (kind, time, payload size) + payload, time in seconds since the start of the recording
+#   (monotonic clock)
+#       KEYFRAME: complete content of the shared memory
+#       DELTA: delta to the previous frame (see SHMDiff.encode_delta)
+#       INDEX: INDEX_ENTRY (time, file offset) of all keyframes, written when the recording is closed
+#   FOOTER (file offset of the index record, FOOTER_MAGIC)
+MAGIC = b"SHMDREC1\n"
+FOOTER_MAGIC = b"SHMDIDX\n"
+RECORD = struct.Struct("<cdI")
+INDEX_ENTRY = struct.Struct("<dQ")
+FOOTER = struct.Struct("<Q8s")
+KEYFRAME = b'K'
+DELTA = b'D'
+INDEX = b'I'
+
+# file buffer of the recorder
+WRITE_BUFFER = 1024 * 1024
+
+
+class SHMRecorder(QThread):
+    """
+    @brief records a shared memory at a fixed rate with delta compression
+
+    The first frame is written as keyframe, all further frames as delta to the previous frame, and only if something
+    changed. A new keyframe (for seeking) is written every keyframe_seconds if a delta was written since the previous
+    keyframe. The index of all keyframes is written when the recording is stopped.
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, shm_name: str, filename: str, rate: float, semaphore: str | None = None,
+                 keyframe_seconds: float = 10.0, parent: QtCore.QObject | None = None) -> None:
+        super(SHMRecorder, self).__init__(parent)
+
+        self.shm_name = shm_name
+        self.filename = filename
+        self.rate = rate
+        self.semaphore = semaphore
+        self.keyframe_interval = max(int(keyframe_seconds * rate), 1)
+
+        # statistics (only written by the recorder thread)
+        self.samples = 0
+        self.bytes = 0
+        self.missed = 0
+
+        self.__stop = False
+
+    def take_stats(self) -> tuple[int, int, int]:
+        """
+        @brief samples, bytes written and missed periods since the previous call
+        """
+        samples, written, missed = self.samples, self.bytes, self.missed
+        self.samples = 0
+        self.bytes = 0
+        self.missed = 0
+        return samples, written, missed
+
+    def run(self) -> None:
+        try:
+            with SHMMap(self.shm_name, self.semaphore) as shm, open(self.filename, "wb", WRITE_BUFFER) as f:
+                self.__record(shm, f)
+        except Exception as e:
+            self.failed.emit(f"{e}")
+
+    def __record(self, shm: SHMMap, f) -> None:
+        header = {
+            "shm_name": self.shm_name,
+            "size": shm.size,
+            "rate": self.rate,
+            "keyframe_interval": self.keyframe_interval,
+            "start": time.time(),
+        }
+        t0 = time.perf_counter()
+        f.write(MAGIC)
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+
+        index = []
+        prev = None
+        changed = False
+        next_keyframe = 0
+        sample = 0
+
+        period = 1.0 / self.rate
+        deadline = time.perf_counter()
+        while not self.__stop:
+            now = time.perf_counter()
+            if now < deadline:
+                time.sleep(deadline - now)
+
+            cur = shm.read()
+            t = time.perf_counter() - t0
+
+            if prev is None or (sample >= next_keyframe and changed):
+                index.append(INDEX_ENTRY.pack(t, f.tell()))
+                self.bytes += f.write(RECORD.pack(KEYFRAME, t, len(cur))) + f.write(cur)
+                next_keyframe = sample + self.keyframe_interval
+                changed = False
+            elif cur != prev:
+                delta = encode_delta(prev, cur)
+                self.bytes += f.write(RECORD.pack(DELTA, t, len(delta))) + f.write(delta)
+                changed = True
+            prev = cur
+            sample += 1
+            self.samples += 1
+
+            deadline += period
+            behind = time.perf_counter() - deadline
+            if behind > period:
+                skip = int(behind / period)
+                self.missed += skip
+                deadline += skip * period
+
+        index_offset = f.tell()
+        payload = b"".join(index)
+        f.write(RECORD.pack(INDEX, time.perf_counter() - t0, len(payload)) + payload)
+        f.write(FOOTER.pack(index_offset, FOOTER_MAGIC))
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
@@ -0,0 +1,270 @@
+import bisect
+import json
+import os
+import time
+from typing import Iterator
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMDiff import RUN, apply_delta, encode_delta
+from .SHMMap import SHMMap, write_consistent
+from .SHMRecorder import MAGIC, FOOTER_MAGIC, RECORD, INDEX_ENTRY, FOOTER, KEYFRAME, INDEX
+
+
+class SHMRecording:
+    """
+    @brief reader of a recording written by SHMRecorder
+
+    The keyframe index is taken from the end of the file. If the recording was not closed properly (no index), the
+    record headers are scanned to build it.
+    """
+
+    def __init__(self, filename: str) -> None:
+        self.filename = filename
+        try:
+            self.file = open(filename, "rb")
+        except OSError as e:
+            raise RuntimeError(f"failed to open '{filename}': {e.strerror}")
+
+        try:
+            if self.file.read(len(MAGIC)) != MAGIC:
+                raise RuntimeError(f"'{filename}' is not a shared memory recording")
+            try:
+                self.header = json.loads(self.file.readline())
+                self.size = int(self.header["size"])
+            except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                raise RuntimeError(f"invalid header of recording '{filename}': {e}")
+            self.data_offset = self.file.tell()
+
+            self.keyframes: list[tuple[float, int]] = []
+            self.end = 0.0
+            if not self.__read_index():
+                self.__scan()
+            if len(self.keyframes) == 0:
+                raise RuntimeError(f"recording '{filename}' is empty")
+        except Exception:
+            self.file.close()
+            raise
+
+        # time of the first keyframe
+        self.start = self.keyframes[0][0]
+        self.key_times = [t for t, _ in self.keyframes]
+
+    def __read_index(self) -> bool:
+        file_size = os.fstat(self.file.fileno()).st_size
+        if file_size < self.data_offset + FOOTER.size:
+            return False
+        self.file.seek(file_size - FOOTER.size)
+        index_offset, magic = FOOTER.unpack(self.file.read(FOOTER.size))
+        if magic != FOOTER_MAGIC or index_offset < self.data_offset:
+            return False
+
+        self.file.seek(index_offset)
+        kind, t, size = RECORD.unpack(self.file.read(RECORD.size))
+        if kind != INDEX:
+            return False
+        payload = self.file.read(size)
+        self.keyframes = list(INDEX_ENTRY.iter_unpack(payload))
+        self.end = t
+        return True
+
+    def __scan(self) -> None:
+        # only the record headers are read, the payloads are skipped
+        offset = self.data_offset
+        while True:
+            self.file.seek(offset)
+            header = self.file.read(RECORD.size)
+            if len(header) < RECORD.size:
+                break
+            kind, t, size = RECORD.unpack(header)
+            if kind == INDEX:
+                break
+            if kind == KEYFRAME:
+                self.keyframes.append((t, offset))
+            self.end = t
+            offset += RECORD.size + size
+
+    def duration(self) -> float:
+        return self.end - self.start
+
+    def keyframe_before(self, t: float) -> int:
+        """
+        @brief file offset of the last keyframe at or before the recording time t (seconds since start)
+        """
+        i = bisect.bisect_right(self.key_times, self.start + t) - 1
+        return self.keyframes[max(i, 0)][1]
+
+    def records(self, offset: int) -> Iterator[tuple[bytes, float, bytes]]:
+        """
+        @brief read the records (kind, time, payload) from a file offset to the end of the recording
+        """
+        self.file.seek(offset)
+        while True:
+            header = self.file.read(RECORD.size)
+            if len(header) < RECORD.size:
+                return
+            kind, t, size = RECORD.unpack(header)
+            if kind == INDEX:
+                return
+            payload = self.file.read(size)
+            if len(payload) < size:
+                # truncated recording
+                return
+            yield kind, t, payload
+
+    def close(self) -> None:
+        self.file.close()
+
+
+class SHMReplayer(QThread):
+    """
+    @brief replays a recording into the shared memory with the original timing
+
+    Replay starts at the last keyframe before the seek position; the records up to the seek position are applied to
+    a private frame, which is then written once. After that, only the changed runs of each delta are written (all
+    runs of a record in one critical section of the semaphore). The drift is the difference between the actual and
+    the scheduled write time.
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, filename: str, shm_name: str, semaphore: str | None = None, speed: float = 1.0,
+                 loop: bool = False, seek: float = 0.0, parent: QtCore.QObject | None = None) -> None:
+        super(SHMReplayer, self).__init__(parent)
+
+        if speed <= 0:
+            raise RuntimeError(f"invalid speed factor {speed}")
+
+        self.recording = SHMRecording(filename)
+        self.shm_name = shm_name
+        self.semaphore = semaphore
+        self.speed = speed
+        self.loop = loop
+        self.seek = min(max(seek, 0.0), self.recording.duration())
+
+        # statistics (only written by the replay thread)
+        self.records = 0
+        self.bytes = 0
+        self.max_drift = 0.0
+        self.position = self.seek
+
+        # last frame written to the shared memory
+        self.__frame: bytearray | None = None
+
+        self.__stop = False
+
+    def take_stats(self) -> tuple[int, int, float]:
+        """
+        @brief records replayed, bytes written and maximum drift since the previous call
+        """
+        records, written, max_drift = self.records, self.bytes, self.max_drift
+        self.records = 0
+        self.bytes = 0
+        self.max_drift = 0.0
+        return records, written, max_drift
+
+    def run(self) -> None:
+        try:
+            with SHMMap(self.shm_name, self.semaphore, writable=True) as shm:
+                if shm.size != self.recording.size:
+                    raise RuntimeError(f"size of shared memory '{self.shm_name}' ({shm.size} bytes) does not match "
+                                       f"the recording ({self.recording.size} bytes)")
+                play_start = time.perf_counter()
+                while not self.__stop:
+                    duration = self.__replay(shm, play_start)
+                    if not self.loop or duration is None or duration <= 0:
+                        break
+                    play_start += duration / self.speed
+        except Exception as e:
+            self.failed.emit(f"{e}")
+        finally:
+            self.recording.close()
+
+    def __replay(self, shm: SHMMap, play_start: float) -> float | None:
+        """
+        @brief one pass from the seek position to the end of the recording
+        @return recording time of the pass or None if stopped
+        """
+        recording = self.recording
+        seek_time = recording.start + self.seek
+        frame: bytearray | None = None
+        started = False
+        last_t = seek_time
+
+        for kind, t, payload in recording.records(recording.keyframe_before(self.seek)):
+            if self.__stop:
+                return None
+
+            if not started:
+                if t <= seek_time:
+                    # fast forward to the seek position
+                    if kind == KEYFRAME:
+                        frame = bytearray(payload)
+                    else:
+                        apply_delta(frame, payload)
+                    continue
+                # first record after the seek position: write the state at the seek position
+                self.__write_frame(shm, frame)
+                started = True
+
+            if kind == KEYFRAME:
+                # usually identical to the current frame
+                payload = encode_delta(frame, payload)
+            if len(payload) == 0:
+                continue
+            apply_delta(frame, payload)
+            writes = self.__changed_runs(shm, frame, payload)
+
+            deadline = play_start + (t - seek_time) / self.speed
+            if not self.__wait(deadline):
+                return None
+            drift = time.perf_counter() - deadline
+            write_consistent(writes)
+
+            self.max_drift = max(self.max_drift, drift)
+            self.records += 1
+            self.bytes += sum(len(data) for _, _, data in writes)
+            self.position = t - recording.start
+            last_t = t
+
+        if not started and frame is not None:
+            # nothing after the seek position
+            self.__write_frame(shm, frame)
+        return max(recording.end, last_t) - seek_time
+
+    def __write_frame(self, shm: SHMMap, frame: bytearray) -> None:
+        # only the difference to the previously replayed frame (e.g. of the previous loop pass) is written
+        if self.__frame is None:
+            writes = [(shm, 0, bytes(frame))]
+        else:
+            writes = self.__changed_runs(shm, frame, encode_delta(self.__frame, frame))
+        self.__frame = frame
+        if len(writes) > 0:
+            write_consistent(writes)
+            self.bytes += sum(len(data) for _, _, data in writes)
+
+    @staticmethod
+    def __changed_runs(shm: SHMMap, frame: bytearray, delta: bytes) -> list[tuple[SHMMap, int, bytes]]:
+        """
+        @brief the bytes of the frame at the runs of a delta
+        """
+        writes = []
+        pos = 0
+        while pos < len(delta):
+            offset, length = RUN.unpack_from(delta, pos)
+            writes.append((shm, offset, bytes(frame[offset:offset + length])))
+            pos += RUN.size + length
+        return writes
+
+    def __wait(self, deadline: float) -> bool:
+        while not self.__stop:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return True
+            time.sleep(min(remaining, 0.1))
+        return False
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
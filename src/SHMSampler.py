@@ -0,0 +1,80 @@
+import collections
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMFormat import SHMFormatPlan
+from .SHMMap import SHMMap
+
+# seconds of samples that are buffered if the consumer does not keep up
+BUFFER_SECONDS = 60
+
+
+class SHMSampler(QThread):
+    """
+    @brief reads and decodes the configured values at a fixed rate on a dedicated thread
+
+    The samples (time, lateness, values) are appended to a bounded deque, which is the only object shared with the
+    consumer: the sampler only appends, the consumer only pops (both are atomic, no lock is required).
+    The lateness of each sample is the time between the scheduled and the actual sampling time; if the sampler falls
+    behind by more than one period, the missed periods are skipped and counted.
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, plan: SHMFormatPlan, shm: dict[str, SHMMap], rate: float,
+                 parent: QtCore.QObject | None = None) -> None:
+        super(SHMSampler, self).__init__(parent)
+
+        self.plan = plan
+        self.shm = shm
+        self.period = 1.0 / rate
+        self.samples: collections.deque[tuple[float, float, dict[str, list]]] = \
+            collections.deque(maxlen=max(int(rate * BUFFER_SECONDS), 1))
+
+        # counters are only written by the sampler thread
+        self.produced = 0
+        self.missed = 0
+
+        self.__stop = False
+
+    def run(self) -> None:
+        plan = self.plan
+        shm = self.shm
+        period = self.period
+        samples = self.samples
+
+        deadline = time.perf_counter()
+        while not self.__stop:
+            now = time.perf_counter()
+            if now < deadline:
+                time.sleep(deadline - now)
+                now = time.perf_counter()
+
+            try:
+                values = plan.decode(plan.read(shm))
+            except Exception as e:
+                self.failed.emit(f"{e}")
+                return
+
+            samples.append((time.time(), now - deadline, values))
+            self.produced += 1
+
+            deadline += period
+            behind = time.perf_counter() - deadline
+            if behind > period:
+                skip = int(behind / period)
+                self.missed += skip
+                deadline += skip * period
+
+    def take(self) -> list[tuple[float, float, dict[str, list]]]:
+        """
+        @brief remove and return all buffered samples (consumer side)
+        """
+        samples = self.samples
+        return [samples.popleft() for _ in range(len(samples))]
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
@@ -0,0 +1,180 @@
+import csv
+import itertools
+import json
+import time
+from typing import Iterator
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMWriter import SHMWriter, ValueEncoder
+
+# remaining wait time that is spent busy waiting instead of sleeping (sleep is not precise enough)
+SPIN_TIME = 0.001
+
+# entry name of the optional end marker (time of the end of a pass)
+END_MARKER = "#end"
+
+
+def read_events(file_name: str) -> Iterator[tuple[float, str, str]]:
+    """
+    @brief stream (time offset, entry name, value) events from a sequence file
+
+    Supported formats (selected by the file extension):
+        .json/.jsonl: one json object per line: {"time": <seconds>, "name": <entry name>, "value": <value>}
+        otherwise csv: time,name,value (an optional header line starting with 'time' is skipped)
+    The events have to be sorted by time. The optional end marker (name '#end', no value) marks the end of the
+    sequence; it is required for looping.
+    """
+    with open(file_name, 'r', newline='') as f:
+        if file_name.endswith(".json") or file_name.endswith(".jsonl"):
+            for line_number, line in enumerate(f, start=1):
+                line = line.strip()
+                if len(line) == 0:
+                    continue
+                try:
+                    event = json.loads(line)
+                    t, name = float(event["time"]), str(event["name"])
+                    value = str(event.get("value", "")) if name == END_MARKER else str(event["value"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError) as e:
+                    raise RuntimeError(f"{file_name}:{line_number}: invalid event: {e}")
+                if t < 0:
+                    raise RuntimeError(f"{file_name}:{line_number}: negative time {t}")
+                yield t, name, value
+        else:
+            for line_number, row in enumerate(csv.reader(f), start=1):
+                if len(row) == 0 or (line_number == 1 and row[0].strip().lower() == "time"):
+                    continue
+                if len(row) == 2 and row[1].strip() == END_MARKER:
+                    row.append("")
+                if len(row) != 3:
+                    raise RuntimeError(f"{file_name}:{line_number}: expected 3 columns (time,name,value)")
+                try:
+                    t = float(row[0])
+                except ValueError as e:
+                    raise RuntimeError(f"{file_name}:{line_number}: invalid time: {e}")
+                if t < 0:
+                    raise RuntimeError(f"{file_name}:{line_number}: negative time {t}")
+                yield t, row[1].strip(), row[2].strip()
+
+
+def read_batches(file_name: str, encoders: dict[str, ValueEncoder]) -> Iterator[tuple[float, list]]:
+    """
+    @brief stream the events of a sequence file as encoded write batches (all events with the same time)
+
+    The end marker is yielded as an empty batch at its time.
+    """
+    last_time = 0.0
+    end_time = None
+    for t, events in itertools.groupby(read_events(file_name), key=lambda x: x[0]):
+        if end_time is not None:
+            raise RuntimeError(f"{file_name}: events after the end marker ({t} > {end_time})")
+        if t < last_time:
+            raise RuntimeError(f"{file_name}: events are not sorted by time ({t} < {last_time})")
+        last_time = t
+
+        batch = []
+        for _, name, value in events:
+            if name == END_MARKER:
+                end_time = t
+                continue
+            if name not in encoders:
+                raise RuntimeError(f"{file_name}: unknown entry '{name}'")
+            encoder = encoders[name]
+            batch.append((encoder.register, encoder.offset, encoder.encode(encoder.parse(value))))
+        if len(batch) > 0:
+            yield t, batch
+
+    if end_time is not None:
+        yield end_time, []
+
+
+class SHMSequencePlayer(QThread):
+    """
+    @brief replays a sequence file against the shared memories
+
+    The file is streamed (never loaded completely). All events with the same time are written as one batch in a
+    single critical section of the semaphore. Waiting is done with sleep until shortly before the deadline and
+    busy waiting for the remaining time.
+    When looping, the time of the end marker is the length of a pass: the next pass starts at that time. Sequences
+    without end marker or with a pass length of 0 cannot be looped.
+    """
+
+    failed = QtCore.Signal(str)
+
+    def __init__(self, writer: SHMWriter, file_name: str, encoders: dict[str, ValueEncoder], speed: float = 1.0,
+                 loop: bool = False, parent: QtCore.QObject | None = None) -> None:
+        super(SHMSequencePlayer, self).__init__(parent)
+
+        if speed <= 0:
+            raise RuntimeError(f"invalid speed factor {speed}")
+
+        self.writer = writer
+        self.file_name = file_name
+        self.encoders = encoders
+        self.speed = speed
+        self.loop = loop
+
+        # statistics (only written by the player thread)
+        self.batches = 0
+        self.passes = 0
+        self.max_late = 0.0
+
+        self.__stop = False
+
+    def take_stats(self) -> tuple[int, int, float]:
+        """
+        @brief batches written, completed passes and maximum lateness since the previous call
+        """
+        batches, passes, max_late = self.batches, self.passes, self.max_late
+        self.batches = 0
+        self.passes = 0
+        self.max_late = 0.0
+        return batches, passes, max_late
+
+    def run(self) -> None:
+        try:
+            start = time.perf_counter()
+            while not self.__stop:
+                period = None
+                for t, batch in read_batches(self.file_name, self.encoders):
+                    deadline = start + t / self.speed
+                    if not self.__wait(deadline):
+                        return
+                    if len(batch) == 0:
+                        # end marker
+                        period = t
+                        continue
+
+                    late = time.perf_counter() - deadline
+                    self.writer.write(batch)
+                    if late > self.max_late:
+                        self.max_late = late
+                    self.batches += 1
+
+                self.passes += 1
+                if not self.loop:
+                    return
+                if period is None:
+                    raise RuntimeError(f"{self.file_name}: the sequence has no end marker ('{END_MARKER}') and "
+                                       f"cannot be looped")
+                if period <= 0:
+                    raise RuntimeError(f"{self.file_name}: the sequence has no duration and cannot be looped")
+
+                # the next pass starts at the end marker of this pass
+                start += period / self.speed
+        except Exception as e:
+            self.failed.emit(f"{e}")
+
+    def __wait(self, deadline: float) -> bool:
+        while not self.__stop:
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                return True
+            if remaining > SPIN_TIME:
+                time.sleep(min(remaining - SPIN_TIME, 0.1))
+        return False
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import os
+import time
+
+from . import constants
+from .SHMMap import SHMMap, read_consistent, write_consistent
+
+# size of the deduplicated chunks
+CHUNK_SIZE = 4096
+
+
+def default_directory() -> str:
+    data_home = os.environ.get("XDG_DATA_HOME") or os.path.join(os.path.expanduser("~"), ".local", "share")
+    return os.path.join(data_home, constants.APP_NAME, "snapshots")
+
+
+def chunk_hashes(data: bytes, chunk_size: int = CHUNK_SIZE) -> list[str]:
+    view = memoryview(data)
+    return [hashlib.sha256(view[i:i + chunk_size]).hexdigest() for i in range(0, len(data), chunk_size)]
+
+
+class SnapshotStore:
+    """
+    @brief content addressed store of named shared memory snapshots
+
+    A snapshot is split into fixed size chunks, each chunk is stored once as chunks/<first 2 hex digits>/<sha256>.
+    snapshots.json maps the snapshot names to the register type, size, time and the list of chunk hashes.
+    Loading a snapshot hashes the chunks of the current shared memory content and writes only the chunks whose hash
+    differs (in one critical section).
+    """
+
+    def __init__(self, directory: str | None = None) -> None:
+        self.directory = directory or default_directory()
+        self.index_file = os.path.join(self.directory, "snapshots.json")
+        self.snapshots: dict[str, dict] = {}
+
+        if os.path.exists(self.index_file):
+            try:
+                with open(self.index_file, "r") as f:
+                    self.snapshots = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                raise RuntimeError(f"failed to read snapshot index '{self.index_file}': {e}")
+
+    def names(self, register: str | None = None) -> list[str]:
+        """
+        @brief names of all snapshots (of one register type), oldest first
+        """
+        return sorted((name for name, info in self.snapshots.items()
+                       if register is None or info["register"] == register),
+                      key=lambda name: self.snapshots[name]["time"])
+
+    def __chunk_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "chunks", digest[:2], digest)
+
+    def __write_index(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self.index_file}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(self.snapshots, f, indent=1)
+        os.replace(tmp, self.index_file)
+
+    def __read_chunk(self, digest: str) -> bytes:
+        try:
+            with open(self.__chunk_path(digest), "rb") as f:
+                data = f.read()
+        except OSError as e:
+            raise RuntimeError(f"missing chunk {digest}: {e.strerror}")
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise RuntimeError(f"chunk {digest} is corrupted")
+        return data
+
+    def save(self, name: str, shm_name: str, register: str, semaphore: str | None = None) -> tuple[int, int]:
+        """
+        @brief store the current content of a shared memory as snapshot (replaces a snapshot with the same name)
+        @return number of chunks and number of chunks that were not yet stored
+        """
+        with SHMMap(shm_name, semaphore) as shm:
+            data = shm.read()
+
+        hashes = chunk_hashes(data)
+        new = 0
+        try:
+            for i, digest in enumerate(hashes):
+                path = self.__chunk_path(digest)
+                if os.path.exists(path):
+                    continue
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp = f"{path}.tmp"
+                with open(tmp, "wb") as f:
+                    f.write(data[i * CHUNK_SIZE:(i + 1) * CHUNK_SIZE])
+                os.replace(tmp, path)
+                new += 1
+
+            self.snapshots[name] = {
+                "register": register,
+                "shm_name": shm_name,
+                "size": len(data),
+                "time": time.time(),
+                "chunk_size": CHUNK_SIZE,
+                "chunks": hashes,
+            }
+            self.__write_index()
+        except OSError as e:
+            raise RuntimeError(f"failed to write snapshot '{name}': {e}")
+        return len(hashes), new
+
+    def read(self, name: str) -> bytes:
+        """
+        @brief content of a snapshot
+        """
+        if name not in self.snapshots:
+            raise RuntimeError(f"unknown snapshot '{name}'")
+        return b"".join(self.__read_chunk(digest) for digest in self.snapshots[name]["chunks"])
+
+    def load(self, name: str, shm_name: str, semaphore: str | None = None) -> tuple[int, int]:
+        """
+        @brief write a snapshot to a shared memory; only chunks that differ from the current content are written
+        @return number of chunks written and number of chunks of the snapshot
+        """
+        if name not in self.snapshots:
+            raise RuntimeError(f"unknown snapshot '{name}'")
+        info = self.snapshots[name]
+        chunk_size = info["chunk_size"]
+
+        with SHMMap(shm_name, semaphore, writable=True) as shm:
+            if shm.size != info["size"]:
+                raise RuntimeError(f"size of shared memory '{shm_name}' ({shm.size} bytes) does not match the "
+                                   f"snapshot ({info['size']} bytes)")
+
+            current = chunk_hashes(read_consistent([(shm, 0, shm.size)])[0], chunk_size)
+            writes = [(shm, i * chunk_size, self.__read_chunk(digest))
+                      for i, (digest, cur) in enumerate(zip(info["chunks"], current)) if digest != cur]
+            if len(writes) > 0:
+                write_consistent(writes)
+        return len(writes), len(info["chunks"])
+
+    def delete(self, name: str) -> int:
+        """
+        @brief delete a snapshot and all chunks that are not used by another snapshot
+        @return number of deleted chunks
+        """
+        info = self.snapshots.pop(name, None)
+        if info is None:
+            raise RuntimeError(f"unknown snapshot '{name}'")
+
+        used = set()
+        for other in self.snapshots.values():
+            used.update(other["chunks"])
+
+        deleted = 0
+        try:
+            self.__write_index()
+            for digest in set(info["chunks"]) - used:
+                try:
+                    os.remove(self.__chunk_path(digest))
+                except FileNotFoundError:
+                    continue
+                deleted += 1
+        except OSError as e:
+            raise RuntimeError(f"failed to delete snapshot '{name}': {e}")
+        return deleted
@@ -1,6 +1,11 @@
-from PySide6.QtCore import QProcess
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import QApplication, QProgressDialog
 
+from .SHMFile import dump_shm, load_shm
+from .SHMCompare import SHMCompare
 from .SHMHexdump import SHMHexdump
+from .SHMRecorder import SHMRecorder
+from .SHMReplay import SHMReplayer
 from .SHMRandom import SHMRandom
 from .InspectSHM import InspectSHM
 from .SetValues import SetValues
@@ -14,6 +19,9 @@ class SHMTools:
         self.random: dict[str, SHMRandom] = {}
         self.inspect_values: dict[str, InspectSHM] = {}
         self.set_values: dict[str, SetValues] = {}
+        self.recorders: dict[str, SHMRecorder] = {}
+        self.replayers: dict[str, SHMReplayer] = {}
+        self.compare: list[SHMCompare] = []
 
     def close_all(self) -> None:
         # close all hexdump windows
@@ -36,6 +44,20 @@ class SHMTools:
         for shm_name in set_shm_name:
             self.set_values[shm_name].close()
 
+        # close compare windows
+        for compare in list(self.compare):
+            compare.close()
+
+        # stop recorders
+        recorder_shm_names = [x for x in self.recorders.keys()]
+        for shm_name in recorder_shm_names:
+            self.stop_recorder(shm_name)
+
+        # stop replays
+        replay_shm_names = [x for x in self.replayers.keys()]
+        for shm_name in replay_shm_names:
+            self.stop_replay(shm_name)
+
     def start_hexdump(self, shm_name: str, registers: int, register_size: int,
                       semaphore: str | None = None) -> SHMHexdump:
         if shm_name in self.hexdump:
@@ -77,48 +99,73 @@ class SHMTools:
         self.set_values[shm_prefix].show()
         return self.set_values[shm_prefix]
 
+    def start_compare(self, shm_prefix: str, semaphore: str | None = None) -> SHMCompare:
+        compare = SHMCompare(shm_prefix, semaphore)
+        self.compare.append(compare)
+        compare.closed.connect(lambda window: self.compare.remove(window))
+        compare.show()
+        return compare
+
+    def start_recorder(self, shm_name: str, filename: str, rate: float, semaphore: str | None = None) -> SHMRecorder:
+        if shm_name in self.recorders:
+            raise RuntimeError(f"Internal Error: A SHMRecorder object already exists for {shm_name}")
+
+        recorder = SHMRecorder(shm_name, filename, rate, semaphore)
+        self.recorders[shm_name] = recorder
+        recorder.start()
+        return recorder
+
+    def stop_recorder(self, shm_name: str) -> None:
+        recorder = self.recorders.pop(shm_name, None)
+        if recorder:
+            recorder.stop()
+
+    def start_replay(self, shm_name: str, filename: str, speed: float, loop: bool, seek: float,
+                     semaphore: str | None = None) -> SHMReplayer:
+        if shm_name in self.replayers:
+            raise RuntimeError(f"Internal Error: A SHMReplayer object already exists for {shm_name}")
+
+        replayer = SHMReplayer(filename, shm_name, semaphore, speed, loop, seek)
+        self.replayers[shm_name] = replayer
+        replayer.start()
+        return replayer
+
+    def stop_replay(self, shm_name: str) -> None:
+        replayer = self.replayers.pop(shm_name, None)
+        if replayer:
+            replayer.stop()
+
+    @staticmethod
+    def __progress_dialog(label: str):
+        """
+        @brief progress callback that shows a progress dialog for long transfers
+        """
+        dialog = QProgressDialog(label, "Cancel", 0, 100)
+        dialog.setWindowModality(Qt.ApplicationModal)
+        dialog.setMinimumDuration(500)
+
+        def progress(done: int, total: int) -> None:
+            dialog.setValue(int(done * 100 / total) if total else 100)
+            QApplication.processEvents()
+            if dialog.wasCanceled():
+                raise RuntimeError("cancelled")
+
+        return dialog, progress
+
     @staticmethod
     def dump_shm_to_file(shm_name: str, filename: str, semaphore: str | None) -> None:
         print(f"{shm_name} > {filename}")
-        sem_cmd = f" -s \"{semaphore}\"" if semaphore else ""
-        process = QProcess()
-        process.start("bash", ["-c", f"dump-shm \"{shm_name}\"{sem_cmd} > \"{filename}\""])
-        if process.waitForFinished(1000):
-            if process.exitCode() != 0:
-                stderr = bytes(process.readAllStandardError()).decode("utf-8")
-                err_msg = stderr.split(':', maxsplit=2)
-                if len(err_msg) == 3:
-                    err_msg = err_msg[-1].strip()
-                else:
-                    err_msg = stderr
-                raise RuntimeError(f"{err_msg}\n\nexit code: {process.exitCode()}")
-        else:
-            process.kill()
-            raise RuntimeError(f"command dump-shm timed out")
-        pass
+        dialog, progress = SHMTools.__progress_dialog(f"{shm_name} > {filename}")
+        try:
+            dump_shm(shm_name, filename, semaphore, progress)
+        finally:
+            dialog.close()
 
     @staticmethod
     def load_shm_from_file(shm_name: str, filename: str, invert: bool, repeat: bool, semaphore: str | None) -> None:
         print(f"{shm_name} < {filename}")
-        sem_cmd = f" -s \"{semaphore}\"" if semaphore else ""
-        cmd = f"write-shm -n \"{shm_name}\""
-        if invert:
-            cmd += " -i"
-        if repeat:
-            cmd += " -r"
-        cmd += f"{sem_cmd} < \"{filename}\""
-
-        process = QProcess()
-        process.start("bash", ["-c", cmd])
-        if process.waitForFinished(1000):
-            if process.exitCode() != 0:
-                stderr = bytes(process.readAllStandardError()).decode("utf-8")
-                err_msg = stderr.split(':', maxsplit=2)
-                if len(err_msg) == 3:
-                    err_msg = err_msg[-1].strip()
-                else:
-                    err_msg = stderr
-                raise RuntimeError(f"{err_msg}\n\nexit code: {process.exitCode()}")
-        else:
-            process.kill()
-            raise RuntimeError(f"command write-shm timed out")
+        dialog, progress = SHMTools.__progress_dialog(f"{shm_name} < {filename}")
+        try:
+            load_shm(shm_name, filename, invert, repeat, semaphore, progress)
+        finally:
+            dialog.close()
@@ -0,0 +1,176 @@
+import collections
+import itertools
+import operator
+from itertools import compress, repeat
+
+TRIGGER_KINDS = {
+    "above": "value above threshold",
+    "below": "value below threshold",
+    "rising": "rising edge",
+    "falling": "falling edge",
+    "change": "change of more than X percent",
+    "stuck": "value unchanged for N seconds",
+}
+
+
+class TriggerRule:
+    """
+    @brief one trigger condition on one decoded value
+    """
+
+    def __init__(self, kind: str, shm_name: str, index: int, param: float, label: str) -> None:
+        if kind not in TRIGGER_KINDS:
+            raise RuntimeError(f"unknown trigger kind '{kind}'")
+        self.kind = kind
+        self.shm_name = shm_name
+        self.index = index
+        self.param = param
+        self.label = label
+
+    def description(self) -> str:
+        match self.kind:
+            case "above":
+                return f"{self.label} > {self.param:g}"
+            case "below":
+                return f"{self.label} < {self.param:g}"
+            case "rising":
+                return f"{self.label} rising edge"
+            case "falling":
+                return f"{self.label} falling edge"
+            case "change":
+                return f"{self.label} changed by more than {self.param:g}%"
+            case "stuck":
+                return f"{self.label} unchanged for {self.param:g}s"
+        return self.label
+
+
+def _getter(indices: list[int]):
+    if len(indices) == 1:
+        index = indices[0]
+        return lambda x: (x[index],)
+    return operator.itemgetter(*indices)
+
+
+class _RuleGroup:
+    """
+    @brief all rules of one kind on one shared memory
+
+    The values of all rules are gathered with one itemgetter call and the conditions are evaluated with map over
+    the operator functions, so the cost per tick is a few C level loops per group.
+    """
+
+    def __init__(self, kind: str, rules: list[tuple[int, TriggerRule]]) -> None:
+        self.kind = kind
+        self.ids = [rule_id for rule_id, _ in rules]
+        self.gather = _getter([rule.index for _, rule in rules])
+        self.params = [rule.param for _, rule in rules]
+        if kind == "change":
+            self.params = [p / 100 for p in self.params]
+        self.prev: tuple | None = None
+        self.last_change: list[float] = []
+
+    def evaluate(self, timestamp: float, values: list) -> list[int]:
+        cur = self.gather(values)
+        prev = self.prev
+        self.prev = cur
+
+        match self.kind:
+            case "above":
+                fired = map(operator.gt, cur, self.params)
+            case "below":
+                fired = map(operator.lt, cur, self.params)
+            case "rising":
+                if prev is None:
+                    return []
+                fired = map(operator.and_, map(operator.not_, prev), map(bool, cur))
+            case "falling":
+                if prev is None:
+                    return []
+                fired = map(operator.and_, map(bool, prev), map(operator.not_, cur))
+            case "change":
+                if prev is None:
+                    return []
+                # |cur - prev| > ratio * |prev|
+                fired = map(operator.gt, map(abs, map(operator.sub, cur, prev)),
+                            map(operator.mul, self.params, map(abs, prev)))
+            case "stuck":
+                if prev is None:
+                    self.last_change = [timestamp] * len(cur)
+                    return []
+                for i in compress(itertools.count(), map(operator.ne, cur, prev)):
+                    self.last_change[i] = timestamp
+                fired = map(operator.ge, map(operator.sub, repeat(timestamp), self.last_change), self.params)
+            case _:
+                return []
+        return list(compress(self.ids, fired))
+
+
+class TriggerEngine:
+    """
+    @brief evaluates trigger rules on every sample and captures the history around the first firing rule
+
+    Like the single shot mode of an oscilloscope: while armed, the last `pre` samples are kept; when a rule fires,
+    `post` further samples are collected. The capture (pre + post samples) is then available in `capture` and the
+    engine is disarmed.
+    """
+
+    def __init__(self, rules: list[TriggerRule], pre: int, post: int) -> None:
+        self.rules = rules
+        self.post = post
+
+        by_group: dict[tuple[str, str], list] = {}
+        for rule_id, rule in enumerate(rules):
+            by_group.setdefault((rule.shm_name, rule.kind), []).append((rule_id, rule))
+        self.groups = [(shm_name, _RuleGroup(kind, group)) for (shm_name, kind), group in by_group.items()]
+
+        self.history: collections.deque[tuple[float, dict[str, list]]] = collections.deque(maxlen=pre)
+        self.armed = False
+        self.fired: TriggerRule | None = None
+        self.fire_time: float | None = None
+        self.post_samples: list[tuple[float, dict[str, list]]] = []
+        self.capture: list[tuple[float, dict[str, list]]] | None = None
+
+    def arm(self) -> None:
+        self.history.clear()
+        self.armed = True
+        self.fired = None
+        self.fire_time = None
+        self.post_samples = []
+        self.capture = None
+
+    def evaluate(self, timestamp: float, values: dict[str, list]) -> list[int]:
+        """
+        @brief ids of all rules that fire for this sample
+        """
+        fired = []
+        for shm_name, group in self.groups:
+            fired += group.evaluate(timestamp, values[shm_name])
+        return fired
+
+    def process(self, timestamp: float, values: dict[str, list]) -> bool:
+        """
+        @brief process one sample
+        @return True if a capture was completed with this sample
+        """
+        if not self.armed:
+            # keep the state of the edge and stuck rules up to date
+            self.evaluate(timestamp, values)
+            return False
+
+        if self.fired is None:
+            fired = self.evaluate(timestamp, values)
+            if len(fired) > 0:
+                self.fired = self.rules[min(fired)]
+                self.fire_time = timestamp
+                self.post_samples.append((timestamp, values))
+            else:
+                self.history.append((timestamp, values))
+        else:
+            self.evaluate(timestamp, values)
+            self.post_samples.append((timestamp, values))
+
+        if self.fired is not None and len(self.post_samples) >= self.post:
+            self.capture = list(self.history) + self.post_samples
+            self.armed = False
+            return True
+        return False
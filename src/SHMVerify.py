@@ -0,0 +1,144 @@
+import threading
+import time
+
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+from .SHMMap import SHMMap, read_consistent
+
+# rate of the overwrite detection (resolution of the time to overwrite)
+POLL_RATE = 100
+
+# values that are not overwritten within this time are no longer watched
+WATCH_TIMEOUT = 10.0
+
+
+class VerifyStats:
+    """
+    @brief write verification statistics of one entry
+
+    apply to verify latency: time from the start of the write until the read back of the written bytes completed
+    time to overwrite: time from the end of the write until the bytes were changed by someone else
+    expiries: written values that were not overwritten within WATCH_TIMEOUT (no longer watched)
+    """
+
+    def __init__(self) -> None:
+        self.applies = 0
+        self.mismatches = 0
+        self.latency_sum = 0.0
+        self.latency_max = 0.0
+        self.overwrites = 0
+        self.overwrite_sum = 0.0
+        self.overwrite_min: float | None = None
+        self.overwrite_max = 0.0
+        self.expiries = 0
+
+    def add_verify(self, latency: float, ok: bool) -> None:
+        self.applies += 1
+        if not ok:
+            self.mismatches += 1
+        self.latency_sum += latency
+        self.latency_max = max(self.latency_max, latency)
+
+    def add_overwrite(self, seconds: float) -> None:
+        self.overwrites += 1
+        self.overwrite_sum += seconds
+        self.overwrite_min = seconds if self.overwrite_min is None else min(self.overwrite_min, seconds)
+        self.overwrite_max = max(self.overwrite_max, seconds)
+
+    def add_expiry(self) -> None:
+        self.expiries += 1
+
+    def description(self) -> str:
+        if self.applies == 0:
+            return "not verified"
+        text = (f"{self.applies} applies, {self.mismatches} mismatches, verify latency "
+                f"mean {self.latency_sum / self.applies * 1e6:.1f} us / max {self.latency_max * 1e6:.1f} us")
+        if self.overwrites > 0:
+            text += (f", {self.overwrites} overwrites after min {self.overwrite_min * 1e3:.3f} ms / "
+                     f"mean {self.overwrite_sum / self.overwrites * 1e3:.3f} ms / "
+                     f"max {self.overwrite_max * 1e3:.3f} ms")
+        if self.expiries > 0:
+            text += f", {self.expiries} not overwritten within {WATCH_TIMEOUT:g} s"
+        return text
+
+
+class SHMWriteMonitor(QThread):
+    """
+    @brief detects when written values are overwritten by someone else (e.g. the modbus master)
+
+    Each watched value (entry index, shared memory, offset, written bytes, write time) is polled at POLL_RATE until its
+    bytes differ from the written ones, but at most for WATCH_TIMEOUT seconds, so values that are never overwritten do
+    not keep the semaphore busy. Such expired watches are reported via the signal expired. All watched ranges are
+    read in one critical section of the semaphore per poll.
+    Watches are added by the thread that wrote the values and removed by the gui thread, so they are guarded by a
+    lock.
+    """
+
+    overwritten = QtCore.Signal(int, float, bytes)
+    expired = QtCore.Signal(int)
+    failed = QtCore.Signal(str)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super(SHMWriteMonitor, self).__init__(parent)
+
+        self.__watches: dict[int, tuple[SHMMap, int, bytes, float]] = {}
+        self.__lock = threading.Lock()
+        self.__stop = False
+
+    def watch(self, index: int, shm: SHMMap, offset: int, data: bytes, write_time: float) -> None:
+        """
+        @brief watch a written value (replaces the previous watch of the entry)
+        @param write_time time.perf_counter() at the end of the write
+        """
+        with self.__lock:
+            self.__watches[index] = (shm, offset, data, write_time)
+
+    def unwatch(self, index: int) -> None:
+        with self.__lock:
+            self.__watches.pop(index, None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__watches.clear()
+
+    def run(self) -> None:
+        period = 1.0 / POLL_RATE
+        deadline = time.perf_counter()
+        while not self.__stop:
+            now = time.perf_counter()
+            if now < deadline:
+                time.sleep(deadline - now)
+            deadline = max(deadline + period, time.perf_counter())
+
+            with self.__lock:
+                expired = [index for index, (_, _, _, write_time) in self.__watches.items()
+                           if deadline - write_time > WATCH_TIMEOUT]
+                for index in expired:
+                    del self.__watches[index]
+                watches = list(self.__watches.items())
+            for index in expired:
+                self.expired.emit(index)
+            if len(watches) == 0:
+                continue
+
+            try:
+                current = read_consistent([(shm, offset, len(data)) for _, (shm, offset, data, _) in watches])
+            except Exception as e:
+                self.failed.emit(f"{e}")
+                return
+            now = time.perf_counter()
+
+            for (index, (_, _, data, write_time)), cur in zip(watches, current):
+                if cur != data:
+                    with self.__lock:
+                        # only report it if the entry was not written again in the meantime
+                        watch = self.__watches.get(index)
+                        if watch is None or watch[3] != write_time:
+                            continue
+                        del self.__watches[index]
+                    self.overwritten.emit(index, now - write_time, cur)
+
+    def stop(self) -> None:
+        self.__stop = True
+        self.wait()
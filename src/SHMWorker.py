@@ -0,0 +1,80 @@
+from PySide6 import QtCore
+from PySide6.QtCore import QThread
+
+
+class _Runner(QtCore.QObject):
+    done = QtCore.Signal(object)
+    failed = QtCore.Signal(str)
+
+    @QtCore.Slot(object)
+    def run(self, job) -> None:
+        func, args = job
+        try:
+            result = func(*args)
+        except Exception as e:
+            self.failed.emit(f"{e}")
+        else:
+            self.done.emit(result)
+
+
+class SHMWorker(QtCore.QObject):
+    """
+    @brief executes shared memory jobs on a separate thread
+
+    Results are delivered to the GUI thread via the signals result and error.
+    Jobs that are submitted while another job is still running are skipped (submit) or queued (queue).
+    """
+
+    result = QtCore.Signal(object)
+    error = QtCore.Signal(str)
+    _request = QtCore.Signal(object)
+
+    def __init__(self, parent: QtCore.QObject | None = None) -> None:
+        super(SHMWorker, self).__init__(parent)
+
+        self.pending = 0
+        self.skipped = 0
+
+        self.worker_thread = QThread()
+        self.runner = _Runner()
+        self.runner.moveToThread(self.worker_thread)
+        self._request.connect(self.runner.run)
+        self.runner.done.connect(self.__on_done)
+        self.runner.failed.connect(self.__on_failed)
+        self.worker_thread.start()
+
+    def busy(self) -> bool:
+        return self.pending > 0
+
+    def submit(self, func, *args) -> bool:
+        """
+        @brief run func(*args) on the worker thread, unless the previous job is still running
+        @return False if the job was skipped
+        """
+        if self.pending > 0:
+            self.skipped += 1
+            return False
+        self.queue(func, *args)
+        return True
+
+    def queue(self, func, *args) -> None:
+        """
+        @brief run func(*args) on the worker thread after all previously queued jobs
+        """
+        self.pending += 1
+        self._request.emit((func, args))
+
+    def __on_done(self, result) -> None:
+        self.pending -= 1
+        self.result.emit(result)
+
+    def __on_failed(self, message: str) -> None:
+        self.pending -= 1
+        self.error.emit(message)
+
+    def stop(self) -> None:
+        """
+        @brief wait for the running job and stop the worker thread
+        """
+        self.worker_thread.quit()
+        self.worker_thread.wait()
@@ -0,0 +1,156 @@
+import re
+import struct
+import threading
+
+from .SHMMap import SHMMap, LockStats, read_consistent, write_consistent
+
+# register size in bytes of the modbus shared memories
+REGISTER_SIZES = {"DO": 1, "DI": 1, "AO": 2, "AI": 2}
+
+# suffix of the stdin-to-modbus-shm commands, e.g. ":u16b", ":i8_lo", ":f32lr"
+_SUFFIX = re.compile(r":([uif])(8|16|32|64)(_lo|_hi)?([lb]?)(r?)")
+_INT_CODES = {8: 'b', 16: 'h', 32: 'i', 64: 'q'}
+_FLOAT_CODES = {32: 'f', 64: 'd'}
+
+
+def swap16(data: bytes) -> bytes:
+    """
+    @brief reverse the order of the 16 bit words
+    """
+    words = [data[i:i + 2] for i in range(0, len(data), 2)]
+    return b"".join(reversed(words))
+
+
+class ValueEncoder:
+    """
+    @brief precompiled encoder for one value as stdin-to-modbus-shm would write it
+    """
+
+    def __init__(self, register: str, addr: int, suffix: str) -> None:
+        """
+        @param register DO, DI, AO or AI
+        @param addr register address
+        @param suffix data type suffix of the stdin-to-modbus-shm command (empty for bool values)
+        """
+        if register not in REGISTER_SIZES:
+            raise RuntimeError(f"invalid register '{register}'")
+        self.register = register
+        self.offset = addr * REGISTER_SIZES[register]
+        self.suffix = suffix
+        self.reverse = False
+
+        if suffix == "":
+            self.kind = "bool"
+            self.struct = struct.Struct('B')
+            self.min = 0
+            self.max = 1
+            return
+
+        match = _SUFFIX.fullmatch(suffix)
+        if match is None:
+            raise RuntimeError(f"invalid data type '{suffix}'")
+        data_type, bits, byte_select, endian, reverse = match.groups()
+        bits = int(bits)
+
+        if bits == 8:
+            # one byte of the register: low byte at the lower address
+            if byte_select == "_hi":
+                self.offset += 1
+        elif not endian:
+            raise RuntimeError(f"missing endian in data type '{suffix}'")
+        byte_order = '<' if endian == 'l' else '>'
+        self.reverse = reverse == 'r'
+
+        if data_type == 'f':
+            if bits not in _FLOAT_CODES:
+                raise RuntimeError(f"invalid float size {bits}")
+            self.kind = "float"
+            self.struct = struct.Struct(byte_order + _FLOAT_CODES[bits])
+            self.max = 3.4028234663852886e38 if bits == 32 else float("inf")
+            self.min = -self.max
+        else:
+            self.kind = "int"
+            signed = data_type == 'i'
+            self.struct = struct.Struct(byte_order + (_INT_CODES[bits] if signed else _INT_CODES[bits].upper()))
+            self.min = -(2 ** (bits - 1)) if signed else 0
+            self.max = 2 ** (bits - 1) - 1 if signed else 2 ** bits - 1
+
+    def parse(self, value: str) -> int | float:
+        try:
+            if self.kind == "float":
+                return float(value)
+            return int(float(value)) if '.' in value else int(value, 0)
+        except ValueError as e:
+            raise RuntimeError(f"invalid value '{value}': {e}")
+
+    def clamp(self, number: float) -> int | float:
+        """
+        @brief convert a generated number to the nearest value that fits the data type
+        """
+        if self.kind == "float":
+            return min(max(number, self.min), self.max)
+        if self.kind == "bool":
+            return 1 if number >= 0.5 else 0
+        return min(max(round(number), self.min), self.max)
+
+    def encode(self, number: int | float) -> bytes:
+        if self.kind == "bool":
+            number = 1 if number else 0
+        try:
+            data = self.struct.pack(number)
+        except struct.error as e:
+            raise RuntimeError(f"failed to encode value '{number}' as {self.suffix[1:] or 'bool'}: {e}")
+        return swap16(data) if self.reverse else data
+
+
+def encode_value(register: str, addr: int, suffix: str, value: str) -> tuple[int, bytes]:
+    """
+    @brief encode one value as stdin-to-modbus-shm would write it
+    @return byte offset in the shared memory and the bytes to write
+    """
+    encoder = ValueEncoder(register, addr, suffix)
+    return encoder.offset, encoder.encode(encoder.parse(value))
+
+
+class SHMWriter:
+    """
+    @brief writes encoded values into the modbus shared memories
+
+    The shared memories are mapped writable once. A batch of values is written in a single critical section of the
+    semaphore, so the modbus client either sees all or none of the values of a batch.
+    One writer is shared by several threads (apply worker, generator, sequence player): the mappings are guarded by
+    a lock and each thread passes its own semaphore statistics.
+    """
+
+    def __init__(self, name_prefix: str, semaphore: str | None = None) -> None:
+        self.name_prefix = name_prefix
+        self.semaphore = semaphore
+        self.shm: dict[str, SHMMap] = {}
+        self.__lock = threading.Lock()
+
+    def get_shm(self, register: str) -> SHMMap:
+        with self.__lock:
+            if register not in self.shm:
+                self.shm[register] = SHMMap(f"{self.name_prefix}{register}", self.semaphore, writable=True)
+            return self.shm[register]
+
+    def write(self, items: list[tuple[str, int, bytes]], stats: LockStats | None = None) -> None:
+        """
+        @brief write a batch of encoded values
+        @param items list of (register, offset, data)
+        @param stats optional statistics of the semaphore hold time (of the calling client)
+        """
+        write_consistent([(self.get_shm(register), offset, data) for register, offset, data in items], stats)
+
+    def read_back(self, items: list[tuple[str, int, bytes]]) -> list[bytes]:
+        """
+        @brief read the current bytes at the locations of a batch of encoded values (in one critical section)
+        @param items list of (register, offset, data)
+        """
+        return read_consistent([(self.get_shm(register), offset, len(data)) for register, offset, data in items])
+
+    def close(self) -> None:
+        with self.__lock:
+            for shm in self.shm.values():
+                shm.close()
+            self.shm = {}
@@ -0,0 +1,141 @@
+import csv
+import json
+import mmap
+import sys
+import tempfile
+from typing import BinaryIO, TextIO
+
+# struct/array type codes of the supported value columns
+TYPE_SIZES = {'B': 1, 'q': 8, 'Q': 8, 'd': 8}
+
+BINARY_MAGIC = b"SHMREC1\n"
+CSV_CHUNK = 4096
+
+
+class SampleRing:
+    """
+    @brief fixed size ring buffer of samples (one timestamp column and one typed column per value)
+
+    All columns are preallocated in one memory mapped temporary file, so deep recordings do not grow the RAM
+    usage of the process. Each column is accessed as typed memoryview; appending a sample only assigns one
+    element per column.
+    """
+
+    def __init__(self, columns: list[tuple[str, str]], depth: int, directory: str | None = None) -> None:
+        """
+        @param columns list of (name, type code); type codes: B (bool), q (signed int), Q (unsigned int), d (float)
+        @param depth maximum number of samples
+        @param directory directory of the backing file (default: system temp directory)
+        """
+        if depth <= 0:
+            raise RuntimeError(f"invalid ring buffer depth {depth}")
+        for name, code in columns:
+            if code not in TYPE_SIZES:
+                raise RuntimeError(f"unsupported column type '{code}' ({name})")
+
+        self.names = [name for name, _ in columns]
+        self.codes = [code for _, code in columns]
+        self.depth = depth
+        self.head = 0
+        self.count = 0
+        self.total = 0  # number of samples appended since creation
+
+        # column layout: time column followed by all value columns (each column starts 8 byte aligned)
+        sizes = [8] + [TYPE_SIZES[code] for code in self.codes]
+        strides = [(size * depth + 7) // 8 * 8 for size in sizes]
+        self.file = tempfile.TemporaryFile(prefix="shm-modbus-gui-rec", dir=directory)
+        self.file.truncate(sum(strides))
+        self.mmap = mmap.mmap(self.file.fileno(), sum(strides))
+
+        views = []
+        offset = 0
+        raw = memoryview(self.mmap)
+        for size, stride, code in zip(sizes, strides, ['d'] + self.codes):
+            views.append(raw[offset:offset + size * depth].cast(code))
+            offset += stride
+        raw.release()
+
+        self.time = views[0]
+        self.columns = views[1:]
+
+    def __len__(self) -> int:
+        return self.count
+
+    def append(self, timestamp: float, values: list) -> None:
+        """
+        @brief append one sample (values in column order); the oldest sample is overwritten if the ring is full
+        """
+        head = self.head
+        self.time[head] = timestamp
+        for column, value in zip(self.columns, values):
+            column[head] = value
+
+        self.head = head + 1 if head + 1 < self.depth else 0
+        if self.count < self.depth:
+            self.count += 1
+        self.total += 1
+
+    def clear(self) -> None:
+        # head is kept, so that sample number n is always stored at index n % depth
+        self.count = 0
+
+    def closed(self) -> bool:
+        return self.mmap.closed
+
+    def slices(self, column: memoryview, begin: int, end: int) -> list[memoryview]:
+        """
+        @brief views of the samples [begin, end) of a column (sample numbers as counted by total)
+        """
+        start = begin % self.depth
+        stop = start + end - begin
+        if stop <= self.depth:
+            return [column[start:stop]]
+        return [column[start:], column[:stop - self.depth]]
+
+    def segments(self) -> list[tuple[int, int]]:
+        """
+        @brief [start, end) index ranges of the stored samples in chronological order
+        """
+        start = (self.head - self.count) % self.depth
+        if self.count == 0:
+            return []
+        if start + self.count <= self.depth:
+            return [(start, start + self.count)]
+        return [(start, self.depth), (0, start + self.count - self.depth)]
+
+    def export_csv(self, f: TextIO) -> None:
+        """
+        @brief write all samples as csv (streamed in chunks directly from the ring)
+        """
+        writer = csv.writer(f)
+        writer.writerow(["time"] + self.names)
+        for start, end in self.segments():
+            for begin in range(start, end, CSV_CHUNK):
+                stop = min(begin + CSV_CHUNK, end)
+                writer.writerows(zip(self.time[begin:stop], *(c[begin:stop] for c in self.columns)))
+
+    def export_binary(self, f: BinaryIO) -> None:
+        """
+        @brief write all samples in a columnar binary format
+
+        Format: magic line, one json header line (count, byte order, columns) followed by the raw time column and
+        the raw value columns in chronological order.
+        """
+        header = {
+            "count": self.count,
+            "byteorder": sys.byteorder,
+            "columns": [{"name": "time", "type": 'd'}] + [{"name": n, "type": c} for n, c in
+                                                           zip(self.names, self.codes)],
+        }
+        f.write(BINARY_MAGIC)
+        f.write(json.dumps(header).encode("utf-8") + b"\n")
+        for column in [self.time] + self.columns:
+            for start, end in self.segments():
+                f.write(column[start:end])
+
+    def close(self) -> None:
+        for view in [self.time] + self.columns:
+            view.release()
+        self.columns = []
+        self.mmap.close()
+        self.file.close()
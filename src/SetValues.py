@@ -1,10 +1,11 @@
 import enum
 import hashlib
 import json
+import time
 from datetime import datetime
 
 from PySide6 import QtWidgets, QtCore
-from PySide6.QtCore import Qt, QMutex, QProcess
+from PySide6.QtCore import Qt, QMutex, QTimer
 from PySide6.QtGui import QFontDatabase
 from PySide6.QtWidgets import QTableWidgetItem, QPushButton, QInputDialog, QMessageBox, QFileDialog
 
@@ -12,6 +13,12 @@ from .SetValues_AddFloat import SetValues_AddFloat
 from .SetValues_AddInt import SetValues_AddInt
 from .SetValues_AddBool import SetValues_AddBool
 from .py_ui import Ui_SetValues
+from .SHMMap import LockStats
+from .SHMWorker import SHMWorker
+from .SHMWriter import SHMWriter, ValueEncoder, encode_value
+from .SHMGenerator import SHMGenerator, Waveform, WAVEFORMS
+from .SHMSequence import SHMSequencePlayer
+from .SHMVerify import SHMWriteMonitor, VerifyStats
 
 
 class SetValuesEntry:
@@ -55,6 +62,15 @@ class SetValuesEntry:
         self.value_widget = None
         self.time_widget = None
 
+        # encoded value (register, offset, data), created on demand
+        self.encoded: tuple[str, int, bytes] | None = None
+
+        # optional generated signal
+        self.waveform: Waveform | None = None
+
+        # write verification statistics
+        self.verify = VerifyStats()
+
         self.create_table_entry()
 
     def create_table_entry(self) -> None:
@@ -111,9 +127,29 @@ class SetValuesEntry:
     def get_command(self) -> str:
         return f"{self.prefix}{self.value}{self.suffix}"
 
+    def get_write(self) -> tuple[str, int, bytes]:
+        """
+        @brief encoded value as (register, byte offset, data); encoded once per value
+        """
+        if self.encoded is None:
+            offset, data = encode_value(self.register, int(self.addr, 0), self.suffix, self.value)
+            self.encoded = (self.register, offset, data)
+        return self.encoded
+
     def set_time(self, time_str):
         self.time_widget.setText(time_str)
 
+    def update_verify(self):
+        self.time_widget.setToolTip(self.verify.description())
+
+    def get_encoder(self) -> ValueEncoder:
+        return ValueEncoder(self.register, int(self.addr, 0), self.suffix)
+
+    def set_waveform(self, waveform: Waveform | None):
+        self.waveform = waveform
+        self.value_widget.setToolTip(waveform.description() if waveform else "")
+        self.value_widget.setText(f"~ {self.value}" if waveform else self.value)
+
     def edit_value(self):
         ok = False
         value = None
@@ -138,7 +174,8 @@ class SetValuesEntry:
 
         if ok:
             self.value = f"{value}"
-            self.value_widget.setText(self.value)
+            self.encoded = None
+            self.value_widget.setText(f"~ {self.value}" if self.waveform else self.value)
 
     def to_json_dict(self) -> dict:
         return {
@@ -151,7 +188,8 @@ class SetValuesEntry:
             "size": self.size,
             "endian_str": self.endian_str,
             "value_type": self.value_type.value,
-            "type_str": self.type_str
+            "type_str": self.type_str,
+            **({"waveform": self.waveform.to_json_dict()} if self.waveform else {}),
         }
 
     @classmethod
@@ -175,9 +213,19 @@ class SetValuesEntry:
             if not isinstance(json_dict[key], dtype):
                 raise RuntimeError(f"key '{key}' has invalid data type")
 
-        return cls(index, parent, json_dict["prefix"], json_dict["value"], json_dict["suffix"], json_dict["name"],
-                   json_dict["register"], json_dict["addr"], json_dict["size"], json_dict["endian_str"],
-                   SetValuesEntry.ValueType(json_dict["value_type"]), json_dict["type_str"])
+        waveform = None
+        if "waveform" in json_dict:
+            try:
+                waveform = Waveform.from_json_dict(json_dict["waveform"])
+            except (KeyError, TypeError, ValueError) as e:
+                raise RuntimeError(f"invalid waveform: {e}")
+
+        entry = cls(index, parent, json_dict["prefix"], json_dict["value"], json_dict["suffix"], json_dict["name"],
+                    json_dict["register"], json_dict["addr"], json_dict["size"], json_dict["endian_str"],
+                    SetValuesEntry.ValueType(json_dict["value_type"]), json_dict["type_str"])
+        if waveform:
+            entry.set_waveform(waveform)
+        return entry
 
 
     @classmethod
@@ -224,10 +272,40 @@ class SetValues(QtWidgets.QMainWindow, Ui_SetValues):
 
         self.exec_mutex = QMutex()
 
+        # values are written on a worker thread, the results are applied in the GUI thread
+        self.writer = SHMWriter(self.name_prefix, self.semaphore)
+        self.apply_lock_stats = LockStats()
+        self.worker = SHMWorker(self)
+        self.worker.result.connect(self.on_apply_finished)
+        self.worker.error.connect(lambda msg: QMessageBox.warning(self, "Failed to write values", msg))
+
         self.setWindowTitle(f"{self.windowTitle()} {self.name_prefix}*")
 
+        # signal generator
+        self.generator: SHMGenerator | None = None
+        self.generator_rate = 100
+        self.generator_stats_timer = QTimer()
+        self.generator_stats_timer.timeout.connect(self.show_generator_stats)
+
+        # sequence playback
+        self.sequence: SHMSequencePlayer | None = None
+        self.sequence_speed = 1.0
+        self.sequence_stats_timer = QTimer()
+        self.sequence_stats_timer.timeout.connect(self.show_sequence_stats)
+
+        # write verification
+        self.monitor: SHMWriteMonitor | None = None
+
+        # entries that are written by the generator or the sequence player are not watched for overwrites
+        self.generator_entries: set[int] = set()
+        self.sequence_entries: set[int] = set()
+        self.driven_entries: frozenset[int] = frozenset()
+
         self.__setup_buttons()
         self.__setup_actions()
+        self.__setup_generator_actions()
+        self.__setup_sequence_actions()
+        self.__setup_verify_actions()
 
     def __setup_buttons(self) -> None:
         self.button_add_int.clicked.connect(self.on_button_add_int)
@@ -239,6 +317,22 @@ class SetValues(QtWidgets.QMainWindow, Ui_SetValues):
         self.actionsave_config.triggered.connect(self.on_actions_save)
         self.actionload_config.triggered.connect(self.on_action_load)
 
+    def __setup_generator_actions(self) -> None:
+        self.actionSetWaveform.triggered.connect(self.on_action_set_waveform)
+        self.actionRemoveWaveform.triggered.connect(self.on_action_remove_waveform)
+        self.actionGeneratorRate.triggered.connect(self.on_action_generator_rate)
+        self.actionRunGenerator.toggled.connect(self.on_action_run_generator_toggled)
+
+    def __setup_sequence_actions(self) -> None:
+        self.actionPlaySequence.triggered.connect(self.on_action_play_sequence)
+        self.actionStopSequence.triggered.connect(self.stop_sequence)
+        self.actionSequenceSpeed.triggered.connect(self.on_action_sequence_speed)
+
+    def __setup_verify_actions(self) -> None:
+        self.actionVerifyWrites.toggled.connect(self.on_action_verify_writes_toggled)
+        self.actionVerifyStatistics.triggered.connect(self.on_action_verify_statistics)
+        self.actionVerifyReset.triggered.connect(self.on_action_verify_reset)
+
     def add_done(self):
         self.setEnabled(True)
         self.add_window = None
@@ -353,6 +447,10 @@ class SetValues(QtWidgets.QMainWindow, Ui_SetValues):
             pass
 
         # clear table and config
+        self.actionRunGenerator.setChecked(False)
+        self.stop_sequence()
+        if self.monitor:
+            self.monitor.clear()
         self.data_table.setRowCount(0)
         self.cfg_index = len(loaded_cfg)
         self.cfg_data = {}
@@ -368,53 +466,340 @@ class SetValues(QtWidgets.QMainWindow, Ui_SetValues):
 
     def delete_cfg(self, index: int):
         del self.cfg_data[index]
+        self.actionRunGenerator.setChecked(False)
+        self.stop_sequence()
+        if self.monitor:
+            self.monitor.unwatch(index)
 
-    def execute(self, index: int | None):
-        self.exec_mutex.lock()
-        command_list = []
-        if index:
-            command_list.append(self.cfg_data[index].get_command())
+    def selected_entry(self) -> SetValuesEntry | None:
+        row = self.data_table.currentRow()
+        for cfg in self.cfg_data.values():
+            if cfg.value_widget.row() == row:
+                return cfg
+        return None
+
+    def on_action_set_waveform(self) -> None:
+        entry = self.selected_entry()
+        if entry is None:
+            QMessageBox.information(self, "Set waveform", "Select an entry.")
+            return
+
+        current = entry.waveform
+        kind, ok = QInputDialog.getItem(self, "Set waveform", "Waveform:", WAVEFORMS,
+                                        WAVEFORMS.index(current.kind) if current else 0, False)
+        if not ok:
+            return
+
+        steps = []
+        if kind == "step table":
+            text, ok = QInputDialog.getText(self, "Set waveform", "Step values (separated by spaces):",
+                                            text=" ".join(f"{x:g}" for x in current.steps) if current else "0 1")
+            if not ok:
+                return
+            try:
+                steps = [float(x) for x in text.replace(',', ' ').split()]
+            except ValueError as e:
+                QMessageBox.warning(self, "Set waveform", f"Invalid step table: {e}")
+                return
+
+        amplitude, ok = QInputDialog.getDouble(self, "Set waveform", "Amplitude:",
+                                               current.amplitude if current else 1.0, -1e300, 1e300, 6)
+        if not ok:
+            return
+        offset, ok = QInputDialog.getDouble(self, "Set waveform", "Offset:", current.offset if current else 0.0,
+                                            -1e300, 1e300, 6)
+        if not ok:
+            return
+        period, ok = QInputDialog.getDouble(self, "Set waveform", "Period [s]:", current.period if current else 1.0,
+                                            0.001, 1e9, 3)
+        if not ok:
+            return
+
+        try:
+            waveform = Waveform(kind, amplitude, offset, period, steps)
+        except RuntimeError as e:
+            QMessageBox.warning(self, "Set waveform", f"{e}")
+            return
+
+        self.actionRunGenerator.setChecked(False)
+        entry.set_waveform(waveform)
+
+    def on_action_remove_waveform(self) -> None:
+        entry = self.selected_entry()
+        if entry is None:
+            QMessageBox.information(self, "Remove waveform", "Select an entry.")
+            return
+        self.actionRunGenerator.setChecked(False)
+        entry.set_waveform(None)
+
+    def on_action_generator_rate(self) -> None:
+        rate, ok = QInputDialog.getInt(self, "Generator rate", "Rate [Hz]:", self.generator_rate, 1, 1000)
+        if ok:
+            self.generator_rate = rate
+            if self.generator:
+                self.stop_generator()
+                self.start_generator()
+
+    def on_action_run_generator_toggled(self, checked: bool) -> None:
+        if checked:
+            if not self.start_generator():
+                self.actionRunGenerator.setChecked(False)
         else:
-            for cfg in self.cfg_data.values():
-                command_list.append(cfg.get_command())
+            self.stop_generator()
 
-        if len(command_list) == 0:
+    def start_generator(self) -> bool:
+        self.exec_mutex.lock()
+        try:
+            entries = [i for i, cfg in self.cfg_data.items() if cfg.waveform]
+            signals = [(self.cfg_data[i].get_encoder(), self.cfg_data[i].waveform) for i in entries]
+            if len(signals) == 0:
+                QMessageBox.information(self, "Generator", "No entry has a waveform.")
+                return False
+
+            # map the shared memories before the generator thread is started
+            for encoder, _ in signals:
+                self.writer.get_shm(encoder.register)
+        except RuntimeError as e:
+            QMessageBox.warning(self, "Generator", f"{e}")
+            return False
+        finally:
             self.exec_mutex.unlock()
+
+        self.generator = SHMGenerator(self.writer, signals, self.generator_rate)
+        self.generator.failed.connect(self.on_generator_failed)
+        self.generator.start(QtCore.QThread.TimeCriticalPriority)
+        self.generator_stats_timer.start(1000)
+        self.generator_entries = set(entries)
+        self.update_driven_entries()
+        return True
+
+    def stop_generator(self) -> None:
+        self.generator_stats_timer.stop()
+        if self.generator:
+            self.generator.stop()
+            self.generator = None
+        self.generator_entries = set()
+        self.update_driven_entries()
+
+    def update_driven_entries(self) -> None:
+        # written by the worker thread: replaced as a whole instead of modified
+        self.driven_entries = frozenset(self.generator_entries | self.sequence_entries)
+        if self.monitor:
+            for index in self.driven_entries:
+                self.monitor.unwatch(index)
+
+    def on_generator_failed(self, message: str) -> None:
+        self.actionRunGenerator.setChecked(False)
+        QMessageBox.warning(self, "Generator failed", message)
+
+    def show_generator_stats(self) -> None:
+        if self.generator is None:
             return
+        ticks, overruns, max_late = self.generator.take_stats()
+        self.statusbar.showMessage(f"generator: {ticks} ticks/s, max jitter {max_late * 1e3:.3f} ms, "
+                                   f"{overruns} overruns")
 
-        cmd_args = ['-n', f'{self.name_prefix}', '--pid', '0']
-        if self.semaphore:
-            cmd_args.append('--semaphore')
-            cmd_args.append(f'{self.semaphore}')
-            cmd_args.append('--semaphore-timeout')
-            cmd_args.append('1')
-
-        process = QProcess()
-        process.start("stdin-to-modbus-shm", cmd_args)
-        if process.waitForStarted(1000):
-            process.write("\n".join(command_list).encode())
-            process.closeWriteChannel()
-            if process.waitForFinished(1000):
-                if process.exitCode() != 0:
-                    stderr = bytes(process.readAllStandardError()).decode("utf-8")
-                    QMessageBox.warning(self, "stdin-to-modbus-shm failed", stderr)
-                else:
-                    time = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    def on_action_play_sequence(self) -> None:
+        file_name, _ = QFileDialog.getOpenFileName(self, caption="Play sequence",
+                                                   filter="Sequence (*.csv *.json *.jsonl);;All files (*)")
+        if len(file_name) <= 0:
+            return
+
+        self.stop_sequence()
 
-                    if index:
-                        self.cfg_data[index].set_time(time)
-                    else:
-                        for cfg in self.cfg_data.values():
-                            cfg.set_time(time)
+        self.exec_mutex.lock()
+        try:
+            # the events of the sequence refer to the entries by name
+            encoders = {cfg.name: cfg.get_encoder() for cfg in self.cfg_data.values()}
+
+            # map the shared memories before the player thread is started
+            for encoder in encoders.values():
+                self.writer.get_shm(encoder.register)
+        except RuntimeError as e:
+            QMessageBox.warning(self, "Sequence", f"{e}")
+            return
+        finally:
+            self.exec_mutex.unlock()
+
+        if len(encoders) == 0:
+            QMessageBox.information(self, "Sequence", "No entries configured.")
+            return
+
+        self.sequence = SHMSequencePlayer(self.writer, file_name, encoders, self.sequence_speed,
+                                          self.actionSequenceLoop.isChecked())
+        self.sequence.failed.connect(self.on_sequence_failed)
+        self.sequence.finished.connect(self.on_sequence_finished)
+        self.sequence.start(QtCore.QThread.TimeCriticalPriority)
+        self.sequence_stats_timer.start(1000)
+        self.actionStopSequence.setEnabled(True)
+        # the events of the sequence may refer to any entry
+        self.sequence_entries = set(self.cfg_data.keys())
+        self.update_driven_entries()
+
+    def on_action_sequence_speed(self) -> None:
+        speed, ok = QInputDialog.getDouble(self, "Sequence speed", "Speed factor:", self.sequence_speed,
+                                           0.001, 1000.0, 3)
+        if ok:
+            self.sequence_speed = speed
+
+    def stop_sequence(self) -> None:
+        self.sequence_stats_timer.stop()
+        self.actionStopSequence.setEnabled(False)
+        if self.sequence:
+            self.sequence.stop()
+            self.sequence = None
+        self.sequence_entries = set()
+        self.update_driven_entries()
+
+    def on_sequence_failed(self, message: str) -> None:
+        QMessageBox.warning(self, "Sequence failed", message)
+
+    def on_sequence_finished(self) -> None:
+        if self.sequence is None or self.sender() is not self.sequence:
+            # already stopped (or replaced) by the user
+            return
+        self.show_sequence_stats()
+        self.stop_sequence()
+
+    def show_sequence_stats(self) -> None:
+        if self.sequence is None:
+            return
+        batches, passes, max_late = self.sequence.take_stats()
+        self.statusbar.showMessage(f"sequence: {batches} batches written, max jitter {max_late * 1e3:.3f} ms"
+                                   + (f", {passes} pass(es) completed" if passes > 0 else ""))
+
+    def on_action_verify_writes_toggled(self, checked: bool) -> None:
+        if checked:
+            self.monitor = SHMWriteMonitor()
+            self.monitor.overwritten.connect(self.on_value_overwritten)
+            self.monitor.expired.connect(self.on_value_expired)
+            self.monitor.failed.connect(self.on_monitor_failed)
+            self.monitor.start()
+        elif self.monitor:
+            self.monitor.stop()
+            self.monitor = None
+
+    def on_monitor_failed(self, message: str) -> None:
+        self.actionVerifyWrites.setChecked(False)
+        QMessageBox.warning(self, "Write verification failed", message)
+
+    def on_value_overwritten(self, index: int, seconds: float, data: bytes) -> None:
+        self.exec_mutex.lock()
+        entry = self.cfg_data.get(index)
+        if entry:
+            entry.verify.add_overwrite(seconds)
+            entry.update_verify()
+            self.statusbar.showMessage(f"{entry.name} overwritten after {seconds * 1e3:.3f} ms "
+                                       f"(bytes: {data.hex(' ')})", 5000)
+        self.exec_mutex.unlock()
+
+    def on_value_expired(self, index: int) -> None:
+        self.exec_mutex.lock()
+        entry = self.cfg_data.get(index)
+        if entry:
+            entry.verify.add_expiry()
+            entry.update_verify()
+        self.exec_mutex.unlock()
+
+    def on_action_verify_statistics(self) -> None:
+        self.exec_mutex.lock()
+        lines = [f"{cfg.name} ({cfg.register} {cfg.addr}): {cfg.verify.description()}"
+                 for cfg in self.cfg_data.values()]
+        self.exec_mutex.unlock()
+        QMessageBox.information(self, "Write verification", "\n".join(lines) if lines else "No entries configured.")
+
+    def on_action_verify_reset(self) -> None:
+        self.exec_mutex.lock()
+        for cfg in self.cfg_data.values():
+            cfg.verify = VerifyStats()
+            cfg.update_verify()
+        self.exec_mutex.unlock()
+
+    def execute(self, index: int | None):
+        self.exec_mutex.lock()
+        try:
+            if index is not None:
+                indices = [index]
             else:
-                process.terminate()
-        else:
-            process.terminate()
+                indices = list(self.cfg_data.keys())
+            writes = [self.cfg_data[i].get_write() for i in indices]
+        except RuntimeError as e:
+            QMessageBox.warning(self, "Invalid value", f"{e}")
+            return
+        finally:
+            self.exec_mutex.unlock()
+
+        if len(writes) == 0:
+            return
+
+        # user actions are not skipped, but queued behind a running apply
+        self.worker.queue(self.write_values, writes, index, indices, self.monitor)
+
+    def write_values(self, writes: list[tuple[str, int, bytes]], index: int | None, indices: list[int],
+                     monitor: SHMWriteMonitor | None) -> tuple[int | None, int, tuple[float, list] | None]:
+        # executed on the worker thread
+        # all values are written in one critical section of the semaphore
+        start = time.perf_counter()
+        self.writer.write(writes, self.apply_lock_stats)
+        if monitor is None:
+            return index, len(writes), None
+
+        # read back the written bytes and watch the verified values for overwrites
+        write_end = time.perf_counter()
+        current = self.writer.read_back(writes)
+        latency = time.perf_counter() - start
+
+        results = []
+        for i, (register, offset, data), cur in zip(indices, writes, current):
+            results.append((i, cur == data))
+            if cur == data and i not in self.driven_entries:
+                monitor.watch(i, self.writer.get_shm(register), offset, data, write_end)
+        return index, len(writes), (latency, results)
+
+    def on_apply_finished(self, result: tuple[int | None, int, tuple[float, list] | None]):
+        index, count, verified = result
+        _, _, hold_time = self.apply_lock_stats.take()
+        message = f"{count} value(s) written, semaphore held {hold_time * 1e6:.1f} us"
+
+        if verified is not None:
+            latency, results = verified
+            mismatches = 0
+            self.exec_mutex.lock()
+            for i, ok in results:
+                if not ok:
+                    mismatches += 1
+                # the entry might have been deleted in the meantime
+                if i in self.cfg_data:
+                    self.cfg_data[i].verify.add_verify(latency, ok)
+                    self.cfg_data[i].update_verify()
+            self.exec_mutex.unlock()
+            message += f", verified after {latency * 1e6:.1f} us"
+            if mismatches > 0:
+                message += f", {mismatches} value(s) already overwritten"
 
+        self.statusbar.showMessage(message, 5000)
+
+        time_str = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+
+        self.exec_mutex.lock()
+        if index is not None:
+            # the entry might have been deleted in the meantime
+            if index in self.cfg_data:
+                self.cfg_data[index].set_time(time_str)
+        else:
+            for cfg in self.cfg_data.values():
+                cfg.set_time(time_str)
         self.exec_mutex.unlock()
 
     def closeEvent(self, event):
         super(SetValues, self).closeEvent(event)
+        self.worker.stop()
+        if self.monitor:
+            self.monitor.stop()
+            self.monitor = None
+        self.stop_generator()
+        self.stop_sequence()
+        self.writer.close()
         if self.add_window:
             self.add_window.close()
         self.closed.emit(self.name_prefix)
@@ -2,6 +2,7 @@ from .mainwindow import Ui_MainWindow
 from .mbxxxoutput import Ui_MBxxxOutput
 from .randomize_shm import Ui_RandomizeShm
 from .shm_hexdump import Ui_ShmHexdump
+from .shm_compare import Ui_ShmCompare
 from .inspect_shm import Ui_InspectSHM
 from .inspect_shm_add_int import Ui_InspectSHMAddInt
 from .inspect_shm_add_float import Ui_InspectSHMAddFloat
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'inspect_shm.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.7.0
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -20,7 +20,7 @@ from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QFram
     QGridLayout, QHeaderView, QLabel, QMainWindow,
     QMenu, QMenuBar, QPushButton, QScrollArea,
     QSizePolicy, QSlider, QSpacerItem, QSpinBox,
-    QStatusBar, QTableWidget, QTableWidgetItem, QWidget)
+    QStatusBar, QTableView, QWidget)
 
 class Ui_InspectSHM(object):
     def setupUi(self, InspectSHM):
@@ -33,6 +33,35 @@ class Ui_InspectSHM(object):
         self.actionLoad_config.setObjectName(u"actionLoad_config")
         self.actionExport_values = QAction(InspectSHM)
         self.actionExport_values.setObjectName(u"actionExport_values")
+        self.actionStream = QAction(InspectSHM)
+        self.actionStream.setObjectName(u"actionStream")
+        self.actionStream.setCheckable(True)
+        self.actionRecord = QAction(InspectSHM)
+        self.actionRecord.setObjectName(u"actionRecord")
+        self.actionRecord.setCheckable(True)
+        self.actionExportRecordCSV = QAction(InspectSHM)
+        self.actionExportRecordCSV.setObjectName(u"actionExportRecordCSV")
+        self.actionExportRecordBinary = QAction(InspectSHM)
+        self.actionExportRecordBinary.setObjectName(u"actionExportRecordBinary")
+        self.actionPlot = QAction(InspectSHM)
+        self.actionPlot.setObjectName(u"actionPlot")
+        self.actionAddTrigger = QAction(InspectSHM)
+        self.actionAddTrigger.setObjectName(u"actionAddTrigger")
+        self.actionClearTriggers = QAction(InspectSHM)
+        self.actionClearTriggers.setObjectName(u"actionClearTriggers")
+        self.actionCaptureLength = QAction(InspectSHM)
+        self.actionCaptureLength.setObjectName(u"actionCaptureLength")
+        self.actionArm = QAction(InspectSHM)
+        self.actionArm.setObjectName(u"actionArm")
+        self.actionArm.setCheckable(True)
+        self.actionStopOnTrigger = QAction(InspectSHM)
+        self.actionStopOnTrigger.setObjectName(u"actionStopOnTrigger")
+        self.actionStopOnTrigger.setCheckable(True)
+        self.actionStopOnTrigger.setChecked(True)
+        self.actionExportCapture = QAction(InspectSHM)
+        self.actionExportCapture.setObjectName(u"actionExportCapture")
+        self.actionPlotCapture = QAction(InspectSHM)
+        self.actionPlotCapture.setObjectName(u"actionPlotCapture")
         self.centralwidget = QWidget(InspectSHM)
         self.centralwidget.setObjectName(u"centralwidget")
         self.gridLayout = QGridLayout(self.centralwidget)
@@ -86,33 +115,13 @@ class Ui_InspectSHM(object):
         self.scrollAreaWidgetContents.setGeometry(QRect(0, 0, 934, 409))
         self.gridLayout_3 = QGridLayout(self.scrollAreaWidgetContents)
         self.gridLayout_3.setObjectName(u"gridLayout_3")
-        self.data_table = QTableWidget(self.scrollAreaWidgetContents)
-        if (self.data_table.columnCount() < 9):
-            self.data_table.setColumnCount(9)
-        __qtablewidgetitem = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(0, __qtablewidgetitem)
-        __qtablewidgetitem1 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(1, __qtablewidgetitem1)
-        __qtablewidgetitem2 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(2, __qtablewidgetitem2)
-        __qtablewidgetitem3 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(3, __qtablewidgetitem3)
-        __qtablewidgetitem4 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(4, __qtablewidgetitem4)
-        __qtablewidgetitem5 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(5, __qtablewidgetitem5)
-        __qtablewidgetitem6 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(6, __qtablewidgetitem6)
-        __qtablewidgetitem7 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(7, __qtablewidgetitem7)
-        __qtablewidgetitem8 = QTableWidgetItem()
-        self.data_table.setHorizontalHeaderItem(8, __qtablewidgetitem8)
-        self.data_table.setObjectName(u"data_table")
-        self.data_table.setEditTriggers(QAbstractItemView.NoEditTriggers)
-        self.data_table.setAlternatingRowColors(True)
-        self.data_table.setSortingEnabled(True)
-
-        self.gridLayout_3.addWidget(self.data_table, 0, 0, 1, 1)
+        self.data_view = QTableView(self.scrollAreaWidgetContents)
+        self.data_view.setObjectName(u"data_view")
+        self.data_view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.data_view.setAlternatingRowColors(True)
+        self.data_view.setSortingEnabled(True)
+
+        self.gridLayout_3.addWidget(self.data_view, 0, 0, 1, 1)
 
         self.scrollArea.setWidget(self.scrollAreaWidgetContents)
 
@@ -170,6 +179,19 @@ class Ui_InspectSHM(object):
 
         self.gridLayout_4.addWidget(self.label_6, 0, 5, 1, 1)
 
+        self.checkbox_sampler = QCheckBox(self.widget_2)
+        self.checkbox_sampler.setObjectName(u"checkbox_sampler")
+
+        self.gridLayout_4.addWidget(self.checkbox_sampler, 0, 8, 1, 1)
+
+        self.spinbox_sample_rate = QSpinBox(self.widget_2)
+        self.spinbox_sample_rate.setObjectName(u"spinbox_sample_rate")
+        self.spinbox_sample_rate.setMinimum(1)
+        self.spinbox_sample_rate.setMaximum(5000)
+        self.spinbox_sample_rate.setValue(1000)
+
+        self.gridLayout_4.addWidget(self.spinbox_sample_rate, 0, 9, 1, 1)
+
 
         self.gridLayout.addWidget(self.widget_2, 5, 0, 1, 1)
 
@@ -179,16 +201,39 @@ class Ui_InspectSHM(object):
         self.menubar.setGeometry(QRect(0, 0, 950, 30))
         self.menuFile = QMenu(self.menubar)
         self.menuFile.setObjectName(u"menuFile")
+        self.menuRecord = QMenu(self.menubar)
+        self.menuRecord.setObjectName(u"menuRecord")
+        self.menuTrigger = QMenu(self.menubar)
+        self.menuTrigger.setObjectName(u"menuTrigger")
         InspectSHM.setMenuBar(self.menubar)
         self.statusbar = QStatusBar(InspectSHM)
         self.statusbar.setObjectName(u"statusbar")
         InspectSHM.setStatusBar(self.statusbar)
 
         self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuRecord.menuAction())
+        self.menubar.addAction(self.menuTrigger.menuAction())
         self.menuFile.addAction(self.actionSave_config)
         self.menuFile.addAction(self.actionLoad_config)
         self.menuFile.addSeparator()
         self.menuFile.addAction(self.actionExport_values)
+        self.menuFile.addSeparator()
+        self.menuFile.addAction(self.actionStream)
+        self.menuRecord.addAction(self.actionRecord)
+        self.menuRecord.addSeparator()
+        self.menuRecord.addAction(self.actionExportRecordCSV)
+        self.menuRecord.addAction(self.actionExportRecordBinary)
+        self.menuRecord.addSeparator()
+        self.menuRecord.addAction(self.actionPlot)
+        self.menuTrigger.addAction(self.actionAddTrigger)
+        self.menuTrigger.addAction(self.actionClearTriggers)
+        self.menuTrigger.addAction(self.actionCaptureLength)
+        self.menuTrigger.addSeparator()
+        self.menuTrigger.addAction(self.actionArm)
+        self.menuTrigger.addAction(self.actionStopOnTrigger)
+        self.menuTrigger.addSeparator()
+        self.menuTrigger.addAction(self.actionExportCapture)
+        self.menuTrigger.addAction(self.actionPlotCapture)
 
         self.retranslateUi(InspectSHM)
 
@@ -196,34 +241,37 @@ class Ui_InspectSHM(object):
     # setupUi
 
     def retranslateUi(self, InspectSHM):
-        InspectSHM.setWindowTitle(QCoreApplication.translate("InspectSHM", u"Inspect Values", None))
+        InspectSHM.setWindowTitle(QCoreApplication.translate("InspectSHM", u"MainWindow", None))
         self.actionSave_config.setText(QCoreApplication.translate("InspectSHM", u"Save config", None))
         self.actionLoad_config.setText(QCoreApplication.translate("InspectSHM", u"Load config", None))
         self.actionExport_values.setText(QCoreApplication.translate("InspectSHM", u"Export values", None))
+        self.actionStream.setText(QCoreApplication.translate("InspectSHM", u"Read values in separate process", None))
+        self.actionRecord.setText(QCoreApplication.translate("InspectSHM", u"Record values", None))
+        self.actionExportRecordCSV.setText(QCoreApplication.translate("InspectSHM", u"Export recording (csv)", None))
+        self.actionExportRecordBinary.setText(QCoreApplication.translate("InspectSHM", u"Export recording (binary)", None))
+        self.actionPlot.setText(QCoreApplication.translate("InspectSHM", u"Plot selected values", None))
+        self.actionAddTrigger.setText(QCoreApplication.translate("InspectSHM", u"Add trigger on selected value...", None))
+        self.actionClearTriggers.setText(QCoreApplication.translate("InspectSHM", u"Remove all triggers", None))
+        self.actionCaptureLength.setText(QCoreApplication.translate("InspectSHM", u"Capture length...", None))
+        self.actionArm.setText(QCoreApplication.translate("InspectSHM", u"Armed", None))
+        self.actionStopOnTrigger.setText(QCoreApplication.translate("InspectSHM", u"Stop auto refresh on trigger", None))
+        self.actionExportCapture.setText(QCoreApplication.translate("InspectSHM", u"Export capture (csv)", None))
+        self.actionPlotCapture.setText(QCoreApplication.translate("InspectSHM", u"Plot capture", None))
         self.button_add_char_array.setText(QCoreApplication.translate("InspectSHM", u"add string", None))
         self.button_add_int.setText(QCoreApplication.translate("InspectSHM", u"add int", None))
         self.button_add_float.setText(QCoreApplication.translate("InspectSHM", u"add float", None))
         self.button_add_bool.setText(QCoreApplication.translate("InspectSHM", u"add bool", None))
-        ___qtablewidgetitem = self.data_table.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("InspectSHM", u"Name", None));
-        ___qtablewidgetitem1 = self.data_table.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("InspectSHM", u"Register", None));
-        ___qtablewidgetitem2 = self.data_table.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("InspectSHM", u"Address", None));
-        ___qtablewidgetitem3 = self.data_table.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("InspectSHM", u"Data Type", None));
-        ___qtablewidgetitem4 = self.data_table.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("InspectSHM", u"Size", None));
-        ___qtablewidgetitem5 = self.data_table.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("InspectSHM", u"Endianness", None));
-        ___qtablewidgetitem6 = self.data_table.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("InspectSHM", u"Value", None));
-        ___qtablewidgetitem7 = self.data_table.horizontalHeaderItem(7)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("InspectSHM", u"Time", None));
         self.auto_refresh.setText(QCoreApplication.translate("InspectSHM", u"Auto refresh", None))
         self.label_5.setText(QCoreApplication.translate("InspectSHM", u"auto refresh interval:", None))
         self.button_refresh.setText(QCoreApplication.translate("InspectSHM", u"refresh", None))
         self.label_6.setText(QCoreApplication.translate("InspectSHM", u"ms", None))
+#if QT_CONFIG(tooltip)
+        self.checkbox_sampler.setToolTip(QCoreApplication.translate("InspectSHM", u"sample the values at a fixed rate on a separate thread; the table shows the latest value and the minimum and maximum of each refresh interval", None))
+#endif // QT_CONFIG(tooltip)
+        self.checkbox_sampler.setText(QCoreApplication.translate("InspectSHM", u"sampler", None))
+        self.spinbox_sample_rate.setSuffix(QCoreApplication.translate("InspectSHM", u" Hz", None))
         self.menuFile.setTitle(QCoreApplication.translate("InspectSHM", u"File", None))
+        self.menuRecord.setTitle(QCoreApplication.translate("InspectSHM", u"Record", None))
+        self.menuTrigger.setTitle(QCoreApplication.translate("InspectSHM", u"Trigger", None))
     # retranslateUi
 
@@ -15,17 +15,17 @@ from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
     QFont, QFontDatabase, QGradient, QIcon,
     QImage, QKeySequence, QLinearGradient, QPainter,
     QPalette, QPixmap, QRadialGradient, QTransform)
-from PySide6.QtWidgets import (QApplication, QGridLayout, QLabel, QPushButton,
-    QSizePolicy, QSlider, QSpacerItem, QSpinBox,
-    QWidget)
+from PySide6.QtWidgets import (QApplication, QComboBox, QGridLayout, QLabel,
+    QPushButton, QSizePolicy, QSlider, QSpacerItem,
+    QSpinBox, QWidget)
 
 class Ui_RandomizeShm(object):
     def setupUi(self, RandomizeShm):
         if not RandomizeShm.objectName():
             RandomizeShm.setObjectName(u"RandomizeShm")
-        RandomizeShm.resize(450, 164)
-        RandomizeShm.setMinimumSize(QSize(450, 164))
-        RandomizeShm.setMaximumSize(QSize(450, 164))
+        RandomizeShm.resize(450, 220)
+        RandomizeShm.setMinimumSize(QSize(450, 220))
+        RandomizeShm.setMaximumSize(QSize(450, 220))
         self.gridLayout = QGridLayout(RandomizeShm)
         self.gridLayout.setObjectName(u"gridLayout")
         self.widget = QWidget(RandomizeShm)
@@ -73,6 +73,34 @@ class Ui_RandomizeShm(object):
 
         self.gridLayout.addWidget(self.widget, 0, 1, 1, 1)
 
+        self.widget_mode = QWidget(RandomizeShm)
+        self.widget_mode.setObjectName(u"widget_mode")
+        self.gridLayout_mode = QGridLayout(self.widget_mode)
+        self.gridLayout_mode.setObjectName(u"gridLayout_mode")
+        self.label_mode = QLabel(self.widget_mode)
+        self.label_mode.setObjectName(u"label_mode")
+
+        self.gridLayout_mode.addWidget(self.label_mode, 0, 0, 1, 1)
+
+        self.combobox_mode = QComboBox(self.widget_mode)
+        self.combobox_mode.setObjectName(u"combobox_mode")
+
+        self.gridLayout_mode.addWidget(self.combobox_mode, 0, 1, 1, 1)
+
+        self.label_param = QLabel(self.widget_mode)
+        self.label_param.setObjectName(u"label_param")
+
+        self.gridLayout_mode.addWidget(self.label_param, 0, 2, 1, 1)
+
+        self.spinbox_param = QSpinBox(self.widget_mode)
+        self.spinbox_param.setObjectName(u"spinbox_param")
+        self.spinbox_param.setMaximum(2147483647)
+
+        self.gridLayout_mode.addWidget(self.spinbox_param, 0, 3, 1, 1)
+
+
+        self.gridLayout.addWidget(self.widget_mode, 1, 1, 1, 1)
+
         self.widget_3 = QWidget(RandomizeShm)
         self.widget_3.setObjectName(u"widget_3")
         self.gridLayout_4 = QGridLayout(self.widget_3)
@@ -126,6 +154,11 @@ class Ui_RandomizeShm(object):
 
         self.gridLayout.addWidget(self.widget_2, 3, 1, 1, 1)
 
+        self.label_stats = QLabel(RandomizeShm)
+        self.label_stats.setObjectName(u"label_stats")
+
+        self.gridLayout.addWidget(self.label_stats, 5, 1, 1, 1)
+
         self.verticalSpacer = QSpacerItem(20, 40, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding)
 
         self.gridLayout.addItem(self.verticalSpacer, 4, 1, 1, 1)
@@ -152,6 +185,16 @@ class Ui_RandomizeShm(object):
 #if QT_CONFIG(statustip)
         self.offset.setStatusTip(QCoreApplication.translate("RandomizeShm", u"register offset (ignore first n registers)", None))
 #endif // QT_CONFIG(statustip)
+        self.label_mode.setText(QCoreApplication.translate("RandomizeShm", u"mode:", None))
+#if QT_CONFIG(tooltip)
+        self.combobox_mode.setToolTip(QCoreApplication.translate("RandomizeShm", u"fill mode", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.combobox_mode.setStatusTip(QCoreApplication.translate("RandomizeShm", u"random data or deterministic pattern", None))
+#endif // QT_CONFIG(statustip)
+#if QT_CONFIG(tooltip)
+        self.spinbox_param.setToolTip(QCoreApplication.translate("RandomizeShm", u"parameter of the fill mode", None))
+#endif // QT_CONFIG(tooltip)
         self.label_3.setText(QCoreApplication.translate("RandomizeShm", u"interval:", None))
 #if QT_CONFIG(tooltip)
         self.slider_interval.setToolTip(QCoreApplication.translate("RandomizeShm", u"randomization time intervall", None))
@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'set_values.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.7.0
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -30,6 +30,32 @@ class Ui_SetValues(object):
         self.actionload_config.setObjectName(u"actionload_config")
         self.actionsave_config = QAction(SetValues)
         self.actionsave_config.setObjectName(u"actionsave_config")
+        self.actionSetWaveform = QAction(SetValues)
+        self.actionSetWaveform.setObjectName(u"actionSetWaveform")
+        self.actionRemoveWaveform = QAction(SetValues)
+        self.actionRemoveWaveform.setObjectName(u"actionRemoveWaveform")
+        self.actionGeneratorRate = QAction(SetValues)
+        self.actionGeneratorRate.setObjectName(u"actionGeneratorRate")
+        self.actionRunGenerator = QAction(SetValues)
+        self.actionRunGenerator.setObjectName(u"actionRunGenerator")
+        self.actionRunGenerator.setCheckable(True)
+        self.actionPlaySequence = QAction(SetValues)
+        self.actionPlaySequence.setObjectName(u"actionPlaySequence")
+        self.actionStopSequence = QAction(SetValues)
+        self.actionStopSequence.setObjectName(u"actionStopSequence")
+        self.actionStopSequence.setEnabled(False)
+        self.actionSequenceSpeed = QAction(SetValues)
+        self.actionSequenceSpeed.setObjectName(u"actionSequenceSpeed")
+        self.actionSequenceLoop = QAction(SetValues)
+        self.actionSequenceLoop.setObjectName(u"actionSequenceLoop")
+        self.actionSequenceLoop.setCheckable(True)
+        self.actionVerifyWrites = QAction(SetValues)
+        self.actionVerifyWrites.setObjectName(u"actionVerifyWrites")
+        self.actionVerifyWrites.setCheckable(True)
+        self.actionVerifyStatistics = QAction(SetValues)
+        self.actionVerifyStatistics.setObjectName(u"actionVerifyStatistics")
+        self.actionVerifyReset = QAction(SetValues)
+        self.actionVerifyReset.setObjectName(u"actionVerifyReset")
         self.centralwidget = QWidget(SetValues)
         self.centralwidget.setObjectName(u"centralwidget")
         self.gridLayout = QGridLayout(self.centralwidget)
@@ -126,14 +152,36 @@ class Ui_SetValues(object):
         self.menubar.setGeometry(QRect(0, 0, 1150, 30))
         self.menuFile = QMenu(self.menubar)
         self.menuFile.setObjectName(u"menuFile")
+        self.menuGenerator = QMenu(self.menubar)
+        self.menuGenerator.setObjectName(u"menuGenerator")
+        self.menuSequence = QMenu(self.menubar)
+        self.menuSequence.setObjectName(u"menuSequence")
+        self.menuVerify = QMenu(self.menubar)
+        self.menuVerify.setObjectName(u"menuVerify")
         SetValues.setMenuBar(self.menubar)
         self.statusbar = QStatusBar(SetValues)
         self.statusbar.setObjectName(u"statusbar")
         SetValues.setStatusBar(self.statusbar)
 
         self.menubar.addAction(self.menuFile.menuAction())
+        self.menubar.addAction(self.menuGenerator.menuAction())
+        self.menubar.addAction(self.menuSequence.menuAction())
+        self.menubar.addAction(self.menuVerify.menuAction())
         self.menuFile.addAction(self.actionload_config)
         self.menuFile.addAction(self.actionsave_config)
+        self.menuGenerator.addAction(self.actionSetWaveform)
+        self.menuGenerator.addAction(self.actionRemoveWaveform)
+        self.menuGenerator.addSeparator()
+        self.menuGenerator.addAction(self.actionGeneratorRate)
+        self.menuGenerator.addAction(self.actionRunGenerator)
+        self.menuSequence.addAction(self.actionPlaySequence)
+        self.menuSequence.addAction(self.actionStopSequence)
+        self.menuSequence.addSeparator()
+        self.menuSequence.addAction(self.actionSequenceSpeed)
+        self.menuSequence.addAction(self.actionSequenceLoop)
+        self.menuVerify.addAction(self.actionVerifyWrites)
+        self.menuVerify.addAction(self.actionVerifyStatistics)
+        self.menuVerify.addAction(self.actionVerifyReset)
 
         self.retranslateUi(SetValues)
 
@@ -144,26 +192,43 @@ class Ui_SetValues(object):
         SetValues.setWindowTitle(QCoreApplication.translate("SetValues", u"Set Values", None))
         self.actionload_config.setText(QCoreApplication.translate("SetValues", u"load config", None))
         self.actionsave_config.setText(QCoreApplication.translate("SetValues", u"save config", None))
+        self.actionSetWaveform.setText(QCoreApplication.translate("SetValues", u"Set waveform of selected entry...", None))
+        self.actionRemoveWaveform.setText(QCoreApplication.translate("SetValues", u"Remove waveform of selected entry", None))
+        self.actionGeneratorRate.setText(QCoreApplication.translate("SetValues", u"Rate...", None))
+        self.actionRunGenerator.setText(QCoreApplication.translate("SetValues", u"Run", None))
+        self.actionPlaySequence.setText(QCoreApplication.translate("SetValues", u"Play sequence...", None))
+        self.actionStopSequence.setText(QCoreApplication.translate("SetValues", u"Stop", None))
+        self.actionSequenceSpeed.setText(QCoreApplication.translate("SetValues", u"Speed...", None))
+        self.actionSequenceLoop.setText(QCoreApplication.translate("SetValues", u"Loop", None))
+#if QT_CONFIG(tooltip)
+        self.actionSequenceLoop.setToolTip(QCoreApplication.translate("SetValues", u"repeat the sequence; the length of a pass is the time of the end marker (#end) of the sequence file", None))
+#endif // QT_CONFIG(tooltip)
+        self.actionVerifyWrites.setText(QCoreApplication.translate("SetValues", u"Verify writes", None))
+        self.actionVerifyStatistics.setText(QCoreApplication.translate("SetValues", u"Statistics...", None))
+        self.actionVerifyReset.setText(QCoreApplication.translate("SetValues", u"Reset statistics", None))
         ___qtablewidgetitem = self.data_table.horizontalHeaderItem(0)
-        ___qtablewidgetitem.setText(QCoreApplication.translate("SetValues", u"Name", None));
+        ___qtablewidgetitem.setText(QCoreApplication.translate("SetValues", u"Name", None))
         ___qtablewidgetitem1 = self.data_table.horizontalHeaderItem(1)
-        ___qtablewidgetitem1.setText(QCoreApplication.translate("SetValues", u"Register", None));
+        ___qtablewidgetitem1.setText(QCoreApplication.translate("SetValues", u"Register", None))
         ___qtablewidgetitem2 = self.data_table.horizontalHeaderItem(2)
-        ___qtablewidgetitem2.setText(QCoreApplication.translate("SetValues", u"Address", None));
+        ___qtablewidgetitem2.setText(QCoreApplication.translate("SetValues", u"Address", None))
         ___qtablewidgetitem3 = self.data_table.horizontalHeaderItem(3)
-        ___qtablewidgetitem3.setText(QCoreApplication.translate("SetValues", u"Data Type", None));
+        ___qtablewidgetitem3.setText(QCoreApplication.translate("SetValues", u"Data Type", None))
         ___qtablewidgetitem4 = self.data_table.horizontalHeaderItem(4)
-        ___qtablewidgetitem4.setText(QCoreApplication.translate("SetValues", u"Size", None));
+        ___qtablewidgetitem4.setText(QCoreApplication.translate("SetValues", u"Size", None))
         ___qtablewidgetitem5 = self.data_table.horizontalHeaderItem(5)
-        ___qtablewidgetitem5.setText(QCoreApplication.translate("SetValues", u"Endianness", None));
+        ___qtablewidgetitem5.setText(QCoreApplication.translate("SetValues", u"Endianness", None))
         ___qtablewidgetitem6 = self.data_table.horizontalHeaderItem(6)
-        ___qtablewidgetitem6.setText(QCoreApplication.translate("SetValues", u"Value", None));
+        ___qtablewidgetitem6.setText(QCoreApplication.translate("SetValues", u"Value", None))
         ___qtablewidgetitem7 = self.data_table.horizontalHeaderItem(8)
-        ___qtablewidgetitem7.setText(QCoreApplication.translate("SetValues", u"Time", None));
+        ___qtablewidgetitem7.setText(QCoreApplication.translate("SetValues", u"Time", None))
         self.button_add_float.setText(QCoreApplication.translate("SetValues", u"add float", None))
         self.button_add_bool.setText(QCoreApplication.translate("SetValues", u"add bool", None))
         self.button_add_int.setText(QCoreApplication.translate("SetValues", u"add int", None))
         self.button_apply_all.setText(QCoreApplication.translate("SetValues", u"apply all", None))
         self.menuFile.setTitle(QCoreApplication.translate("SetValues", u"File", None))
+        self.menuGenerator.setTitle(QCoreApplication.translate("SetValues", u"Generator", None))
+        self.menuSequence.setTitle(QCoreApplication.translate("SetValues", u"Sequence", None))
+        self.menuVerify.setTitle(QCoreApplication.translate("SetValues", u"Verify", None))
     # retranslateUi
 
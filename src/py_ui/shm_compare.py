@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+
+################################################################################
+## Form generated from reading UI file 'shm_compare.ui'
+##
+## Created by: Qt User Interface Compiler version 6.12.0
+##
+## WARNING! All changes made in this file will be lost when recompiling UI file!
+################################################################################
+
+from PySide6.QtCore import (QCoreApplication, QDate, QDateTime, QLocale,
+    QMetaObject, QObject, QPoint, QRect,
+    QSize, QTime, QUrl, Qt)
+from PySide6.QtGui import (QBrush, QColor, QConicalGradient, QCursor,
+    QFont, QFontDatabase, QGradient, QIcon,
+    QImage, QKeySequence, QLinearGradient, QPainter,
+    QPalette, QPixmap, QRadialGradient, QTransform)
+from PySide6.QtWidgets import (QAbstractItemView, QApplication, QCheckBox, QComboBox,
+    QGridLayout, QHeaderView, QLabel, QMainWindow,
+    QPushButton, QSizePolicy, QSpinBox, QStatusBar,
+    QTableView, QToolButton, QWidget)
+
+class Ui_ShmCompare(object):
+    def setupUi(self, ShmCompare):
+        if not ShmCompare.objectName():
+            ShmCompare.setObjectName(u"ShmCompare")
+        ShmCompare.resize(700, 600)
+        self.centralwidget = QWidget(ShmCompare)
+        self.centralwidget.setObjectName(u"centralwidget")
+        self.gridLayout = QGridLayout(self.centralwidget)
+        self.gridLayout.setObjectName(u"gridLayout")
+        self.label_a = QLabel(self.centralwidget)
+        self.label_a.setObjectName(u"label_a")
+
+        self.gridLayout.addWidget(self.label_a, 0, 0, 1, 1)
+
+        self.combobox_kind_a = QComboBox(self.centralwidget)
+        self.combobox_kind_a.setObjectName(u"combobox_kind_a")
+
+        self.gridLayout.addWidget(self.combobox_kind_a, 0, 1, 1, 1)
+
+        self.combobox_value_a = QComboBox(self.centralwidget)
+        self.combobox_value_a.setObjectName(u"combobox_value_a")
+        sizePolicy = QSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Fixed)
+        sizePolicy.setHorizontalStretch(0)
+        sizePolicy.setVerticalStretch(0)
+        sizePolicy.setHeightForWidth(self.combobox_value_a.sizePolicy().hasHeightForWidth())
+        self.combobox_value_a.setSizePolicy(sizePolicy)
+        self.combobox_value_a.setEditable(True)
+
+        self.gridLayout.addWidget(self.combobox_value_a, 0, 2, 1, 4)
+
+        self.button_browse_a = QToolButton(self.centralwidget)
+        self.button_browse_a.setObjectName(u"button_browse_a")
+
+        self.gridLayout.addWidget(self.button_browse_a, 0, 6, 1, 1)
+
+        self.label_b = QLabel(self.centralwidget)
+        self.label_b.setObjectName(u"label_b")
+
+        self.gridLayout.addWidget(self.label_b, 1, 0, 1, 1)
+
+        self.combobox_kind_b = QComboBox(self.centralwidget)
+        self.combobox_kind_b.setObjectName(u"combobox_kind_b")
+
+        self.gridLayout.addWidget(self.combobox_kind_b, 1, 1, 1, 1)
+
+        self.combobox_value_b = QComboBox(self.centralwidget)
+        self.combobox_value_b.setObjectName(u"combobox_value_b")
+        sizePolicy.setHeightForWidth(self.combobox_value_b.sizePolicy().hasHeightForWidth())
+        self.combobox_value_b.setSizePolicy(sizePolicy)
+        self.combobox_value_b.setEditable(True)
+
+        self.gridLayout.addWidget(self.combobox_value_b, 1, 2, 1, 4)
+
+        self.button_browse_b = QToolButton(self.centralwidget)
+        self.button_browse_b.setObjectName(u"button_browse_b")
+
+        self.gridLayout.addWidget(self.button_browse_b, 1, 6, 1, 1)
+
+        self.label_register_size = QLabel(self.centralwidget)
+        self.label_register_size.setObjectName(u"label_register_size")
+
+        self.gridLayout.addWidget(self.label_register_size, 2, 0, 1, 1)
+
+        self.combobox_register_size = QComboBox(self.centralwidget)
+        self.combobox_register_size.addItem("")
+        self.combobox_register_size.addItem("")
+        self.combobox_register_size.setObjectName(u"combobox_register_size")
+
+        self.gridLayout.addWidget(self.combobox_register_size, 2, 1, 1, 1)
+
+        self.combobox_decode = QComboBox(self.centralwidget)
+        self.combobox_decode.setObjectName(u"combobox_decode")
+
+        self.gridLayout.addWidget(self.combobox_decode, 2, 2, 1, 1)
+
+        self.button_compare = QPushButton(self.centralwidget)
+        self.button_compare.setObjectName(u"button_compare")
+
+        self.gridLayout.addWidget(self.button_compare, 2, 3, 1, 1)
+
+        self.checkbox_auto = QCheckBox(self.centralwidget)
+        self.checkbox_auto.setObjectName(u"checkbox_auto")
+
+        self.gridLayout.addWidget(self.checkbox_auto, 2, 4, 1, 1)
+
+        self.spinbox_interval = QSpinBox(self.centralwidget)
+        self.spinbox_interval.setObjectName(u"spinbox_interval")
+        self.spinbox_interval.setMinimum(50)
+        self.spinbox_interval.setMaximum(60000)
+        self.spinbox_interval.setSingleStep(100)
+        self.spinbox_interval.setValue(1000)
+
+        self.gridLayout.addWidget(self.spinbox_interval, 2, 5, 1, 1)
+
+        self.view = QTableView(self.centralwidget)
+        self.view.setObjectName(u"view")
+        self.view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        self.view.verticalHeader().setVisible(False)
+
+        self.gridLayout.addWidget(self.view, 3, 0, 1, 7)
+
+        ShmCompare.setCentralWidget(self.centralwidget)
+        self.statusbar = QStatusBar(ShmCompare)
+        self.statusbar.setObjectName(u"statusbar")
+        ShmCompare.setStatusBar(self.statusbar)
+
+        self.retranslateUi(ShmCompare)
+
+        self.combobox_register_size.setCurrentIndex(1)
+
+
+        QMetaObject.connectSlotsByName(ShmCompare)
+    # setupUi
+
+    def retranslateUi(self, ShmCompare):
+        ShmCompare.setWindowTitle(QCoreApplication.translate("ShmCompare", u"compare segments", None))
+        self.label_a.setText(QCoreApplication.translate("ShmCompare", u"A:", None))
+#if QT_CONFIG(tooltip)
+        self.combobox_kind_a.setToolTip(QCoreApplication.translate("ShmCompare", u"kind of source A", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.combobox_value_a.setToolTip(QCoreApplication.translate("ShmCompare", u"segment, dump file or snapshot A", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.button_browse_a.setToolTip(QCoreApplication.translate("ShmCompare", u"select a dump file", None))
+#endif // QT_CONFIG(tooltip)
+        self.button_browse_a.setText(QCoreApplication.translate("ShmCompare", u"...", None))
+        self.label_b.setText(QCoreApplication.translate("ShmCompare", u"B:", None))
+#if QT_CONFIG(tooltip)
+        self.combobox_kind_b.setToolTip(QCoreApplication.translate("ShmCompare", u"kind of source B", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.combobox_value_b.setToolTip(QCoreApplication.translate("ShmCompare", u"segment, dump file or snapshot B", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(tooltip)
+        self.button_browse_b.setToolTip(QCoreApplication.translate("ShmCompare", u"select a dump file", None))
+#endif // QT_CONFIG(tooltip)
+        self.button_browse_b.setText(QCoreApplication.translate("ShmCompare", u"...", None))
+        self.label_register_size.setText(QCoreApplication.translate("ShmCompare", u"register size:", None))
+        self.combobox_register_size.setItemText(0, QCoreApplication.translate("ShmCompare", u"1 byte", None))
+        self.combobox_register_size.setItemText(1, QCoreApplication.translate("ShmCompare", u"2 bytes", None))
+
+#if QT_CONFIG(tooltip)
+        self.combobox_decode.setToolTip(QCoreApplication.translate("ShmCompare", u"decoding of the register values", None))
+#endif // QT_CONFIG(tooltip)
+        self.button_compare.setText(QCoreApplication.translate("ShmCompare", u"compare", None))
+#if QT_CONFIG(tooltip)
+        self.checkbox_auto.setToolTip(QCoreApplication.translate("ShmCompare", u"compare periodically", None))
+#endif // QT_CONFIG(tooltip)
+        self.checkbox_auto.setText(QCoreApplication.translate("ShmCompare", u"auto", None))
+        self.spinbox_interval.setSuffix(QCoreApplication.translate("ShmCompare", u" ms", None))
+    # retranslateUi
+
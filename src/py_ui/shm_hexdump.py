@@ -3,7 +3,7 @@
 ################################################################################
 ## Form generated from reading UI file 'shm_hexdump.ui'
 ##
-## Created by: Qt User Interface Compiler version 6.6.2
+## Created by: Qt User Interface Compiler version 6.12.0
 ##
 ## WARNING! All changes made in this file will be lost when recompiling UI file!
 ################################################################################
@@ -19,7 +19,9 @@ from PySide6.QtGui import (QAction, QBrush, QColor, QConicalGradient,
 from PySide6.QtWidgets import (QApplication, QCheckBox, QGridLayout, QLabel,
     QMainWindow, QMenu, QMenuBar, QPushButton,
     QSizePolicy, QSlider, QSpacerItem, QSpinBox,
-    QStatusBar, QTextBrowser, QWidget)
+    QStatusBar, QWidget)
+
+from ..HexdumpView import HexdumpView
 
 class Ui_ShmHexdump(object):
     def setupUi(self, ShmHexdump):
@@ -33,13 +35,10 @@ class Ui_ShmHexdump(object):
         self.centralwidget.setObjectName(u"centralwidget")
         self.gridLayout = QGridLayout(self.centralwidget)
         self.gridLayout.setObjectName(u"gridLayout")
-        self.hexdump_text = QTextBrowser(self.centralwidget)
-        self.hexdump_text.setObjectName(u"hexdump_text")
-        font = QFont()
-        font.setFamilies([u"Noto Sans Mono Medium"])
-        self.hexdump_text.setFont(font)
+        self.hexdump_view = HexdumpView(self.centralwidget)
+        self.hexdump_view.setObjectName(u"hexdump_view")
 
-        self.gridLayout.addWidget(self.hexdump_text, 2, 0, 1, 1)
+        self.gridLayout.addWidget(self.hexdump_view, 2, 0, 1, 1)
 
         self.widget = QWidget(self.centralwidget)
         self.widget.setObjectName(u"widget")
@@ -127,6 +126,19 @@ class Ui_ShmHexdump(object):
 
         self.gridLayout_2.addItem(self.horizontalSpacer, 0, 7, 1, 1)
 
+        self.checkbox_highlight = QCheckBox(self.widget)
+        self.checkbox_highlight.setObjectName(u"checkbox_highlight")
+
+        self.gridLayout_2.addWidget(self.checkbox_highlight, 0, 8, 1, 1)
+
+        self.spinbox_fade = QSpinBox(self.widget)
+        self.spinbox_fade.setObjectName(u"spinbox_fade")
+        self.spinbox_fade.setMinimum(1)
+        self.spinbox_fade.setMaximum(255)
+        self.spinbox_fade.setValue(10)
+
+        self.gridLayout_2.addWidget(self.spinbox_fade, 1, 8, 1, 1)
+
         self.label_3 = QLabel(self.widget)
         self.label_3.setObjectName(u"label_3")
 
@@ -204,6 +216,20 @@ class Ui_ShmHexdump(object):
 #if QT_CONFIG(statustip)
         self.spinbox_interval.setStatusTip(QCoreApplication.translate("ShmHexdump", u"auto refresh interval", None))
 #endif // QT_CONFIG(statustip)
+#if QT_CONFIG(tooltip)
+        self.checkbox_highlight.setToolTip(QCoreApplication.translate("ShmHexdump", u"highlight bytes that changed since the previous refresh", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.checkbox_highlight.setStatusTip(QCoreApplication.translate("ShmHexdump", u"highlight bytes that changed since the previous refresh", None))
+#endif // QT_CONFIG(statustip)
+        self.checkbox_highlight.setText(QCoreApplication.translate("ShmHexdump", u"highlight changes", None))
+#if QT_CONFIG(tooltip)
+        self.spinbox_fade.setToolTip(QCoreApplication.translate("ShmHexdump", u"number of refreshes until the highlighting of a changed byte fades out", None))
+#endif // QT_CONFIG(tooltip)
+#if QT_CONFIG(statustip)
+        self.spinbox_fade.setStatusTip(QCoreApplication.translate("ShmHexdump", u"number of refreshes until the highlighting of a changed byte fades out", None))
+#endif // QT_CONFIG(statustip)
+        self.spinbox_fade.setSuffix(QCoreApplication.translate("ShmHexdump", u" ticks", None))
         self.label_3.setText(QCoreApplication.translate("ShmHexdump", u"offset", None))
 #if QT_CONFIG(tooltip)
         self.offset.setToolTip(QCoreApplication.translate("ShmHexdump", u"register offset (ignore first n registers)", None))
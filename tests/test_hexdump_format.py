@@ -0,0 +1,31 @@
+from src.HexdumpFormat import hexdump, hexdump_rows, num_rows
+
+DATA = b"Hello, World!\x00\x01\x02\xff ABC"
+
+# output of: hexdump -C -v
+EXPECTED = ("00000000  48 65 6c 6c 6f 2c 20 57  6f 72 6c 64 21 00 01 02  |Hello, World!...|\n"
+            "00000010  ff 20 41 42 43                                    |. ABC|\n"
+            "00000015\n")
+
+
+def test_hexdump():
+    assert hexdump(DATA) == EXPECTED
+
+
+def test_hexdump_empty():
+    assert hexdump(b"") == ""
+
+
+def test_partial_line_up_to_second_half():
+    assert hexdump_rows(bytes(range(10))) == [
+        "00000000  00 01 02 03 04 05 06 07  08 09                    |..........|"]
+
+
+def test_rows_window():
+    data = bytes(range(256)) * 2
+    lines = hexdump_rows(data)
+    assert len(lines) == num_rows(len(data)) == 32
+    assert hexdump_rows(data, 5, 3) == lines[5:8]
+    assert hexdump_rows(data, 30, 10) == lines[30:]
+    assert hexdump_rows(data, 32, 1) == []
+    assert lines[2] == "00000020  20 21 22 23 24 25 26 27  28 29 2a 2b 2c 2d 2e 2f  | !\"#$%&'()*+,-./|"
@@ -0,0 +1,71 @@
+import io
+import json
+import struct
+import sys
+
+import pytest
+
+from src.SampleRing import BINARY_MAGIC, SampleRing
+
+
+@pytest.fixture
+def ring(tmp_path):
+    ring = SampleRing([("flag", 'B'), ("count", 'q'), ("value", 'd')], 4, str(tmp_path))
+    yield ring
+    ring.close()
+
+
+def test_wrap_around(ring):
+    for i in range(6):
+        ring.append(float(i), [i % 2, -i, i / 2])
+    assert len(ring) == 4
+    assert ring.total == 6
+    assert ring.segments() == [(2, 4), (0, 2)]
+
+    chronological = [list(ring.columns[1][start:end]) for start, end in ring.segments()]
+    assert sum(chronological, []) == [-2, -3, -4, -5]
+    assert [list(v) for v in ring.slices(ring.time, 3, 6)] == [[3.0], [4.0, 5.0]]
+
+
+def test_clear(ring):
+    ring.append(1.0, [1, 1, 1.0])
+    ring.clear()
+    assert len(ring) == 0
+    assert ring.segments() == []
+
+
+def test_export_csv(ring):
+    ring.append(1.0, [1, -5, 0.5])
+    ring.append(2.0, [0, 7, 1.5])
+    f = io.StringIO()
+    ring.export_csv(f)
+    assert f.getvalue().splitlines() == ["time,flag,count,value", "1.0,1,-5,0.5", "2.0,0,7,1.5"]
+
+
+def test_export_binary(ring):
+    for i in range(5):
+        ring.append(float(i), [1, i, -float(i)])
+    f = io.BytesIO()
+    ring.export_binary(f)
+
+    data = f.getvalue()
+    assert data.startswith(BINARY_MAGIC)
+    header_line, payload = data[len(BINARY_MAGIC):].split(b"\n", maxsplit=1)
+    header = json.loads(header_line)
+    assert header["count"] == 4
+    assert header["byteorder"] == sys.byteorder
+    assert [c["name"] for c in header["columns"]] == ["time", "flag", "count", "value"]
+
+    # columns are written one after the other, without padding
+    columns = struct.unpack("=4d4B4q4d", payload)
+    assert list(columns[0:4]) == [1.0, 2.0, 3.0, 4.0]
+    assert list(columns[4:8]) == [1, 1, 1, 1]
+    assert list(columns[8:12]) == [1, 2, 3, 4]
+    assert list(columns[12:16]) == [-1.0, -2.0, -3.0, -4.0]
+
+
+def test_invalid_columns(tmp_path):
+    with pytest.raises(RuntimeError):
+        SampleRing([("x", 'f')], 4, str(tmp_path))
+    with pytest.raises(RuntimeError):
+        SampleRing([("x", 'd')], 0, str(tmp_path))
@@ -0,0 +1,69 @@
+import os
+
+import pytest
+
+from src import SHMMap
+from src.SHMCompare import DiffSource
+from src.SHMSnapshots import SnapshotStore
+
+
+def set_mtime(path, seconds: int) -> None:
+    os.utime(path, ns=(seconds * 10 ** 9, seconds * 10 ** 9))
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    monkeypatch.setenv("XDG_DATA_HOME", str(tmp_path / "data"))
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(tmp_path))
+    (tmp_path / "tst_AO").write_bytes(b"\x01" * 16)
+    return SnapshotStore()
+
+
+def test_dump_file_is_read_again_when_modified(tmp_path):
+    path = tmp_path / "dump"
+    path.write_bytes(b"\x01\x02")
+    set_mtime(path, 1000)
+    source = DiffSource("dump file", str(path))
+    assert source.read() == b"\x01\x02"
+
+    # same mtime and size: the file is not read again
+    path.write_bytes(b"\x03\x04")
+    set_mtime(path, 1000)
+    assert source.read() == b"\x01\x02"
+
+    set_mtime(path, 1001)
+    assert source.read() == b"\x03\x04"
+    path.write_bytes(b"\x05\x06\x07")
+    set_mtime(path, 1001)
+    assert source.read() == b"\x05\x06\x07"
+
+
+def test_missing_dump_file(tmp_path):
+    with pytest.raises(RuntimeError):
+        DiffSource("dump file", str(tmp_path / "missing")).read()
+
+
+def test_snapshot_is_read_again_when_saved(store, tmp_path, monkeypatch):
+    store.save("a", "tst_AO", "AO")
+    set_mtime(store.index_file, 1000)
+    reads = []
+    read = SnapshotStore.read
+    monkeypatch.setattr(SnapshotStore, "read", lambda *args: reads.append(args[1]) or read(*args))
+    source = DiffSource("snapshot", "a")
+    assert source.read() == b"\x01" * 16
+    assert source.read() == b"\x01" * 16
+    assert reads == ["a"]
+
+    # saved again under the same name
+    (tmp_path / "tst_AO").write_bytes(b"\x02" * 16)
+    SnapshotStore().save("a", "tst_AO", "AO")
+    set_mtime(store.index_file, 1001)
+    assert source.read() == b"\x02" * 16
+    assert reads == ["a", "a"]
+
+
+def test_invalid_source():
+    with pytest.raises(RuntimeError):
+        DiffSource("file", "x")
+    with pytest.raises(RuntimeError):
+        DiffSource("snapshot", "")
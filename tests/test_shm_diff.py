@@ -0,0 +1,69 @@
+import random
+
+from src.SHMDiff import ChangeTracker, RUN, apply_delta, changed_ranges, changed_registers, encode_delta, \
+    ranges_to_rows
+
+
+def test_changed_ranges():
+    old = bytes(32)
+    new = bytearray(old)
+    new[3] = 1
+    new[4] = 2
+    new[20] = 3
+    assert changed_ranges(old, bytes(new)) == [(3, 5), (20, 21)]
+    assert changed_ranges(old, old) == []
+
+
+def test_ranges_to_rows():
+    # adjacent rows are merged
+    assert ranges_to_rows([(3, 5), (17, 18), (40, 70)], 16) == [(0, 4)]
+    assert ranges_to_rows([(0, 1), (48, 49), (60, 70)], 16) == [(0, 0), (3, 4)]
+
+
+def test_changed_registers():
+    old = bytes(16)
+    new = bytearray(old)
+    new[3] = 0xff
+    new[10] = 0x01
+    assert list(changed_registers(old, bytes(new), 2)) == [1, 5]
+    assert list(changed_registers(old, bytes(new), 1)) == [3, 10]
+
+
+def test_change_tracker_fades():
+    tracker = ChangeTracker(fade_ticks=2)
+    assert tracker.update(b"\x00\x00\x00\x00") is None
+    assert tracker.update(b"\x00\x01\x00\x00") == [(1, 2)]
+    assert tracker.ages == bytearray([0, 2, 0, 0])
+    assert tracker.update(b"\x00\x01\x00\x00") == [(1, 2)]
+    assert tracker.ages == bytearray([0, 1, 0, 0])
+    tracker.update(b"\x00\x01\x00\x00")
+    assert tracker.ages == bytearray(4)
+    # a different size starts over
+    assert tracker.update(b"\x01\x01") is None
+
+
+def test_delta_layout():
+    prev = bytes(64)
+    cur = bytearray(prev)
+    cur[2] = 0x0f
+    cur[5] = 0xf0  # gap of 2 unchanged bytes: same run
+    cur[40] = 0xaa  # gap of more than 8 bytes: new run
+    delta = encode_delta(prev, bytes(cur))
+    assert delta == RUN.pack(2, 4) + b"\x0f\x00\x00\xf0" + RUN.pack(40, 1) + b"\xaa"
+    assert encode_delta(prev, prev) == b""
+
+
+def test_delta_round_trip():
+    rng = random.Random(4711)
+    frame = bytes(rng.getrandbits(8) for _ in range(1024))
+    replayed = bytearray(frame)
+    for _ in range(200):
+        cur = bytearray(frame)
+        for _ in range(rng.randrange(20)):
+            start = rng.randrange(len(cur))
+            end = min(start + rng.randrange(1, 40), len(cur))
+            cur[start:end] = bytes(rng.getrandbits(8) for _ in range(end - start))
+        cur = bytes(cur)
+        apply_delta(replayed, memoryview(encode_delta(frame, cur)))
+        assert replayed == cur
+        frame = cur
@@ -0,0 +1,80 @@
+import pytest
+
+from src import SHMFile, SHMMap
+from src.SHMFile import dump_shm, load_shm
+
+CONTENT = bytes(i % 251 for i in range(1000))
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "shm"
+    directory.mkdir()
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(directory))
+    (directory / "tst_AO").write_bytes(CONTENT)
+    return directory
+
+
+def test_dump(shm_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(SHMFile, "CHUNK_SIZE", 300)
+    progress = []
+    assert dump_shm("tst_AO", str(tmp_path / "dump"), progress=lambda *args: progress.append(args)) == 1000
+    assert (tmp_path / "dump").read_bytes() == CONTENT
+    assert progress == [(300, 1000), (600, 1000), (900, 1000), (1000, 1000)]
+
+
+def test_load(shm_dir, tmp_path, monkeypatch):
+    monkeypatch.setattr(SHMFile, "CHUNK_SIZE", 300)
+    (tmp_path / "data").write_bytes(b"\x01\x02" * 500)
+    progress = []
+    assert load_shm("tst_AO", str(tmp_path / "data"), progress=lambda *args: progress.append(args)) == 1000
+    assert (shm_dir / "tst_AO").read_bytes() == b"\x01\x02" * 500
+    assert progress[-1] == (1000, 1000)
+
+
+def test_load_shorter_file(shm_dir, tmp_path):
+    (tmp_path / "data").write_bytes(b"\xff" * 10)
+    assert load_shm("tst_AO", str(tmp_path / "data")) == 10
+    assert (shm_dir / "tst_AO").read_bytes() == b"\xff" * 10 + CONTENT[10:]
+
+
+def test_load_invert(shm_dir, tmp_path):
+    (tmp_path / "data").write_bytes(b"\x00\x0f\xf0\xff\x5a")
+    assert load_shm("tst_AO", str(tmp_path / "data"), invert=True) == 5
+    assert (shm_dir / "tst_AO").read_bytes()[:6] == b"\xff\xf0\x0f\x00\xa5" + CONTENT[5:6]
+
+
+def test_load_repeat(shm_dir, tmp_path):
+    (tmp_path / "data").write_bytes(b"abc")
+    assert load_shm("tst_AO", str(tmp_path / "data"), repeat=True) == 1000
+    assert (shm_dir / "tst_AO").read_bytes() == (b"abc" * 334)[:1000]
+
+
+def test_load_invert_and_repeat(shm_dir, tmp_path):
+    (tmp_path / "data").write_bytes(b"\x00\x01")
+    assert load_shm("tst_AO", str(tmp_path / "data"), invert=True, repeat=True) == 1000
+    assert (shm_dir / "tst_AO").read_bytes() == b"\xff\xfe" * 500
+
+
+def test_dump_and_load_round_trip(shm_dir, tmp_path):
+    dump_shm("tst_AO", str(tmp_path / "dump"))
+    (shm_dir / "tst_AO").write_bytes(bytes(1000))
+    load_shm("tst_AO", str(tmp_path / "dump"))
+    assert (shm_dir / "tst_AO").read_bytes() == CONTENT
+
+
+@pytest.mark.parametrize("content, repeat", [(bytes(1001), False), (b"", True)])
+def test_load_invalid_file(shm_dir, tmp_path, content, repeat):
+    (tmp_path / "data").write_bytes(content)
+    with pytest.raises(RuntimeError):
+        load_shm("tst_AO", str(tmp_path / "data"), repeat=repeat)
+    assert (shm_dir / "tst_AO").read_bytes() == CONTENT
+
+
+def test_missing_files(shm_dir, tmp_path):
+    with pytest.raises(RuntimeError):
+        load_shm("tst_AO", str(tmp_path / "missing"))
+    with pytest.raises(RuntimeError):
+        dump_shm("tst_AO", str(tmp_path / "missing" / "dump"))
+    with pytest.raises(RuntimeError):
+        dump_shm("tst_DO", str(tmp_path / "dump"))
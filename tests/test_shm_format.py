@@ -0,0 +1,72 @@
+import struct
+
+import pytest
+
+from src.SHMFormat import SHMFormatField, SHMFormatPlan
+
+
+def swap16(data: bytes) -> bytes:
+    return b"".join(reversed([data[i:i + 2] for i in range(0, len(data), 2)]))
+
+
+def decode(lines: list[str], data: bytes) -> list:
+    plan = SHMFormatPlan({"AO": lines})
+    start, end = plan.spans["AO"]
+    return plan.decode({"AO": data[start:end]})["AO"]
+
+
+def test_decode_known_layout():
+    data = bytearray(48)
+    data[0] = 0xfe
+    struct.pack_into("<h", data, 2, -1234)
+    struct.pack_into(">I", data, 4, 0xdeadbeef)
+    data[8:12] = swap16(struct.pack("<f", 1.5))
+    data[12] = 0b00001000
+    data[16:24] = b"abc\0xyz\0"
+    struct.pack_into(">d", data, 24, -2.25)
+    data[32:36] = swap16(struct.pack(">i", -100000))
+    struct.pack_into("<Q", data, 40, 2 ** 63 + 5)
+
+    values = decode(["0,u8,a", "2,i16l,b", "4,u32b,c", "8,f32lr,d", "12:3,b,e", "12:2,b,f", "16,s8,g",
+                     "24,f64b,h", "32,i32br,i", "40,u64l,j"], bytes(data))
+
+    assert values == [0xfe, -1234, 0xdeadbeef, 1.5, True, False, "abc", -2.25, -100000, 2 ** 63 + 5]
+
+
+def test_decode_overlapping_fields():
+    data = struct.pack(">I", 0x01020304)
+    # the same bytes as one 32 bit value and as two 16 bit values in both byte orders
+    values = decode(["0,u32b,a", "0,u16b,b", "2,u16b,c", "0,u16l,d", "0,i8,e"], data)
+    assert values == [0x01020304, 0x0102, 0x0304, 0x0201, 1]
+
+
+def test_decode_span_starts_at_first_field():
+    data = bytes(100) + struct.pack("<H", 4711)
+    plan = SHMFormatPlan({"AO": ["100,u16l,a"]})
+    assert plan.spans["AO"] == (100, 102)
+    assert decode(["100,u16l,a"], data) == [4711]
+
+
+def test_to_shm_format_dict():
+    plan = SHMFormatPlan({"AO": ["0,u32lr,a", "4,i8,b"]})
+    result = plan.to_shm_format_dict({"AO": [7, -1]}, timestamp=12.5)
+    assert result == {
+        "time": 12.5,
+        "shm_data": {"AO": {"data": [
+            {"name": "a", "type": "uint32", "data": 7, "endian": "little-swap16"},
+            {"name": "b", "type": "int8", "data": -1},
+        ]}},
+    }
+
+
+def test_check_size():
+    plan = SHMFormatPlan({"AO": ["6,u32b,a"]})
+    plan.check_size("AO", 10)
+    with pytest.raises(RuntimeError):
+        plan.check_size("AO", 9)
+
+
+@pytest.mark.parametrize("line", ["0,u16,a", "0,u12b,a", "0,f16b,a", "0,u16br,a", "0:8,b,a", "0,x8,a", "0;u8"])
+def test_invalid_cfg_line(line):
+    with pytest.raises(RuntimeError):
+        SHMFormatField(line)
@@ -0,0 +1,97 @@
+import sys
+
+import pytest
+
+from src import SHMMap
+from src.SHMRandomizer import FILL_MODES, PatternFill, RandomFill, create_fill
+
+SHM_SIZE = 64
+
+
+@pytest.fixture
+def shm(tmp_path, monkeypatch):
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(tmp_path))
+    (tmp_path / "tst_AO").write_bytes(bytes(SHM_SIZE))
+    shm = SHMMap.SHMMap("tst_AO", writable=True)
+    yield shm
+    shm.close()
+
+
+def registers(shm, offset: int, count: int, size: int) -> list[int]:
+    data = shm.read(offset * size, count * size)
+    return [int.from_bytes(data[i:i + size], sys.byteorder) for i in range(0, len(data), size)]
+
+
+def test_counter(shm):
+    fill = create_fill(shm, 2, 5, 2, None, "counter")
+    assert isinstance(fill, PatternFill)
+    assert fill.fill() == 10
+    assert registers(shm, 2, 5, 2) == [0, 1, 2, 3, 4]
+    fill.fill()
+    assert registers(shm, 2, 5, 2) == [1, 2, 3, 4, 5]
+    # the registers outside of the range are not written
+    assert shm.read(0, 4) == bytes(4)
+    assert shm.read(14) == bytes(SHM_SIZE - 14)
+
+
+def test_walking_ones_wraps_around(shm):
+    create_fill(shm, 0, 10, 1, None, "walking ones").fill()
+    assert registers(shm, 0, 10, 1) == [1, 2, 4, 8, 16, 32, 64, 128, 1, 2]
+
+
+def test_gray_code(shm):
+    fill = create_fill(shm, 0, 4, 2, None, "gray code")
+    fill.fill()
+    assert registers(shm, 0, 4, 2) == [0, 1, 3, 2]
+    fill.fill()
+    assert registers(shm, 0, 4, 2) == [1, 3, 2, 6]
+
+
+def test_sine_repeats_after_period(shm):
+    fill = create_fill(shm, 0, 6, 1, None, "sine", 4)
+    fill.fill()
+    first = registers(shm, 0, 6, 1)
+    assert first == [128, 255, 128, 0, 128, 255]
+    fill.fill()
+    assert registers(shm, 0, 6, 1) == [255, 128, 0, 128, 255, 128]
+    for _ in range(3):
+        fill.fill()
+    assert registers(shm, 0, 6, 1) == first
+
+
+def test_constant_with_bitmask(shm):
+    create_fill(shm, 0, 3, 2, 0x0ff0, "constant", 0x1234).fill()
+    assert registers(shm, 0, 3, 2) == [0x0230] * 3
+    create_fill(shm, 8, 3, 1, 0x0f, "constant", 0xab).fill()
+    assert registers(shm, 8, 3, 1) == [0x0b] * 3
+
+
+def test_seeded_random_is_reproducible(shm):
+    fill = create_fill(shm, 0, 16, 2, 0x7fff, "seeded random", 4711)
+    assert isinstance(fill, RandomFill)
+    fill.fill()
+    fill.fill()
+    second = shm.read(0, 32)
+
+    again = create_fill(shm, 0, 16, 2, 0x7fff, "seeded random", 4711)
+    again.fill()
+    assert shm.read(0, 32) != second
+    again.fill()
+    assert shm.read(0, 32) == second
+    assert all(value <= 0x7fff for value in registers(shm, 0, 16, 2))
+
+
+def test_random_with_bitmask(shm):
+    create_fill(shm, 0, SHM_SIZE, 1, 0x81, "random").fill()
+    assert set(shm.read()) <= {0x00, 0x01, 0x80, 0x81}
+
+
+def test_all_modes_can_be_created(shm):
+    for mode, param in FILL_MODES.items():
+        create_fill(shm, 0, 4, 2, None, mode, 8 if param else 0).fill()
+
+
+@pytest.mark.parametrize("mode, param", [("sine", 0), ("square", 0)])
+def test_invalid_fill(shm, mode, param):
+    with pytest.raises(RuntimeError):
+        create_fill(shm, 0, 4, 2, None, mode, param)
@@ -0,0 +1,98 @@
+import json
+import threading
+import time
+
+import pytest
+
+from src import SHMMap
+from src.SHMDiff import apply_delta
+from src.SHMRecorder import DELTA, FOOTER, FOOTER_MAGIC, INDEX, INDEX_ENTRY, KEYFRAME, MAGIC, RECORD, SHMRecorder
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "shm"
+    directory.mkdir()
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(directory))
+    (directory / "tst_AO").write_bytes(bytes(64))
+    return directory
+
+
+def record(shm_dir, filename: str, changes: list[tuple[float, int, bytes]], duration: float) -> None:
+    """
+    @brief record tst_AO in the calling thread while the changes (delay, offset, data) are written by timers
+    """
+    def write(offset: int, data: bytes) -> None:
+        with open(shm_dir / "tst_AO", "r+b") as f:
+            f.seek(offset)
+            f.write(data)
+
+    recorder = SHMRecorder("tst_AO", filename, 200, keyframe_seconds=0.02)
+    errors = []
+    recorder.failed.connect(errors.append)
+    timers = [threading.Timer(delay, write, (offset, data)) for delay, offset, data in changes]
+    timers.append(threading.Timer(duration, recorder.stop))
+    for timer in timers:
+        timer.start()
+    recorder.run()
+    for timer in timers:
+        timer.join()
+    assert errors == []
+
+
+def read_records(filename: str):
+    with open(filename, "rb") as f:
+        assert f.read(len(MAGIC)) == MAGIC
+        header = json.loads(f.readline())
+        data = f.read()
+    records = []
+    pos = 0
+    while pos < len(data) - FOOTER.size:
+        kind, t, size = RECORD.unpack_from(data, pos)
+        records.append((kind, t, pos, data[pos + RECORD.size:pos + RECORD.size + size]))
+        pos += RECORD.size + size
+    return header, records, FOOTER.unpack(data[pos:]), len(MAGIC) + len(json.dumps(header)) + 1
+
+
+def test_record_layout(shm_dir, tmp_path):
+    filename = str(tmp_path / "rec")
+    start = time.time()
+    record(shm_dir, filename, [(0.03, 5, b"\x01\x02"), (0.06, 40, b"\xff")], 0.1)
+    header, records, (index_offset, magic), data_offset = read_records(filename)
+
+    assert header["shm_name"] == "tst_AO"
+    assert header["size"] == 64
+    assert start <= header["start"] <= time.time()
+
+    # times are seconds since the start of the recording
+    times = [t for _, t, _, _ in records]
+    assert times == sorted(times)
+    assert 0 <= times[0] < times[-1] < 1.0
+
+    kinds = [kind for kind, _, _, _ in records]
+    assert kinds[0] == KEYFRAME and kinds[-1] == INDEX
+    assert DELTA in kinds
+
+    # the deltas reproduce the frames, the last frame has both changes
+    frame = None
+    for kind, _, _, payload in records[:-1]:
+        if kind == KEYFRAME:
+            assert frame is None or frame == payload
+            frame = bytearray(payload)
+        else:
+            apply_delta(frame, payload)
+    assert frame == bytes(5) + b"\x01\x02" + bytes(33) + b"\xff" + bytes(23)
+
+    # the index lists all keyframes
+    assert magic == FOOTER_MAGIC
+    assert index_offset == data_offset + records[-1][2]
+    keyframes = [(t, data_offset + pos) for kind, t, pos, _ in records if kind == KEYFRAME]
+    assert list(INDEX_ENTRY.iter_unpack(records[-1][3])) == keyframes
+    assert len(keyframes) >= 2
+
+
+def test_unchanged_memory_is_one_keyframe(shm_dir, tmp_path):
+    filename = str(tmp_path / "rec")
+    record(shm_dir, filename, [], 0.05)
+    _, records, _, _ = read_records(filename)
+    assert [kind for kind, _, _, _ in records] == [KEYFRAME, INDEX]
@@ -0,0 +1,179 @@
+import json
+import threading
+
+import pytest
+
+from src import SHMMap, SHMReplay
+from src.SHMDiff import encode_delta
+from src.SHMRecorder import DELTA, FOOTER, FOOTER_MAGIC, INDEX, INDEX_ENTRY, KEYFRAME, MAGIC, RECORD, SHMRecorder
+from src.SHMReplay import SHMRecording, SHMReplayer
+
+SIZE = 32
+
+# frame i: byte i is set to i + 1 (in addition to the bytes of the previous frames), one frame every 10 ms
+FRAMES = [(i * 0.01, bytes(range(1, i + 2)) + bytes(SIZE - i - 1)) for i in range(10)]
+
+
+def write_recording(filename: str, frames: list[tuple[float, bytes]], keyframe_every: int = 4,
+                    closed: bool = True) -> list[int]:
+    """
+    @brief write a recording like SHMRecorder does
+    @return file offsets of the records
+    """
+    offsets = []
+    index = []
+    with open(filename, "wb") as f:
+        f.write(MAGIC)
+        f.write(json.dumps({"shm_name": "tst_AO", "size": SIZE, "rate": 100, "start": 1e9}).encode("utf-8") + b"\n")
+        prev = None
+        for i, (t, frame) in enumerate(frames):
+            offsets.append(f.tell())
+            if i % keyframe_every == 0:
+                index.append(INDEX_ENTRY.pack(t, f.tell()))
+                f.write(RECORD.pack(KEYFRAME, t, len(frame)) + frame)
+            else:
+                delta = encode_delta(prev, frame)
+                f.write(RECORD.pack(DELTA, t, len(delta)) + delta)
+            prev = frame
+        if closed:
+            index_offset = f.tell()
+            payload = b"".join(index)
+            f.write(RECORD.pack(INDEX, frames[-1][0] + 0.005, len(payload)) + payload)
+            f.write(FOOTER.pack(index_offset, FOOTER_MAGIC))
+    return offsets
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "shm"
+    directory.mkdir()
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(directory))
+    (directory / "tst_AO").write_bytes(b"\xee" * SIZE)
+    return directory
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """
+    @brief frames of the shared memory after each write of the replayer
+    """
+    frames = []
+    write_consistent = SHMReplay.write_consistent
+
+    def record_write(ranges, stats=None):
+        write_consistent(ranges, stats)
+        frames.append(ranges[0][0].read())
+
+    monkeypatch.setattr(SHMReplay, "write_consistent", record_write)
+    return frames
+
+
+def replay(filename: str, **kwargs) -> tuple[SHMReplayer, list]:
+    replayer = SHMReplayer(filename, "tst_AO", **kwargs)
+    errors = []
+    replayer.failed.connect(errors.append)
+    replayer.run()
+    return replayer, errors
+
+
+def test_recording_index(tmp_path):
+    filename = str(tmp_path / "rec")
+    offsets = write_recording(filename, FRAMES)
+    recording = SHMRecording(filename)
+    try:
+        assert recording.keyframes == [(0.0, offsets[0]), (0.04, offsets[4]), (0.08, offsets[8])]
+        assert recording.duration() == pytest.approx(0.095)
+        assert recording.keyframe_before(0.0) == offsets[0]
+        assert recording.keyframe_before(0.05) == offsets[4]
+        assert recording.keyframe_before(1.0) == offsets[8]
+        assert [t for _, t, _ in recording.records(offsets[4])] == [t for t, _ in FRAMES[4:]]
+    finally:
+        recording.close()
+
+
+def test_truncated_recording_without_index(tmp_path):
+    filename = str(tmp_path / "rec")
+    offsets = write_recording(filename, FRAMES, closed=False)
+    # the recorder was killed while the last record was written
+    with open(filename, "r+b") as f:
+        f.truncate(offsets[-1] + RECORD.size + 1)
+
+    recording = SHMRecording(filename)
+    try:
+        assert recording.keyframes == [(0.0, offsets[0]), (0.04, offsets[4]), (0.08, offsets[8])]
+        assert [t for _, t, _ in recording.records(offsets[8])] == [0.08]
+    finally:
+        recording.close()
+
+
+def test_invalid_recording(tmp_path):
+    (tmp_path / "rec").write_bytes(b"SHMDREC0\n{}\n")
+    with pytest.raises(RuntimeError):
+        SHMRecording(str(tmp_path / "rec"))
+    (tmp_path / "rec").write_bytes(MAGIC + b'{"size": 32}\n')
+    with pytest.raises(RuntimeError):
+        SHMRecording(str(tmp_path / "rec"))
+
+
+def test_round_trip(shm_dir, tmp_path, writes):
+    filename = str(tmp_path / "rec")
+    write_recording(filename, FRAMES)
+    replayer, errors = replay(filename, speed=10.0)
+    assert errors == []
+    # every frame is written once, in order
+    assert writes == [frame for _, frame in FRAMES]
+    assert (shm_dir / "tst_AO").read_bytes() == FRAMES[-1][1]
+    records, _, _ = replayer.take_stats()
+    assert records == len(FRAMES) - 1
+
+
+def test_recorder_round_trip(shm_dir, tmp_path, writes):
+    filename = str(tmp_path / "rec")
+    (shm_dir / "tst_AI").write_bytes(bytes(SIZE))
+    frames = [bytes(SIZE)]
+
+    def change(i: int) -> None:
+        with open(shm_dir / "tst_AI", "r+b") as f:
+            f.seek(i)
+            f.write(b"\xa5")
+        frames.append(frames[-1][:i] + b"\xa5" + frames[-1][i + 1:])
+
+    recorder = SHMRecorder("tst_AI", filename, 200, keyframe_seconds=0.02)
+    # the changes are far apart compared to the recording period, so every change is recorded
+    timers = [threading.Timer(0.03 * (i + 1), change, (i,)) for i in range(3)]
+    timers.append(threading.Timer(0.12, recorder.stop))
+    for timer in timers:
+        timer.start()
+    recorder.run()
+
+    _, errors = replay(filename, speed=10.0)
+    assert errors == []
+    assert writes == frames
+    assert (shm_dir / "tst_AO").read_bytes() == frames[-1]
+
+
+def test_seek_starts_at_the_keyframe_before(shm_dir, tmp_path, writes):
+    filename = str(tmp_path / "rec")
+    write_recording(filename, FRAMES)
+    _, errors = replay(filename, speed=10.0, seek=0.065)
+    assert errors == []
+    # the state at the seek position is written first, then the following frames
+    assert writes == [frame for _, frame in FRAMES[6:]]
+
+
+def test_truncated_recording_is_replayed(shm_dir, tmp_path, writes):
+    filename = str(tmp_path / "rec")
+    offsets = write_recording(filename, FRAMES, closed=False)
+    with open(filename, "r+b") as f:
+        f.truncate(offsets[-1] + RECORD.size + 1)
+    _, errors = replay(filename, speed=10.0)
+    assert errors == []
+    assert writes == [frame for _, frame in FRAMES[:-1]]
+
+
+def test_size_mismatch(shm_dir, tmp_path):
+    filename = str(tmp_path / "rec")
+    write_recording(filename, FRAMES)
+    (shm_dir / "tst_AO").write_bytes(bytes(SIZE + 2))
+    _, errors = replay(filename)
+    assert len(errors) == 1
@@ -0,0 +1,121 @@
+import time
+
+import pytest
+
+from src.SHMSequence import SHMSequencePlayer, read_batches, read_events
+from src.SHMWriter import ValueEncoder
+
+# tolerance of the measured time between two batches (the write of the first batch is timed late)
+SLACK = 0.001
+
+ENCODERS = {"a": ValueEncoder("AO", 1, ":u16b"), "b": ValueEncoder("DO", 3, "")}
+
+
+class RecordingWriter:
+    """
+    @brief stand-in for SHMWriter that records the time of each batch and stops the player after a number of batches
+    """
+
+    def __init__(self, max_batches: int) -> None:
+        self.max_batches = max_batches
+        self.player: SHMSequencePlayer | None = None
+        self.batches = []
+
+    def write(self, batch, stats=None) -> None:
+        self.batches.append((time.perf_counter(), batch))
+        if len(self.batches) >= self.max_batches:
+            self.player.stop()
+
+
+def write_file(tmp_path, name: str, content: str) -> str:
+    path = tmp_path / name
+    path.write_text(content)
+    return str(path)
+
+
+def play(file_name: str, max_batches: int = 100, loop: bool = False, speed: float = 1.0):
+    writer = RecordingWriter(max_batches)
+    player = SHMSequencePlayer(writer, file_name, ENCODERS, speed, loop)
+    writer.player = player
+    errors = []
+    player.failed.connect(errors.append)
+    player.run()
+    return writer.batches, player.take_stats(), errors
+
+
+def test_read_events_csv(tmp_path):
+    file_name = write_file(tmp_path, "seq.csv", "time,name,value\n0,a,1\n\n0.5, b , 1\n1.5,#end\n")
+    assert list(read_events(file_name)) == [(0.0, "a", "1"), (0.5, "b", "1"), (1.5, "#end", "")]
+
+
+def test_read_events_json(tmp_path):
+    file_name = write_file(tmp_path, "seq.jsonl", '{"time": 0, "name": "a", "value": 7}\n\n'
+                                                  '{"time": 2, "name": "#end"}\n')
+    assert list(read_events(file_name)) == [(0.0, "a", "7"), (2.0, "#end", "")]
+
+
+@pytest.mark.parametrize("name, content", [
+    ("seq.csv", "0,a\n"),
+    ("seq.csv", "x,a,1\n"),
+    ("seq.csv", "-1,a,1\n"),
+    ("seq.json", '{"time": 0, "name": "a"}\n'),
+    ("seq.json", '{"time": -0.5, "name": "a", "value": 1}\n'),
+    ("seq.json", "{\n"),
+])
+def test_read_events_invalid(tmp_path, name, content):
+    with pytest.raises(RuntimeError):
+        list(read_events(write_file(tmp_path, name, content)))
+
+
+def test_read_batches(tmp_path):
+    file_name = write_file(tmp_path, "seq.csv", "0,a,0x102\n0,b,1\n1,a,3\n1,#end\n")
+    assert list(read_batches(file_name, ENCODERS)) == [
+        (0.0, [("AO", 2, b"\x01\x02"), ("DO", 3, b"\x01")]),
+        (1.0, [("AO", 2, b"\x00\x03")]),
+        (1.0, []),
+    ]
+
+
+@pytest.mark.parametrize("content", ["1,a,1\n0,a,2\n", "0,c,1\n", "0,a,1\n1,#end\n2,a,1\n"])
+def test_read_batches_invalid(tmp_path, content):
+    with pytest.raises(RuntimeError):
+        list(read_batches(write_file(tmp_path, "seq.csv", content), ENCODERS))
+
+
+def test_play_once(tmp_path):
+    file_name = write_file(tmp_path, "seq.csv", "0,a,1\n0.02,a,2\n0.02,b,1\n")
+    batches, (count, passes, _), errors = play(file_name)
+    assert errors == []
+    assert [batch for _, batch in batches] == [[("AO", 2, b"\x00\x01")], [("AO", 2, b"\x00\x02"), ("DO", 3, b"\x01")]]
+    assert batches[1][0] - batches[0][0] >= 0.02 - SLACK
+    assert (count, passes) == (2, 1)
+
+
+def test_play_loop_uses_end_marker(tmp_path):
+    file_name = write_file(tmp_path, "seq.csv", "0,a,1\n0.01,a,2\n0.03,#end\n")
+    batches, _, errors = play(file_name, max_batches=5, loop=True)
+    assert errors == []
+    assert [batch[0][2] for _, batch in batches] == [b"\x00\x01", b"\x00\x02"] * 2 + [b"\x00\x01"]
+    times = [t - batches[0][0] for t, _ in batches]
+    # the second pass starts at the end marker, not at the last event of the first pass
+    assert times[2] >= 0.03 - SLACK
+    assert times[4] >= 0.06 - SLACK
+
+
+def test_play_speed(tmp_path):
+    file_name = write_file(tmp_path, "seq.csv", "0,a,1\n0.1,a,2\n")
+    batches, _, _ = play(file_name, speed=4.0)
+    assert 0.025 - SLACK <= batches[1][0] - batches[0][0] < 0.1
+
+
+@pytest.mark.parametrize("content", ["0,a,1\n0.01,a,2\n", "0,a,1\n0,#end\n"])
+def test_loop_requires_end_marker_with_duration(tmp_path, content):
+    batches, (_, passes, _), errors = play(write_file(tmp_path, "seq.csv", content), loop=True)
+    assert passes == 1
+    assert len(batches) == content.count(",a,")
+    assert len(errors) == 1
+
+
+def test_invalid_speed(tmp_path):
+    with pytest.raises(RuntimeError):
+        SHMSequencePlayer(RecordingWriter(1), write_file(tmp_path, "seq.csv", ""), ENCODERS, 0.0)
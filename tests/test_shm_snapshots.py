@@ -0,0 +1,75 @@
+import os
+
+import pytest
+
+from src import SHMMap
+from src.SHMSnapshots import CHUNK_SIZE, SnapshotStore
+
+SIZE = 3 * CHUNK_SIZE + 100
+
+
+@pytest.fixture
+def shm_dir(tmp_path, monkeypatch):
+    directory = tmp_path / "shm"
+    directory.mkdir()
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(directory))
+    (directory / "tst_AO").write_bytes(bytes(i % 251 for i in range(SIZE)))
+    return directory
+
+
+def write_shm(shm_dir, offset: int, data: bytes) -> None:
+    with open(shm_dir / "tst_AO", "r+b") as f:
+        f.seek(offset)
+        f.write(data)
+
+
+def test_save_load_only_writes_changed_chunks(shm_dir, tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    assert store.save("a", "tst_AO", "AO") == (4, 4)
+    original = (shm_dir / "tst_AO").read_bytes()
+    assert store.read("a") == original
+
+    write_shm(shm_dir, CHUNK_SIZE + 10, b"\xff\xff")
+    write_shm(shm_dir, SIZE - 1, b"\xff")
+    assert store.load("a", "tst_AO") == (2, 4)
+    assert (shm_dir / "tst_AO").read_bytes() == original
+    assert store.load("a", "tst_AO") == (0, 4)
+
+
+def test_chunks_are_shared(shm_dir, tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    store.save("a", "tst_AO", "AO")
+    write_shm(shm_dir, 0, b"\x00" * 8)
+    assert store.save("b", "tst_AO", "AO") == (4, 1)
+    assert store.names() == ["a", "b"]
+    assert store.names("DO") == []
+
+    # the index is persistent
+    store = SnapshotStore(str(tmp_path / "store"))
+    assert store.names("AO") == ["a", "b"]
+
+    # only the chunk that is not used by b is removed
+    assert store.delete("a") == 1
+    assert store.names() == ["b"]
+    assert store.read("b") == (shm_dir / "tst_AO").read_bytes()
+    assert store.delete("b") == 4
+
+
+def test_errors(shm_dir, tmp_path):
+    store = SnapshotStore(str(tmp_path / "store"))
+    with pytest.raises(RuntimeError):
+        store.read("missing")
+    with pytest.raises(RuntimeError):
+        store.delete("missing")
+
+    store.save("a", "tst_AO", "AO")
+    (shm_dir / "tst_small").write_bytes(bytes(10))
+    with pytest.raises(RuntimeError):
+        store.load("a", "tst_small")
+
+    # corrupted chunk
+    digest = store.snapshots["a"]["chunks"][0]
+    with open(os.path.join(store.directory, "chunks", digest[:2], digest), "wb") as f:
+        f.write(b"broken")
+    with pytest.raises(RuntimeError):
+        store.read("a")
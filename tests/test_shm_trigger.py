@@ -0,0 +1,43 @@
+import pytest
+
+from src.SHMTrigger import TriggerEngine, TriggerRule
+
+
+def fired(engine: TriggerEngine, samples: list[list]) -> list[list[int]]:
+    return [engine.evaluate(float(t), {"AO": values}) for t, values in enumerate(samples)]
+
+
+def test_threshold_rules():
+    engine = TriggerEngine([TriggerRule("above", "AO", 0, 10, "a"), TriggerRule("below", "AO", 1, 0, "b")], 0, 0)
+    assert fired(engine, [[5, 1], [11, 1], [11, -1]]) == [[], [0], [0, 1]]
+
+
+def test_edge_rules():
+    engine = TriggerEngine([TriggerRule("rising", "AO", 0, 0, "a"), TriggerRule("falling", "AO", 0, 0, "a")], 0, 0)
+    assert fired(engine, [[False], [True], [True], [False]]) == [[], [0], [], [1]]
+
+
+def test_change_rule():
+    engine = TriggerEngine([TriggerRule("change", "AO", 0, 50, "a")], 0, 0)
+    assert fired(engine, [[100], [140], [220], [0]]) == [[], [], [0], [0]]
+
+
+def test_stuck_rule():
+    engine = TriggerEngine([TriggerRule("stuck", "AO", 0, 2, "a")], 0, 0)
+    assert fired(engine, [[1], [1], [1], [2], [2], [2]]) == [[], [], [0], [], [], [0]]
+
+
+def test_capture():
+    engine = TriggerEngine([TriggerRule("above", "AO", 0, 5, "a")], pre=2, post=2)
+    engine.arm()
+    completed = [engine.process(float(t), {"AO": [v]}) for t, v in enumerate([1, 2, 3, 9, 4, 5])]
+    assert completed == [False, False, False, False, True, False]
+    assert engine.fired.label == "a"
+    assert engine.fire_time == 3.0
+    assert [t for t, _ in engine.capture] == [1.0, 2.0, 3.0, 4.0]
+    assert not engine.armed
+
+
+def test_unknown_kind():
+    with pytest.raises(RuntimeError):
+        TriggerRule("between", "AO", 0, 0, "a")
@@ -0,0 +1,85 @@
+import threading
+import time
+
+import pytest
+
+from src import SHMMap, SHMVerify
+from src.SHMVerify import SHMWriteMonitor, VerifyStats
+
+
+@pytest.fixture
+def shm(tmp_path, monkeypatch):
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(tmp_path))
+    (tmp_path / "tst_AO").write_bytes(bytes(8))
+    shm = SHMMap.SHMMap("tst_AO")
+    yield shm
+    shm.close()
+
+
+def run_until(monitor: SHMWriteMonitor, signal) -> list:
+    """
+    @brief run the monitor in the calling thread until the signal was emitted (or at most 2 s)
+    """
+    emitted = []
+
+    def on_signal(*args):
+        emitted.append(args)
+        monitor.stop()
+
+    signal.connect(on_signal)
+    timeout = threading.Timer(2.0, monitor.stop)
+    timeout.start()
+    monitor.run()
+    timeout.cancel()
+    return emitted
+
+
+def test_stats_description():
+    stats = VerifyStats()
+    assert stats.description() == "not verified"
+
+    stats.add_verify(20e-6, True)
+    stats.add_verify(40e-6, False)
+    assert stats.description() == "2 applies, 1 mismatches, verify latency mean 30.0 us / max 40.0 us"
+
+    stats.add_overwrite(0.001)
+    stats.add_overwrite(0.003)
+    stats.add_expiry()
+    assert stats.description().endswith(", 2 overwrites after min 1.000 ms / mean 2.000 ms / max 3.000 ms, "
+                                        "1 not overwritten within 10 s")
+
+
+def test_overwrite_is_reported(shm):
+    monitor = SHMWriteMonitor()
+    monitor.watch(3, shm, 2, b"\x01\x02", time.perf_counter())
+    emitted = run_until(monitor, monitor.overwritten)
+    assert len(emitted) == 1
+    index, seconds, data = emitted[0]
+    assert (index, data) == (3, b"\x00\x00")
+    assert 0 <= seconds < 1.0
+
+
+def test_expired_watch_is_reported(shm, monkeypatch):
+    monkeypatch.setattr(SHMVerify, "WATCH_TIMEOUT", 0.05)
+    monitor = SHMWriteMonitor()
+    overwritten = []
+    monitor.overwritten.connect(lambda *args: overwritten.append(args))
+    monitor.watch(1, shm, 0, b"\x00\x00", time.perf_counter())
+    start = time.perf_counter()
+    assert run_until(monitor, monitor.expired) == [(1,)]
+    # expiries are checked against the deadline of the next poll
+    assert time.perf_counter() - start >= 0.05 - 1.0 / SHMVerify.POLL_RATE
+    assert overwritten == []
+
+
+def test_unwatched_value_is_not_reported(shm, monkeypatch):
+    monkeypatch.setattr(SHMVerify, "WATCH_TIMEOUT", 0.05)
+    monitor = SHMWriteMonitor()
+    overwritten = []
+    monitor.overwritten.connect(lambda *args: overwritten.append(args))
+    monitor.watch(1, shm, 0, b"\x01", time.perf_counter())
+    monitor.watch(2, shm, 0, b"\x00", time.perf_counter())
+    monitor.unwatch(1)
+    # only the expiry of the remaining watch is reported
+    assert run_until(monitor, monitor.expired) == [(2,)]
+    assert overwritten == []
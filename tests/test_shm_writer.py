@@ -0,0 +1,79 @@
+import struct
+
+import pytest
+
+from src import SHMMap
+from src.SHMMap import LockStats
+from src.SHMWriter import SHMWriter, encode_value, swap16
+
+
+@pytest.fixture
+def writer(tmp_path, monkeypatch):
+    monkeypatch.setattr(SHMMap, "SHM_DIR", str(tmp_path))
+    (tmp_path / "tst_AO").write_bytes(bytes(16))
+    (tmp_path / "tst_DO").write_bytes(bytes(8))
+    writer = SHMWriter("tst_")
+    yield writer
+    writer.close()
+
+
+@pytest.mark.parametrize("register, addr, suffix, value, offset, data", [
+    ("DO", 5, "", "1", 5, b"\x01"),
+    ("AO", 3, ":u16b", "0x1234", 6, b"\x12\x34"),
+    ("AO", 3, ":u16l", "4660", 6, b"\x34\x12"),
+    ("AO", 3, ":i8_lo", "-1", 6, b"\xff"),
+    ("AO", 3, ":u8_hi", "7", 7, b"\x07"),
+    ("AI", 0, ":i32b", "-2", 0, b"\xff\xff\xff\xfe"),
+    ("AI", 0, ":u32br", "0x01020304", 0, b"\x03\x04\x01\x02"),
+    ("AI", 0, ":u32lr", "0x01020304", 0, b"\x02\x01\x04\x03"),
+    ("AO", 1, ":f32b", "1.5", 2, struct.pack(">f", 1.5)),
+    ("AO", 1, ":f64lr", "-2.25", 2, b"".join(reversed([struct.pack("<d", -2.25)[i:i + 2] for i in (0, 2, 4, 6)]))),
+])
+def test_encode_value(register, addr, suffix, value, offset, data):
+    assert encode_value(register, addr, suffix, value) == (offset, data)
+
+
+@pytest.mark.parametrize("register, suffix, value", [
+    ("XO", ":u16b", "1"),
+    ("AO", ":u16", "1"),
+    ("AO", ":u12b", "1"),
+    ("AO", ":f16b", "1.0"),
+    ("AO", ":u16b", "abc"),
+    ("AO", ":u16b", "65536"),
+    ("AO", ":i8_lo", "128"),
+])
+def test_invalid(register, suffix, value):
+    with pytest.raises(RuntimeError):
+        encode_value(register, 0, suffix, value)
+
+
+def test_swap16():
+    assert swap16(b"\x01\x02\x03\x04\x05\x06") == b"\x05\x06\x03\x04\x01\x02"
+    assert swap16(b"") == b""
+
+
+def test_write_and_read_back(writer, tmp_path):
+    items = [("AO", *encode_value("AO", 2, ":u32br", "0x01020304")), ("DO", *encode_value("DO", 7, "", "1"))]
+    stats = LockStats()
+    writer.write(items, stats)
+
+    assert stats.count == 1
+    assert (tmp_path / "tst_AO").read_bytes() == bytes(4) + b"\x03\x04\x01\x02" + bytes(8)
+    assert (tmp_path / "tst_DO").read_bytes() == bytes(7) + b"\x01"
+    assert writer.read_back(items) == [b"\x03\x04\x01\x02", b"\x01"]
+
+    # the read back returns the current content, not the written data
+    (tmp_path / "tst_DO").write_bytes(bytes(8))
+    assert writer.read_back(items) == [b"\x03\x04\x01\x02", b"\x00"]
+
+
+def test_write_out_of_range(writer, tmp_path):
+    with pytest.raises(RuntimeError):
+        writer.write([("AO", 4, b"\x00"), ("AO", 15, b"\x01\x02")])
+    # nothing of the batch is written
+    assert (tmp_path / "tst_AO").read_bytes() == bytes(16)
+
+
+def test_missing_shared_memory(writer):
+    with pytest.raises(RuntimeError):
+        writer.write([("AI", 0, b"\x00")])
@@ -0,0 +1,43 @@
+import pytest
+
+from src.SHMWriter import ValueEncoder
+
+
+def test_clamp():
+    assert ValueEncoder("AO", 0, ":u16b").clamp(-3.7) == 0
+    assert ValueEncoder("AO", 0, ":i16b").clamp(1e9) == 32767
+    assert ValueEncoder("AO", 0, ":i16b").clamp(-2.6) == -3
+    assert ValueEncoder("DO", 0, "").clamp(0.7) == 1
+    assert ValueEncoder("DO", 0, "").clamp(0.3) == 0
+    assert ValueEncoder("AO", 0, ":f32b").clamp(1e39) == 3.4028234663852886e38
+
+
+@pytest.mark.parametrize("suffix, minimum, maximum", [
+    (":u8_lo", 0, 255),
+    (":i8_hi", -128, 127),
+    (":u16l", 0, 65535),
+    (":i32br", -2 ** 31, 2 ** 31 - 1),
+    (":u64b", 0, 2 ** 64 - 1),
+])
+def test_integer_range(suffix, minimum, maximum):
+    encoder = ValueEncoder("AO", 0, suffix)
+    assert (encoder.min, encoder.max) == (minimum, maximum)
+    # the limits can be encoded, one beyond cannot
+    encoder.encode(encoder.clamp(minimum - 1))
+    encoder.encode(encoder.clamp(maximum + 1))
+    with pytest.raises(RuntimeError):
+        encoder.encode(maximum + 1)
+
+
+def test_encoder_is_reusable():
+    encoder = ValueEncoder("AO", 4, ":u16br")
+    assert encoder.offset == 8
+    assert [encoder.encode(encoder.clamp(x)) for x in (0.4, 258.2, 70000)] == [b"\x00\x00", b"\x01\x02", b"\xff\xff"]
+
+
+def test_parse():
+    assert ValueEncoder("AO", 0, ":i16b").parse("-0x10") == -16
+    assert ValueEncoder("AO", 0, ":i16b").parse("2.9") == 2
+    assert ValueEncoder("AO", 0, ":f32b").parse("1e3") == 1000.0
+    with pytest.raises(RuntimeError):
+        ValueEncoder("AO", 0, ":f32b").parse("x")